@@ -0,0 +1,90 @@
+"""
+Measures loading a config class from many small files, read one by one from the filesystem or from a single bundle.
+Counts the filesystem calls of a cold load (empty caches), which dominate on network filesystems, and the time of
+cold and warm loads.
+
+Run with: python -m benchmarks.bench_bundle
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from pydantic import create_model
+
+from confident import BaseConfig
+from confident.bundle import _bundles_cache, create_bundle
+from confident.file_cache import _files_cache
+from confident.file_refs import _resolved_cache
+
+NUMBER = 1_000
+FILES = 30
+
+BenchConfig = create_model(  # type: ignore[call-overload]
+    "BenchConfig",
+    __base__=BaseConfig,
+    **{f"key_{index}": (int, 0) for index in range(FILES)},
+)
+
+
+def clear_caches() -> None:
+    _bundles_cache.clear()
+    _files_cache.clear()
+    _resolved_cache.clear()
+
+
+def count_calls(values: dict) -> int:
+    calls = 0
+    stat, open_file = os.stat, open
+
+    def counted(function):
+        def wrapper(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    clear_caches()
+    with (
+        mock.patch("os.stat", counted(stat)),
+        mock.patch("builtins.open", counted(open_file)),
+    ):
+        BenchConfig(**values)
+    return calls
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = []
+        for index in range(FILES):
+            path = Path(temp_dir) / "config" / f"part_{index}.json"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(json.dumps({f"key_{index}": index}))
+            paths.append(path)
+        bundle_path = Path(temp_dir) / "bundle.zip"
+        create_bundle(paths=paths, output=bundle_path)
+
+        for name, values in (
+            ("files", {"_files": paths}),
+            ("bundle", {"_files": paths, "_bundle": bundle_path}),
+        ):
+            calls = count_calls(values)
+            clear_caches()
+            start = time.perf_counter()
+            BenchConfig(**values)
+            cold_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                BenchConfig(**values)
+            print(
+                f"{name}: {calls} stat/open calls and {cold_seconds * 1000:.1f} ms cold, "
+                f"{NUMBER / (time.perf_counter() - start):,.0f} objects/s warm"
+            )
+
+
+if __name__ == "__main__":
+    main()
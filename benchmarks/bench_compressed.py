@@ -0,0 +1,128 @@
+"""
+Measures loading a large config map, uncompressed and compressed, from storage with a limited bandwidth (as network
+storage), simulated by sleeping for the transfer time of the bytes that are read from the opened files.
+Every load is cold: the parsed files cache is cleared before it.
+
+Run with: python -m benchmarks.bench_compressed
+"""
+
+import builtins
+import bz2
+import gzip
+import io
+import json
+import lzma
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import yaml  # type: ignore[import-untyped]
+
+from confident.file_cache import _files_cache, load_cached_file
+
+ENTRIES = 5_000
+REPEAT = 3
+BANDWIDTHS_MB_PER_SECOND = (None, 100, 10)
+COMPRESSIONS = {
+    "": None,
+    ".gz": gzip.compress,
+    ".xz": lzma.compress,
+    ".bz2": bz2.compress,
+}
+
+
+def write_files(directory: Path) -> list[Path]:
+    config_map = {
+        f"deployment_{index}": {
+            "host": f"host-{index}.internal",
+            "port": 8000 + index % 100,
+            "replicas": index % 7,
+            "labels": {"team": f"team_{index % 20}", "tier": "backend"},
+        }
+        for index in range(ENTRIES)
+    }
+    contents = {
+        ".json": json.dumps(config_map).encode(),
+        ".yaml": yaml.safe_dump(config_map).encode(),
+    }
+    paths = []
+    for format_suffix, content in contents.items():
+        for compression_suffix, compress in COMPRESSIONS.items():
+            path = directory / f"config_map{format_suffix}{compression_suffix}"
+            path.write_bytes(compress(content) if compress else content)
+            paths.append(path)
+    return paths
+
+
+class SlowFile:
+    """
+    A file that sleeps for the transfer time of the bytes that are read from it.
+    """
+
+    def __init__(self, file: Any, bandwidth: int) -> None:
+        self._file = file
+        self._bandwidth = bandwidth
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        time.sleep(len(data) / (self._bandwidth * 1_000_000))
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        size = self._file.readinto(buffer)
+        time.sleep(size / (self._bandwidth * 1_000_000))
+        return size
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+    def __enter__(self) -> "SlowFile":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._file.close()
+
+
+def slow_storage(bandwidth: int | None) -> ExitStack:
+    stack = ExitStack()
+    if bandwidth is None:
+        return stack
+    open_file = io.open
+
+    def slow_open(file: Any, mode: str = "r", *args: Any, **kwargs: Any) -> Any:
+        opened = open_file(file, mode, *args, **kwargs)
+        return SlowFile(opened, bandwidth) if mode == "rb" else opened
+
+    # Path.read_bytes opens files with io.open, gzip and lzma with builtins.open, and bz2 with its own alias.
+    for target, name in ((io, "open"), (builtins, "open"), (bz2, "_builtin_open")):
+        stack.enter_context(mock.patch.object(target, name, slow_open))
+    return stack
+
+
+def load_seconds(path: Path, bandwidth: int | None) -> float:
+    total = 0.0
+    for _ in range(REPEAT):
+        _files_cache.clear()
+        with slow_storage(bandwidth):
+            start = time.perf_counter()
+            load_cached_file(path)
+            total += time.perf_counter() - start
+    return total / REPEAT
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for path in write_files(Path(temp_dir)):
+            timings = ", ".join(
+                f"{load_seconds(path, bandwidth) * 1000:,.0f} ms"
+                f" ({f'{bandwidth} MB/s' if bandwidth else 'local'})"
+                for bandwidth in BANDWIDTHS_MB_PER_SECOND
+            )
+            print(f"{path.name:<22} {path.stat().st_size / 1000:6,.0f} KB: {timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares parsing a large yaml config map with loading it from the persistent file cache,
+as a new process does on startup.
+
+Run with: python -m benchmarks.bench_file_cache
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import yaml  # type: ignore[import-untyped]
+
+from confident.file_cache import load_persisted_file
+from confident.utils import load_file
+
+ENTRIES = 2_000
+NUMBER = 5
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds * 1000 / NUMBER:>10.2f} ms")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        map_path = Path(temp_dir) / "config_map.yaml"
+        map_path.write_text(
+            yaml.safe_dump(
+                {
+                    f"deployment_{index}": {
+                        "host": f"host-{index}.local",
+                        "port": 5000 + index,
+                        "labels": ["a", "b", "c"],
+                    }
+                    for index in range(ENTRIES)
+                }
+            )
+        )
+        cache_dir = Path(temp_dir) / "cache"
+        load_persisted_file(map_path, cache_dir=cache_dir)
+
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            load_file(map_path)
+        report("yaml parse", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(NUMBER):
+            load_persisted_file(map_path, cache_dir=cache_dir)
+        report("persistent cache", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
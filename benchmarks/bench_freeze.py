@@ -0,0 +1,49 @@
+"""
+Compares attribute reads and pickling of a config object and its frozen snapshot.
+
+Run with: python -m benchmarks.bench_freeze
+"""
+
+import pickle
+import timeit
+from typing import Dict, List
+
+from confident import BaseConfig
+
+NUMBER = 100_000
+
+
+class BenchConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 5000
+    timeout: float = 2.5
+    retry: bool = True
+    labels: List[str] = ["a", "b", "c"]
+    limits: Dict[str, int] = {"cpu": 2, "memory": 512}
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<40} {number / seconds:>14,.0f} ops/s")
+
+
+def main() -> None:
+    config = BenchConfig()
+    frozen = config.freeze()
+
+    for name, obj in (("live", config), ("frozen", frozen)):
+        seconds = timeit.timeit(lambda obj=obj: obj.port, number=NUMBER)
+        report(f"attribute read ({name})", seconds, NUMBER)
+
+    pickle_number = NUMBER // 10
+    for name, obj in (("live", config), ("frozen", frozen)):
+        payload = pickle.dumps(obj)
+        seconds = timeit.timeit(
+            lambda obj=obj: pickle.loads(pickle.dumps(obj)), number=pickle_number
+        )
+        report(
+            f"pickle round trip ({name}, {len(payload)} bytes)", seconds, pickle_number
+        )
+
+
+if __name__ == "__main__":
+    main()
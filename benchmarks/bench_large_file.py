@@ -0,0 +1,62 @@
+"""
+Measures loading a small config class from a large shared yaml file: the first parse with the pure python and the
+libyaml parsers, and the following objects, whose cost depends on the number of fields and not on the file size.
+
+Run with: python -m benchmarks.bench_large_file
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import yaml  # type: ignore[import-untyped]
+from pydantic import create_model
+
+from confident import BaseConfig
+from confident.utils import YAML_LOADER
+
+NUMBER = 1_000
+FIELDS = 12
+
+BenchConfig = create_model(  # type: ignore[call-overload]
+    "BenchConfig",
+    __base__=BaseConfig,
+    **{f"key_{index}": (dict, {}) for index in range(FIELDS)},
+)
+
+
+def write_file(path: Path, keys: int) -> None:
+    content = {
+        f"key_{index}": {"enabled": True, "hosts": [f"host_{index}"] * 5, "cpu": index}
+        for index in range(keys)
+    }
+    path.write_text(yaml.dump(content))
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for keys in (FIELDS, 5_000):
+            path = Path(temp_dir) / f"platform_{keys}.yaml"
+            write_file(path, keys)
+
+            start = time.perf_counter()
+            yaml.safe_load(path.read_bytes())
+            safe_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            yaml.load(path.read_bytes(), Loader=YAML_LOADER)
+            print(
+                f"{keys} keys: first parse {safe_seconds * 1000:.1f} ms (pure python), "
+                f"{(time.perf_counter() - start) * 1000:.1f} ms ({YAML_LOADER.__name__})"
+            )
+
+            BenchConfig(_files=[path])
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                BenchConfig(_files=[path])
+            print(
+                f"{keys} keys: {NUMBER / (time.perf_counter() - start):,.0f} objects/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compares creating many tenant configs one by one and with `build_layered` on a shared base layer.
+
+Run with: python -m benchmarks.bench_layered
+"""
+
+import time
+
+from pydantic import create_model
+
+from confident import BaseConfig
+
+NUMBER = 2_000
+FIELDS = 50
+
+BenchConfig = create_model(  # type: ignore[call-overload]
+    "BenchConfig",
+    __base__=BaseConfig,
+    **{f"field_{index}": (int, index) for index in range(FIELDS)},
+)
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<40} {number / seconds:>14,.0f} ops/s")
+
+
+def main() -> None:
+    overrides = [{"field_0": index, "field_1": index} for index in range(NUMBER)]
+
+    start = time.perf_counter()
+    for tenant_overrides in overrides:
+        BenchConfig(**tenant_overrides)
+    report("construct one by one", time.perf_counter() - start, NUMBER)
+
+    start = time.perf_counter()
+    for _ in BenchConfig.build_layered(None, overrides):
+        pass
+    report("build_layered", time.perf_counter() - start, NUMBER)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures creating a config object from a large config map: a single config map file, and a sharded config map
+(a directory with a file for every map name). Every cold load clears the parsed files and the directory listings
+caches before it. A changed load clears only the parsed files, as after the selected config file was edited.
+Also measures listing the map names of both, cold.
+
+Run with: python -m benchmarks.bench_map_shards
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from confident import BaseConfig
+from confident.file_cache import _files_cache
+from confident.file_refs import _resolved_cache
+from confident.map_shards import _listings_cache
+
+ENTRIES = (100, 1_000, 10_000)
+REPEAT = 5
+
+
+class DeploymentConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    replicas: int = 1
+
+
+def write_config_maps(directory: Path, entries: int) -> tuple[Path, Path]:
+    config_map = {
+        f"deployment_{index}": {
+            "host": f"host-{index}.internal",
+            "port": 8000 + index % 100,
+            "replicas": index % 7,
+        }
+        for index in range(entries)
+    }
+    map_path = directory / "config_map.json"
+    map_path.write_text(json.dumps(config_map))
+    shards_dir = directory / "config_map"
+    shards_dir.mkdir()
+    for map_name, config in config_map.items():
+        (shards_dir / f"{map_name}.json").write_text(json.dumps(config))
+    return map_path, shards_dir
+
+
+def best_milliseconds(action, clear_listings: bool = True) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        _files_cache.clear()
+        _resolved_cache.clear()
+        if clear_listings:
+            _listings_cache.clear()
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    print(
+        f"{'entries':>8} {'source':>8} {'cold load ms':>13} {'changed load ms':>16} "
+        f"{'list ms':>9}"
+    )
+    for entries in ENTRIES:
+        with tempfile.TemporaryDirectory() as directory:
+            map_path, shards_dir = write_config_maps(Path(directory), entries)
+            map_name = f"deployment_{entries - 1}"
+            for source, config_map in (("file", map_path), ("shards", shards_dir)):
+
+                def load(
+                    map_name: str = map_name, config_map: Path = config_map
+                ) -> DeploymentConfig:
+                    return DeploymentConfig(_map_name=map_name, _config_map=config_map)
+
+                load_ms = best_milliseconds(load)
+                changed_load_ms = best_milliseconds(load, clear_listings=False)
+                list_ms = best_milliseconds(
+                    lambda config_map=config_map: DeploymentConfig.list_map_names(
+                        config_map
+                    )
+                )
+                print(
+                    f"{entries:>8} {source:>8} {load_ms:>13.2f} {changed_load_ms:>16.2f} "
+                    f"{list_ms:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Measures the memory retained by every config object in each provenance level.
+
+Run with: python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+from typing import Dict, List
+
+from confident import BaseConfig
+
+NUMBER = 1_000
+
+
+class BenchConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 5000
+    timeout: float = 2.5
+    retry: bool = True
+    labels: List[str] = ["a", "b", "c"]
+    limits: Dict[str, int] = {"cpu": 2, "memory": 512}
+
+
+def retained_bytes(provenance: str) -> float:
+    # Warms up the class caches, so only the objects themselves are measured.
+    BenchConfig(_provenance=provenance)
+    gc.collect()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    configs = [
+        BenchConfig(port=index, _provenance=provenance) for index in range(NUMBER)
+    ]
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del configs
+    return (after - before) / NUMBER
+
+
+def main() -> None:
+    for provenance in ("full", "winners", "none"):
+        print(
+            f"retained per object ({provenance:<7}) {retained_bytes(provenance):>10,.0f} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures the pickled payload size of a config object and the overhead of sending it to process pool tasks.
+
+Run with: python -m benchmarks.bench_pickle
+"""
+
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from confident import BaseConfig
+
+TASKS = 2_000
+
+
+class BenchConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 5000
+    timeout: float = 2.5
+    retry: bool = True
+    labels: List[str] = ["a", "b", "c"]
+    limits: Dict[str, int] = {"cpu": 2, "memory": 512}
+
+
+def task(config: Any) -> int:
+    return 0 if config is None else config.port
+
+
+def time_tasks(executor: ProcessPoolExecutor, argument: Any) -> float:
+    start = time.perf_counter()
+    for future in [executor.submit(task, argument) for _ in range(TASKS)]:
+        future.result()
+    return (time.perf_counter() - start) / TASKS
+
+
+def main() -> None:
+    config = BenchConfig()
+    payload = pickle.dumps(config)
+    print(f"{'payload (config)':<32} {len(payload):>10} bytes")
+    print(
+        f"{'payload (frozen snapshot)':<32} {len(pickle.dumps(config.freeze())):>10} bytes"
+    )
+    print(
+        f"{'payload (model_dump dict)':<32} {len(pickle.dumps(config.model_dump())):>10} bytes"
+    )
+
+    number = 10_000
+    start = time.perf_counter()
+    for _ in range(number):
+        pickle.loads(pickle.dumps(config))
+    print(
+        f"{'pickle round trip':<32} {(time.perf_counter() - start) / number * 1e6:>10.1f} us"
+    )
+
+    number = 1_000
+    start = time.perf_counter()
+    for _ in range(number):
+        BenchConfig()
+    print(
+        f"{'construction (for comparison)':<32} {(time.perf_counter() - start) / number * 1e6:>10.1f} us"
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        time_tasks(executor, None)  # Warm up the workers.
+        baseline = time_tasks(executor, None)
+        with_config = time_tasks(executor, config)
+    print(f"{'task overhead (no argument)':<32} {baseline * 1e6:>10.1f} us")
+    print(f"{'task overhead (config)':<32} {with_config * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
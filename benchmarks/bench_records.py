@@ -0,0 +1,55 @@
+"""
+Compares creating config objects one by one and with `iter_from_records` from a JSON Lines file.
+
+Run with: python -m benchmarks.bench_records
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from confident import BaseConfig
+
+NUMBER = 5_000
+
+
+class HostConfig(BaseConfig):
+    hostname: str
+    port: int = 80
+    region: str = "eu"
+    labels: Dict[str, str] = {}
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {NUMBER / seconds:>14,.0f} ops/s")
+
+
+def main() -> None:
+    records = [
+        {"hostname": f"host_{index}", "port": index + 1, "labels": {"id": str(index)}}
+        for index in range(NUMBER)
+    ]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "hosts.jsonl"
+        path.write_text("\n".join(json.dumps(record) for record in records))
+
+        start = time.perf_counter()
+        for record in records:
+            HostConfig(**record)
+        report("construct one by one", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in HostConfig.iter_from_records(path):
+            pass
+        report("iter_from_records", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in HostConfig.iter_from_records(path, processes=2):
+            pass
+        report("iter_from_records (2 processes)", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares serializing a config object and its provenance with pydantic and with the memoized methods.
+
+Run with: python -m benchmarks.bench_serialization
+"""
+
+import json
+import timeit
+
+from pydantic import create_model
+from pydantic_settings import BaseSettings
+
+from confident import BaseConfig
+
+NUMBER = 10_000
+FIELDS = 50
+
+BenchConfig = create_model(  # type: ignore[call-overload]
+    "BenchConfig",
+    __base__=BaseConfig,
+    **{
+        f"field_{index}": (dict, {"values": list(range(10))}) for index in range(FIELDS)
+    },
+)
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds / NUMBER * 1_000_000:>10.1f} us")
+
+
+def main() -> None:
+    config = BenchConfig()
+
+    report(
+        "pydantic model_dump_json",
+        timeit.timeit(lambda: BaseSettings.model_dump_json(config), number=NUMBER),
+    )
+    report(
+        "memoized model_dump_json", timeit.timeit(config.model_dump_json, number=NUMBER)
+    )
+    report(
+        "full_fields() + json.dumps",
+        timeit.timeit(
+            lambda: json.dumps(
+                {
+                    name: field.model_dump(mode="json")
+                    for name, field in config.full_fields().items()
+                }
+            ),
+            number=NUMBER,
+        ),
+    )
+    report(
+        "memoized provenance_json", timeit.timeit(config.provenance_json, number=NUMBER)
+    )
+
+
+if __name__ == "__main__":
+    main()
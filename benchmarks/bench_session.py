@@ -0,0 +1,108 @@
+"""
+Measures a service startup that creates 25 config classes over the same config file, config map and environment,
+one by one and in a `ConfigSession`, on a local disk and on network storage (simulated by a latency for every
+`stat` of the config files). Every startup is cold: the parsed files caches are cleared before it.
+
+Run with: python -m benchmarks.bench_session
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from unittest import mock
+
+from pydantic import create_model
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSession
+from confident.file_cache import _files_cache
+from confident.file_refs import _resolved_cache
+
+NUMBER = 20
+CLASSES = 25
+FIELDS = 8
+ENV_VARS = 50
+STAT_LATENCY_SECONDS = 0.002
+
+
+def create_classes(config_path: Path, map_path: Path) -> list[type[BaseConfig]]:
+    shared_config = type(
+        "SharedConfig",
+        (BaseConfig,),
+        {
+            "__module__": __name__,
+            "model_config": ConfidentConfigDict(
+                files=[str(config_path)],
+                config_map=str(map_path),
+                map_name="prod",
+                extra="ignore",
+            ),
+        },
+    )
+    return [
+        create_model(  # type: ignore[call-overload]
+            f"Config{index}",
+            __base__=shared_config,
+            **{f"key_{index}_{field}": (int, 0) for field in range(FIELDS)},
+        )
+        for index in range(CLASSES)
+    ]
+
+
+def startup(config_classes: list[type[BaseConfig]], session: bool) -> float:
+    _files_cache.clear()
+    _resolved_cache.clear()
+    start = time.perf_counter()
+    if session:
+        with ConfigSession() as config_session:
+            config_session.load_all(config_classes)
+    else:
+        for config_class in config_classes:
+            config_class()
+    return time.perf_counter() - start
+
+
+def network_storage(directory: str):
+    stat = os.stat
+
+    def slow_stat(path, *args, **kwargs):
+        if str(path).startswith(directory):
+            time.sleep(STAT_LATENCY_SECONDS)
+        return stat(path, *args, **kwargs)
+
+    return mock.patch("os.stat", slow_stat)
+
+
+def main() -> None:
+    for index in range(ENV_VARS):
+        os.environ[f"UNRELATED_VARIABLE_{index}"] = str(index)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        content = {
+            f"key_{index}_{field}": field
+            for index in range(CLASSES)
+            for field in range(FIELDS)
+        }
+        config_path = Path(temp_dir) / "config.json"
+        config_path.write_text(json.dumps(content))
+        map_path = Path(temp_dir) / "config_map.json"
+        map_path.write_text(json.dumps({"prod": content, "dev": content}))
+        config_classes = create_classes(config_path, map_path)
+
+        for storage in ("local", "network"):
+            for session in (False, True):
+                with (
+                    network_storage(temp_dir) if storage == "network" else nullcontext()
+                ):
+                    seconds = sum(
+                        startup(config_classes, session) for _ in range(NUMBER)
+                    )
+                print(
+                    f"{storage} {'session' if session else 'one by one'}: "
+                    f"{seconds * 1000 / NUMBER:.1f} ms per startup"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measures the patterns of a test suite: creating config objects from a deep stack (as pytest calls tests) with many
+environment variables, and overriding the values of an existing object instead of creating another one.
+
+Run with: python -m benchmarks.bench_test_constructions
+"""
+
+import os
+import time
+
+from confident import BaseConfig, override_config
+
+NUMBER = 2_000
+STACK_DEPTH = 60
+ENV_VARS = 200
+
+
+class BenchConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    debug: bool = False
+
+
+def in_deep_stack(function, depth: int = STACK_DEPTH):
+    if depth == 0:
+        return function()
+    return in_deep_stack(function, depth - 1)
+
+
+def measure(name: str, function) -> None:
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        function()
+    print(f"{name}: {NUMBER / (time.perf_counter() - start):,.0f} ops/s")
+
+
+def main() -> None:
+    for index in range(ENV_VARS):
+        os.environ[f"UNRELATED_VARIABLE_{index}"] = str(index)
+    os.environ["PORT"] = "8080"
+
+    measure("create", lambda: in_deep_stack(BenchConfig))
+    config = BenchConfig()
+
+    def override() -> None:
+        with override_config(config, port=81, debug=True):
+            pass
+
+    measure("override", override)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares creating config objects from the same file with and without the validation memo.
+
+Run with: python -m benchmarks.bench_validation_memo
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from confident import BaseConfig
+from confident.validation_memo import validation_memo
+
+NUMBER = 1_000
+RULES = 500
+
+
+class Rule(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    port: int
+    hosts: Tuple[str, ...]
+
+
+class Policy(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    rules: Tuple[Rule, ...]
+
+
+class BenchConfig(BaseConfig):
+    policy: Policy
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {NUMBER / seconds:>14,.0f} ops/s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "policy.json"
+        rules = [
+            {"name": f"rule_{index}", "port": index, "hosts": [f"host_{index}"] * 10}
+            for index in range(RULES)
+        ]
+        path.write_text(json.dumps({"policy": {"name": "policy", "rules": rules}}))
+
+        for memoize in (False, True):
+            start = time.perf_counter()
+            for _ in range(NUMBER):
+                BenchConfig(_files=[path], _validation_memo=memoize)
+            report(
+                "with validation memo" if memoize else "without validation memo",
+                time.perf_counter() - start,
+            )
+        print(validation_memo.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@ from confident.config_dict import ConfidentConfigDict
 from confident.map_field import MapField
 from confident.config_source import ConfigSource
 from confident.config_field import ConfigField
+from confident.config_diff import ConfigFieldDiff
+from confident.frozen_config import FrozenConfig, FrozenDict
+from confident.overrides import override_config
+from confident.session import ConfigSession
 
 __all__ = [
     "BaseConfig",
@@ -12,4 +16,9 @@ __all__ = [
     "MapField",
     "ConfigSource",
     "ConfigField",
+    "ConfigFieldDiff",
+    "FrozenConfig",
+    "FrozenDict",
+    "override_config",
+    "ConfigSession",
 ]
@@ -0,0 +1,267 @@
+"""
+Config bundles: a single zip file with config files and a manifest of their names relative to a root directory.
+Reading files from a bundle costs a single `stat` and `read` of the bundle, which matters on slow filesystems.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import posixpath
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Set, Tuple
+
+MANIFEST_NAME = "confident-manifest.json"
+MANIFEST_VERSION = 2
+# Separates the bundle path from the path of a file inside it, e.g. 'bundle.zip!/app/config.yaml'.
+BUNDLE_SEPARATOR = "!/"
+BUNDLE_TEMP_PREFIX = ".tmp-"
+
+FileIdentity = Tuple[int, int, int]
+
+logger = logging.getLogger(__name__)
+
+
+class Bundle(NamedTuple):
+    path: Path
+    identity: FileIdentity
+    archive: zipfile.ZipFile
+    # The directory that the names of the bundled files are relative to, relative to the directory of the bundle.
+    root: str
+    # The names of the bundled files, and the directories that contain them.
+    names: FrozenSet[str]
+    directories: FrozenSet[str]
+
+
+# Opened bundles cached by their path, and validated by the bundle inode, modification time and size.
+_bundles_cache: Dict[str, Bundle] = {}
+# Paths that were not found in a bundle, reported once for every bundle.
+_reported_misses: Set[Tuple[str, str]] = set()
+
+
+def split_bundle_path(path: Path | str) -> Tuple[str, str] | None:
+    """
+    Returns: The bundle path and the name of the file inside the bundle, or None if it is not a bundled path.
+    """
+    bundle_path, separator, name = str(path).partition(BUNDLE_SEPARATOR)
+    if not separator:
+        return None
+    return bundle_path, posixpath.normpath(name)
+
+
+def open_bundle(path: Path | str) -> Bundle:
+    """
+    Opens a bundle with a single read. The bundle is reused as long as it is unchanged.
+
+    Raises:
+        ValueError - If the bundle is not exists.
+        ValueError - If the bundle is not a valid bundle.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise ValueError(f"{path=} is not exists.")
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    bundle = _bundles_cache.get(os.fspath(path))
+    if bundle is not None:
+        if bundle.identity == identity:
+            return bundle
+        # The content of a changed bundle is released even if the new bundle is not valid.
+        del _bundles_cache[os.fspath(path)]
+
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(Path(path).read_bytes()))
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+        root, names = manifest["root"], frozenset(manifest["files"])
+    except (zipfile.BadZipFile, KeyError, TypeError, ValueError):
+        raise ValueError(f"{path=} is not a valid config bundle.")
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"{path=} has manifest version {manifest.get('version')}, "
+            f"create it again to get version {MANIFEST_VERSION}."
+        )
+    bundle = Bundle(
+        path=Path(path),
+        identity=identity,
+        archive=archive,
+        root=root,
+        names=names,
+        directories=frozenset(posixpath.dirname(name) for name in names if "/" in name),
+    )
+    _bundles_cache[os.fspath(path)] = bundle
+    return bundle
+
+
+def bundled_path(
+    path: Path | str, bundle: Bundle | None, root: Path | str | None = None
+) -> Path:
+    """
+    Looks up a file (or a directory of bundled files, e.g. a sharded config map) in the bundle by its path relative
+    to the bundle root. The root defaults to the root that the bundle was created with, relative to the directory
+    of the bundle, so the bundle works from any working directory as long as it is kept next to the config files.
+    A path that is not in the bundle is logged once, since it is read from the filesystem instead.
+
+    Args:
+        path: The path of the file as the config class uses it.
+        bundle: The bundle to look the file up in.
+        root: The directory that the bundled names are relative to, if the files are elsewhere than the bundle
+            root (e.g. the bundle is on a shared mount).
+
+    Returns:
+        The path inside the bundle (e.g. 'bundle.zip!/app.yaml'), or the path itself if there is no bundle or the
+        file is not in it.
+    """
+    if bundle is None or split_bundle_path(path) is not None:
+        return Path(path)
+    if root is None:
+        root = os.path.join(os.path.dirname(os.path.abspath(bundle.path)), bundle.root)
+    # The name is cut from the absolute path with string operations, since `os.path.relpath` is costly per file.
+    absolute_path = os.path.abspath(path)
+    root_prefix = os.path.join(os.path.abspath(root), "")
+    name = absolute_path[len(root_prefix) :].replace(os.sep, "/")
+    if not absolute_path.startswith(root_prefix) or (
+        name not in bundle.names and name not in bundle.directories
+    ):
+        miss = (str(bundle.path), absolute_path)
+        if miss not in _reported_misses:
+            _reported_misses.add(miss)
+            logger.warning(
+                "%s is not in the bundle %s (relative to %s), reading it from the filesystem.",
+                path,
+                bundle.path,
+                root,
+            )
+        return Path(path)
+    return Path(f"{bundle.path}{BUNDLE_SEPARATOR}{name}")
+
+
+def read_bytes(path: Path | str) -> bytes:
+    """
+    Returns: The content of a file, from a bundle if it is a bundled path.
+
+    Raises:
+        ValueError - If the file is not exists.
+    """
+    split_path = split_bundle_path(path)
+    if split_path is None:
+        try:
+            return Path(path).read_bytes()
+        except FileNotFoundError:
+            raise ValueError(f"{path=} is not exists.")
+    bundle_path, name = split_path
+    try:
+        return open_bundle(bundle_path).archive.read(name)
+    except KeyError:
+        raise ValueError(f"{path=} is not exists.")
+
+
+def is_file(path: Path | str, bundle: Bundle | None = None) -> bool:
+    """
+    Returns: Whether the file exists. Files inside the given bundle are looked up without opening it again.
+    """
+    split_path = split_bundle_path(path)
+    if split_path is None:
+        return os.path.isfile(path)
+    bundle_path, name = split_path
+    if bundle is None or str(bundle.path) != bundle_path:
+        try:
+            bundle = open_bundle(bundle_path)
+        except ValueError:
+            return False
+    return name in bundle.archive.NameToInfo
+
+
+def identity_path(path: Path | str) -> str:
+    """
+    Returns: The real path of the file whose identity changes when the file changes: the bundle of a bundled path.
+    """
+    split_path = split_bundle_path(path)
+    return os.path.realpath(split_path[0] if split_path else path)
+
+
+def real_path(path: Path | str) -> str:
+    """
+    Returns: The real path of a file, or of its bundle followed by the name of a bundled file.
+    """
+    split_path = split_bundle_path(path)
+    if split_path is None:
+        return os.path.realpath(path)
+    return f"{os.path.realpath(split_path[0])}{BUNDLE_SEPARATOR}{split_path[1]}"
+
+
+def create_bundle(
+    paths: Iterable[Path | str], output: Path | str, root: Path | str | None = None
+) -> Dict[str, str]:
+    """
+    Writes the files into a bundle, with a manifest of their names.
+    Files are named inside the bundle by their path relative to the root, and the root is kept relative to the
+    directory of the bundle (see `bundled_path`). An existing bundle is replaced atomically.
+
+    Args:
+        paths: The files to bundle.
+        output: The path of the bundle to write.
+        root: The directory that the names are relative to. Defaults to the common directory of the files.
+
+    Returns:
+        The name of every bundled file by its original absolute path.
+
+    Raises:
+        ValueError - If there are no files.
+        ValueError - If a file is not exists.
+        ValueError - If a file is not under the root.
+    """
+    absolute_paths = sorted({os.path.abspath(path) for path in paths})
+    if not absolute_paths:
+        raise ValueError("No files to bundle.")
+    for path in absolute_paths:
+        if not os.path.isfile(path):
+            raise ValueError(f"{path=} is not exists.")
+    if root is None:
+        root = (
+            os.path.dirname(os.path.commonpath(absolute_paths))
+            if len(absolute_paths) == 1
+            else os.path.commonpath(absolute_paths)
+        )
+
+    manifest = {}
+    for path in absolute_paths:
+        name = Path(os.path.relpath(path, root)).as_posix()
+        if name.startswith("../"):
+            raise ValueError(f"{path=} is not under {root=}.")
+        manifest[path] = name
+
+    # The bundle is written to a temporary file and replaced atomically, so processes that read the bundle
+    # while it is rebuilt read either the old or the new bundle.
+    output = Path(output)
+    temp_path = output.with_name(
+        f"{BUNDLE_TEMP_PREFIX}{uuid.uuid4().hex}-{output.name}"
+    )
+    try:
+        with zipfile.ZipFile(
+            temp_path, mode="x", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            archive.writestr(
+                MANIFEST_NAME,
+                json.dumps(
+                    {
+                        "version": MANIFEST_VERSION,
+                        "root": Path(
+                            os.path.relpath(root, os.path.dirname(output.absolute()))
+                        ).as_posix(),
+                        "files": sorted(manifest.values()),
+                    },
+                    indent=2,
+                ),
+            )
+            for path, name in manifest.items():
+                archive.write(path, arcname=name)
+        os.replace(temp_path, output)
+    except BaseException:
+        if temp_path.exists():
+            os.remove(temp_path)
+        raise
+    return manifest
@@ -0,0 +1,368 @@
+"""
+Command line tools of confident. Run with `python -m confident <command>`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import importlib
+import importlib.util
+import json
+import os
+import pkgutil
+import pstats
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Set
+
+from confident.bundle import create_bundle
+from confident.confident import BaseConfig
+from confident.file_cache import clear_file_cache
+from confident.file_refs import RefResolver
+from confident.map_shards import list_map_shards
+from confident.profiling import profile_constructions
+from confident.utils import get_class_file_path
+
+
+def load_config_class(target: str) -> type[BaseConfig]:
+    """
+    Imports a config class by a `module:ClassName` or `path/to/file.py:ClassName` target.
+
+    Raises:
+        ValueError - If the target is not in a valid form or is not a `BaseConfig` class.
+    """
+    module_name, _, class_name = target.rpartition(":")
+    if not module_name or not class_name:
+        raise ValueError(f"{target=} has to be in the form 'module:ClassName'.")
+
+    if module_name.endswith(".py"):
+        spec = importlib.util.spec_from_file_location(
+            Path(module_name).stem, module_name
+        )
+        if spec is None or spec.loader is None:
+            raise ValueError(f"{target=} is not a valid python file.")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+
+    config_class = getattr(module, class_name, None)
+    if not isinstance(config_class, type) or not issubclass(config_class, BaseConfig):
+        raise ValueError(f"{target=} is not a `BaseConfig` class.")
+    return config_class
+
+
+def discover_config_classes(package_name: str) -> List[type[BaseConfig]]:
+    """
+    Imports a package (or a module) with all its submodules, and finds the config classes that are declared in them.
+
+    Returns:
+        The config classes, ordered by their module and name.
+
+    Raises:
+        ValueError - If the package has no config classes.
+    """
+    package = importlib.import_module(package_name)
+    modules = [package]
+    if hasattr(package, "__path__"):
+        modules += [
+            importlib.import_module(module_info.name)
+            for module_info in pkgutil.walk_packages(
+                package.__path__, prefix=f"{package.__name__}."
+            )
+        ]
+
+    config_classes = {
+        value: None
+        for module in modules
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, BaseConfig)
+        and value.__module__ == module.__name__
+    }
+    if not config_classes:
+        raise ValueError(f"{package_name=} has no `BaseConfig` classes.")
+    return sorted(config_classes, key=lambda cls: (cls.__module__, cls.__qualname__))
+
+
+def load_config_classes(target: str) -> List[type[BaseConfig]]:
+    """
+    Returns: The config class of a `module:ClassName` or `path/to/file.py:ClassName` target, or all the config
+        classes of a `package` target (see `discover_config_classes`).
+
+    Raises:
+        ValueError - If the target is not a config class or a package with config classes.
+    """
+    if ":" in target:
+        return [load_config_class(target)]
+    return discover_config_classes(target)
+
+
+def profile_config(
+    config_class: type[BaseConfig],
+    repeat: int = 1,
+    memory: bool = False,
+    cprofile_top: int = 0,
+) -> Dict[str, Any]:
+    """
+    Creates objects of the config class and measures every phase of the creation.
+
+    Args:
+        config_class: The config class to profile.
+        repeat: The number of objects to create. Phases times are averaged.
+        memory: Whether to trace the memory allocations with `tracemalloc`.
+        cprofile_top: The number of the most expensive functions to report with `cProfile`. 0 disables it.
+
+    Returns:
+        The report, as a json serializable dictionary.
+    """
+    profiler = cProfile.Profile() if cprofile_top else None
+    if memory:
+        tracemalloc.start()
+    try:
+        with profile_constructions() as profile:
+            if profiler:
+                profiler.enable()
+            for _ in range(repeat):
+                config_class()
+            if profiler:
+                profiler.disable()
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if memory:
+            tracemalloc.stop()
+
+    report: Dict[str, Any] = {
+        "config_class": f"{config_class.__module__}:{config_class.__qualname__}",
+        **profile.to_dict(),
+    }
+    if memory:
+        report["memory"] = {"current_bytes": current, "peak_bytes": peak}
+    if profiler:
+        report["functions"] = _top_functions(profiler, cprofile_top)
+    return report
+
+
+def _top_functions(profiler: cProfile.Profile, top: int) -> List[Dict[str, Any]]:
+    """
+    Returns: The functions with the highest cumulative time.
+    """
+    # Every entry is (file, line, function): (primitive calls, calls, total time, cumulative time, callers).
+    entries = pstats.Stats(profiler).stats.items()  # type: ignore[attr-defined]
+    functions = []
+    for (file_name, line_number, function_name), stats in sorted(
+        entries, key=lambda entry: entry[1][3], reverse=True
+    )[:top]:
+        functions.append(
+            {
+                "function": f"{file_name}:{line_number}({function_name})",
+                "calls": stats[1],
+                "cumulative_ms": stats[3] * 1000,
+            }
+        )
+    return functions
+
+
+def format_profile(report: Dict[str, Any]) -> str:
+    """
+    Returns: The profile report as text tables.
+    """
+    if "error" in report:
+        return f"Profile of {report['config_class']} failed: {report['error']}"
+    lines = [
+        f"Profile of {report['config_class']} "
+        f"(average of {report['constructions']} objects)",
+        "",
+        f"{'Phase':<40}{'ms':>12}",
+    ]
+    lines += [f"{name:<40}{ms:>12.3f}" for name, ms in report["phases_ms"].items()]
+
+    if report["files"]:
+        lines += ["", f"{'File':<40}{'bytes':>12}{'parse ms':>12}"]
+        lines += [
+            f"{file['path']:<40}{file['bytes']:>12}{file['parse_ms']:>12.3f}"
+            for file in report["files"]
+        ]
+
+    if "memory" in report:
+        lines += [
+            "",
+            f"Memory: current {report['memory']['current_bytes']:,} bytes, "
+            f"peak {report['memory']['peak_bytes']:,} bytes",
+        ]
+
+    if "functions" in report:
+        lines += ["", f"{'Function':<80}{'calls':>10}{'cumulative ms':>16}"]
+        lines += [
+            f"{function['function'][-80:]:<80}{function['calls']:>10}"
+            f"{function['cumulative_ms']:>16.3f}"
+            for function in report["functions"]
+        ]
+    return "\n".join(lines)
+
+
+def collect_config_files(config_class: type[BaseConfig]) -> List[str]:
+    """
+    Finds the files that a config class reads: the specs file, the config files, the config map file (or the
+    shards of a sharded config map), the files of the config map entries, and the files they reference with `$ref`.
+
+    Returns:
+        The absolute paths of the files that exist.
+
+    Raises:
+        ValueError - If a file is not a valid config file.
+    """
+    obj = config_class.__new__(config_class)
+    specs = obj._build_specs(
+        values={}, class_path=get_class_file_path(cls=obj), creation_path=Path.cwd()
+    )
+    resolver = RefResolver()
+    paths: Set[str] = set()
+
+    def add(path: Path | str) -> Dict[str, Any] | None:
+        if not os.path.isfile(path):
+            return None
+        resolved = resolver.resolve(path)
+        paths.add(os.path.abspath(path))
+        paths.update(resolved.identities)
+        return resolved.content
+
+    if specs.specs_path and os.path.isfile(specs.specs_path):
+        paths.add(os.path.abspath(specs.specs_path))
+    for file_path in specs.files:
+        add(file_path)
+
+    config_map = specs.config_map
+    if isinstance(config_map, Path):
+        config_map = (
+            list_map_shards(config_map)
+            if os.path.isdir(config_map)
+            else add(config_map)
+        )
+    for entry in (config_map or {}).values():
+        if isinstance(entry, (str, Path)):
+            add(entry)
+    return sorted(paths)
+
+
+def _profile_command(args: argparse.Namespace) -> int:
+    config_classes = load_config_classes(args.target)
+    reports = []
+    for config_class in config_classes:
+        try:
+            report = profile_config(
+                config_class=config_class,
+                repeat=args.repeat,
+                memory=args.memory,
+                cprofile_top=args.cprofile,
+            )
+        except ValueError as error:
+            # A discovered class may not be creatable without arguments (e.g. a base class with required fields).
+            if len(config_classes) == 1:
+                raise
+            report = {
+                "config_class": f"{config_class.__module__}:{config_class.__qualname__}",
+                "error": str(error),
+            }
+        reports.append(report)
+        print(format_profile(report), end="\n\n")
+
+    if args.json_out:
+        with open(args.json_out, "w") as file:
+            json.dump(reports, file, indent=2)
+    return 0
+
+
+def _cache_clear_command(args: argparse.Namespace) -> int:
+    removed = clear_file_cache(args.cache_dir)
+    print(f"Removed {removed} cache entries from {args.cache_dir}.")
+    return 0
+
+
+def _bundle_command(args: argparse.Namespace) -> int:
+    paths = collect_config_files(load_config_class(args.target)) + list(args.add)
+    manifest = create_bundle(paths=paths, output=args.output, root=args.root)
+    print(f"Bundled {len(manifest)} files into {args.output}.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m confident")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    profile_parser = commands.add_parser(
+        "profile", help="Measure the creation phases of a config class."
+    )
+    profile_parser.add_argument(
+        "target",
+        help="The config class, as 'module:ClassName' or 'file.py:ClassName', "
+        "or a package to profile all its config classes.",
+    )
+    profile_parser.add_argument(
+        "--repeat", type=int, default=1, help="Number of objects to create."
+    )
+    profile_parser.add_argument(
+        "--memory", action="store_true", help="Trace memory allocations."
+    )
+    profile_parser.add_argument(
+        "--cprofile",
+        type=int,
+        default=0,
+        metavar="TOP",
+        help="Report the most expensive functions with cProfile.",
+    )
+    profile_parser.add_argument(
+        "--json-out",
+        default=None,
+        metavar="FILE",
+        help="Also write the reports to a json file, e.g. for dashboards.",
+    )
+    profile_parser.set_defaults(handler=_profile_command)
+
+    cache_parser = commands.add_parser(
+        "cache", help="Manage a persistent cache of parsed files."
+    )
+    cache_commands = cache_parser.add_subparsers(dest="cache_command", required=True)
+    clear_parser = cache_commands.add_parser(
+        "clear", help="Remove all the entries of a cache directory."
+    )
+    clear_parser.add_argument("cache_dir", help="The `file_cache_dir` to clear.")
+    clear_parser.set_defaults(handler=_cache_clear_command)
+
+    bundle_parser = commands.add_parser(
+        "bundle", help="Pack the files of a config class into a single bundle."
+    )
+    bundle_parser.add_argument(
+        "target", help="The config class, as 'module:ClassName' or 'file.py:ClassName'."
+    )
+    bundle_parser.add_argument(
+        "-o", "--output", required=True, help="The path of the bundle to write."
+    )
+    bundle_parser.add_argument(
+        "--root",
+        default=None,
+        help="The directory that the bundled names are relative to. Defaults to the common directory.",
+    )
+    bundle_parser.add_argument(
+        "--add",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Another file to bundle. Can be repeated.",
+    )
+    bundle_parser.set_defaults(handler=_bundle_command)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return int(args.handler(args))
+    except ValueError as error:
+        parser.error(str(error))
+        return 2
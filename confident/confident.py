@@ -1,82 +1,231 @@
 from __future__ import annotations
 
-import inspect
+import json
 from copy import deepcopy
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Self,
+    Set,
+    Tuple,
+)
 
-from pydantic_settings import BaseSettings
+from pydantic import TypeAdapter, ValidationError
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    InitSettingsSource,
+    SecretsSettingsSource,
+)
 
+from confident.bundle import bundled_path, open_bundle
+from confident.config_diff import ConfigFieldDiff
 from confident.config_field import ConfigField
 from confident.config_source import ConfigSource
+from confident.frozen_config import FrozenConfig, frozen_class
 from confident.loader_manager import LoaderManager
 from confident.loaders.default_source_loader import DefaultSourceLoader
+from confident.loaders.dotenv_source_loader import DotEnvSourceLoader
 from confident.loaders.env_source_loader import EnvSourceLoader
 from confident.loaders.file_source_loader import FileSourceLoader
 from confident.loaders.init_source_loader import InitSourceLoader
 from confident.loaders.map_source_loader import MapSourceLoader
-from confident.specs import ConfigSpecs
-from confident.utils import get_class_file_path
+from confident.loaders.remote_source_loader import RemoteSourceLoader
+from confident.loaders.secrets_source_loader import SecretsSourceLoader
+from confident.loaders.sqlite_source_loader import (
+    SQLiteSourceLoader,
+    prefetch_sqlite_scopes,
+    sqlite_field_names,
+)
+from confident.map_shards import list_map_names
+from confident.overrides import apply_overrides, class_overrides
+from confident.profiling import (
+    CALLER_INSPECTION_PHASE,
+    SETTINGS_PHASE,
+    SPECS_PHASE,
+    TOTAL_PHASE,
+    profile_phase,
+)
+from confident.records import (
+    RECORDS_CHUNK_SIZE,
+    RecordError,
+    chunked,
+    deep_merge,
+    map_chunks,
+    parse_records,
+)
+from confident.specs import SQLITE_TABLE_DEFAULT, ConfigSpecs, share_specs
+from confident.utils import get_caller_file_path, get_class_file_path, stable_hash
 
 SPECS_ATTR = "_specs"
 LOADER_MANAGER_ATTR = "_loader_manager"
+FIELD_HASHES_ATTR = "_field_hashes"
+FINGERPRINT_ATTR = "_fingerprint"
+SERIALIZATION_CACHE_ATTR = "_serialization_cache"
+SERIALIZATION_CACHE_SIZE = 32
+SQLITE_BATCH_SIZE = 500
 
 
 class BaseConfig(BaseSettings):
-    __slots__ = (SPECS_ATTR, LOADER_MANAGER_ATTR)
+    __slots__ = (
+        SPECS_ATTR,
+        LOADER_MANAGER_ATTR,
+        FIELD_HASHES_ATTR,
+        FINGERPRINT_ATTR,
+        SERIALIZATION_CACHE_ATTR,
+    )
 
     _confident_loader_manager_context_: LoaderManager  # type: ignore[assignment]
     _confident_specs_context_: ConfigSpecs  # type: ignore[assignment]
 
     def __init__(self, **values: Any) -> None:
-        # Prepare metadata.
-        subclass_location = get_class_file_path(cls=self)
-        caller_module = inspect.getmodule(inspect.stack()[1][0])
-        caller_location: str | Path = (
-            caller_module.__file__
-            if caller_module and caller_module.__file__
-            else Path.cwd()
-        )
-
-        config_dict = self._get_confident_config_dict()
-
-        specs = config_dict.get("specs")
-        if not specs:
-            specs_path = values.pop("_specs_path", None) or config_dict.get(
-                "specs_path"
-            )
-            source_priority = values.pop("_source_priority", None)
-            if specs_path:
-                specs = ConfigSpecs.from_path(
-                    path=specs_path,
-                    class_path=subclass_location,
-                    creation_path=caller_location,
-                    source_priority=source_priority,
+        with profile_phase(TOTAL_PHASE, label=type(self).__qualname__):
+            # Prepare metadata.
+            with profile_phase(CALLER_INSPECTION_PHASE):
+                subclass_location = get_class_file_path(cls=self)
+                caller_location = (
+                    values.pop("_creation_path", None) or get_caller_file_path()
                 )
-            else:
-                specs = ConfigSpecs.from_model(
-                    model=self,
+
+            with profile_phase(SPECS_PHASE):
+                specs = self._build_specs(
                     values=values,
                     class_path=subclass_location,
                     creation_path=caller_location,
-                    source_priority=source_priority,
                 )
 
-        loader_manager = LoaderManager(
-            settings_obj=self, source_priority=specs.source_priority
+            loader_manager = LoaderManager(
+                settings_obj=self,
+                source_priority=specs.source_priority,
+                interpolate=specs.interpolate,
+                parallel=specs.parallel_loading,
+                memoize_validation=specs.validation_memo,
+            )
+            object.__setattr__(self, SPECS_ATTR, specs)
+            object.__setattr__(self, LOADER_MANAGER_ATTR, loader_manager)
+            object.__setattr__(self, FIELD_HASHES_ATTR, {})
+            object.__setattr__(self, FINGERPRINT_ATTR, None)
+            object.__setattr__(self, SERIALIZATION_CACHE_ATTR, {})
+
+            # Create temporary context on the class for settings_customise_sources.
+            self.__class__._confident_loader_manager_context_ = loader_manager
+            self.__class__._confident_specs_context_ = specs
+
+            with profile_phase(SETTINGS_PHASE):
+                super().__init__(**values)
+
+            # Reset the context, so it will be clean for the next object creation.
+            del self.__class__._confident_loader_manager_context_
+            del self.__class__._confident_specs_context_
+
+            loader_manager.memoize_validated_values(self)
+            loader_manager.release(provenance=specs.provenance)
+            object.__setattr__(self, SPECS_ATTR, share_specs(specs))
+            if specs.provenance == "none":
+                # No fields details are kept, so the object needs no loader manager.
+                object.__setattr__(self, LOADER_MANAGER_ATTR, None)
+
+            overrides = class_overrides(type(self))
+            if overrides:
+                apply_overrides(self, overrides)
+
+    def _build_specs(
+        self, values: Dict[str, Any], class_path: str | Path, creation_path: str | Path
+    ) -> ConfigSpecs:
+        """
+        Returns: The specs of the object, from the model config, the specs path or the keyword arguments.
+            The specs arguments are removed from the values.
+        """
+        config_dict = self._get_confident_config_dict()
+
+        specs: ConfigSpecs | None = config_dict.get("specs")
+        if specs:
+            return specs
+
+        specs_path = values.pop("_specs_path", None) or config_dict.get("specs_path")
+        source_priority = values.pop("_source_priority", None)
+        if specs_path:
+            bundle = values.pop("_bundle", None) or config_dict.get("bundle")
+            bundle_root = values.pop("_bundle_root", None) or config_dict.get(
+                "bundle_root"
+            )
+            specs = ConfigSpecs.from_path(
+                path=bundled_path(
+                    specs_path, open_bundle(bundle) if bundle else None, bundle_root
+                ),
+                class_path=class_path,
+                creation_path=creation_path,
+                source_priority=source_priority,
+            )
+            if specs.bundle is None and bundle:
+                specs.bundle = Path(bundle)
+            if specs.bundle_root is None and bundle_root:
+                specs.bundle_root = Path(bundle_root)
+            return specs
+        return ConfigSpecs.from_model(
+            model=self,
+            values=values,
+            class_path=class_path,
+            creation_path=creation_path,
+            source_priority=source_priority,
         )
-        object.__setattr__(self, SPECS_ATTR, specs)
-        object.__setattr__(self, LOADER_MANAGER_ATTR, loader_manager)
 
-        # Create temporary context on the class for settings_customise_sources.
-        self.__class__._confident_loader_manager_context_ = loader_manager
-        self.__class__._confident_specs_context_ = specs
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._reset_field_hash(name)
+        self._reset_serialization_cache()
 
-        super().__init__(**values)
+    def _reset_field_hash(self, name: str) -> None:
+        """
+        Drops the cached hash of a field whose value has changed.
+        """
+        try:
+            object.__getattribute__(self, FIELD_HASHES_ATTR).pop(name, None)
+        except AttributeError:
+            return
+        object.__setattr__(self, FINGERPRINT_ATTR, None)
 
-        # Reset the context, so it will be clean for the next object creation.
-        del self.__class__._confident_loader_manager_context_
-        del self.__class__._confident_specs_context_
+    def _reset_serialization_cache(self) -> None:
+        """
+        Drops the memoized serializations of an object whose values have changed.
+        """
+        object.__setattr__(self, SERIALIZATION_CACHE_ATTR, {})
+
+    def _get_serialization_cache(self) -> Dict[Hashable, str]:
+        try:
+            cache: Dict[Hashable, str] = object.__getattribute__(
+                self, SERIALIZATION_CACHE_ATTR
+            )
+        except AttributeError:
+            # Objects that were copied by pydantic (e.g. `model_copy`) have no cache yet.
+            cache = {}
+            object.__setattr__(self, SERIALIZATION_CACHE_ATTR, cache)
+        return cache
+
+    def _memoized(self, key: Hashable | None, serialize: Callable[[], str]) -> str:
+        """
+        Returns: The memoized serialization of the key, or a new one if it was not memoized yet.
+            Serializations without a key are not memoized.
+        """
+        if key is None:
+            return serialize()
+        cache = self._get_serialization_cache()
+        result = cache.get(key)
+        if result is None:
+            result = serialize()
+            if len(cache) < SERIALIZATION_CACHE_SIZE:
+                cache[key] = result
+        return result
 
     @classmethod
     def _get_confident_config_dict(cls) -> dict:
@@ -86,10 +235,27 @@ class BaseConfig(BaseSettings):
             for key in (
                 "files",
                 "ignore_missing_files",
+                "deep_merge_files",
+                "file_cache_dir",
+                "env_files",
+                "secrets_dir",
+                "sqlite_path",
+                "sqlite_table",
+                "sqlite_scope",
+                "sqlite_read_only",
+                "remote_url",
+                "remote_timeout",
+                "remote_cache_dir",
                 "map_name",
                 "map_field",
                 "config_map",
                 "source_priority",
+                "interpolate",
+                "parallel_loading",
+                "validation_memo",
+                "provenance",
+                "bundle",
+                "bundle_root",
                 "specs",
                 "specs_path",
             )
@@ -110,6 +276,7 @@ class BaseConfig(BaseSettings):
         specs = cls._confident_specs_context_
         loader_manager.init_settings_callable = init_settings
         loader_manager.env_settings_callable = env_settings
+        loader_manager.dotenv_settings_callable = dotenv_settings
         loader_manager.file_secret_settings_callable = file_secret_settings
 
         # Add all the default loaders.
@@ -117,6 +284,14 @@ class BaseConfig(BaseSettings):
             [
                 InitSourceLoader(specs=specs, init_settings_callable=init_settings),
                 EnvSourceLoader(specs=specs, env_settings_callable=env_settings),
+                DotEnvSourceLoader(
+                    specs=specs, dotenv_settings_callable=dotenv_settings
+                ),
+                SecretsSourceLoader(
+                    specs=specs, file_secret_settings_callable=file_secret_settings
+                ),
+                SQLiteSourceLoader(specs=specs),
+                RemoteSourceLoader(specs=specs),
                 MapSourceLoader(
                     specs=specs, all_loaded_fields=loader_manager.all_loaded_fields
                 ),
@@ -129,12 +304,20 @@ class BaseConfig(BaseSettings):
 
     @classmethod
     def from_files(
-        cls, files, *, ignore_missing_files=None, source_priority=None, **values
+        cls,
+        files,
+        *,
+        ignore_missing_files=None,
+        deep_merge_files=None,
+        source_priority=None,
+        **values,
     ):
         if files is not None:
             values["_files"] = files
         if ignore_missing_files is not None:
             values["_ignore_missing_files"] = ignore_missing_files
+        if deep_merge_files is not None:
+            values["_deep_merge_files"] = deep_merge_files
         if source_priority is not None:
             values["_source_priority"] = source_priority
         return cls(**values)
@@ -159,6 +342,24 @@ class BaseConfig(BaseSettings):
             values["_source_priority"] = source_priority
         return cls(**values)
 
+    @classmethod
+    def list_map_names(cls, config_map: Path | str | None = None) -> List[str]:
+        """
+        Lists the map names of the config map of the class, or of the given config map. The shards of a sharded
+        config map (a directory) are not read, so it is cheap even for large config maps.
+
+        Raises:
+            ValueError - If the class has no `config_map`.
+            ValueError - If the config map is not exists or is not a valid config file.
+        """
+        config_dict = cls._get_confident_config_dict()
+        config_map = config_map or config_dict.get("config_map")
+        if config_map is None:
+            raise ValueError(f"{cls.__name__} has no `config_map`.")
+        return list_map_names(
+            config_map=config_map, cache_dir=config_dict.get("file_cache_dir")
+        )
+
     @classmethod
     def from_specs(cls, specs_path, *, source_priority=None, **values):
         if specs_path is not None:
@@ -173,6 +374,13 @@ class BaseConfig(BaseSettings):
         *,
         files: str | Path | List[str | Path] | None = None,
         ignore_missing_files: bool | None = None,
+        deep_merge_files: bool | None = None,
+        env_files: str | Path | List[str | Path] | None = None,
+        secrets_dir: str | Path | List[str | Path] | None = None,
+        sqlite_path: str | Path | None = None,
+        sqlite_table: str | None = None,
+        sqlite_scope: str | None = None,
+        remote_url: str | None = None,
         config_map: str | Path | Dict[str, Any] | None = None,
         map_name: str | None = None,
         map_field: str | None = None,
@@ -184,6 +392,20 @@ class BaseConfig(BaseSettings):
             values["_files"] = files
         if ignore_missing_files is not None:
             values["_ignore_missing_files"] = ignore_missing_files
+        if deep_merge_files is not None:
+            values["_deep_merge_files"] = deep_merge_files
+        if env_files is not None:
+            values["_env_files"] = env_files
+        if secrets_dir is not None:
+            values["_secrets_dir"] = secrets_dir
+        if sqlite_path is not None:
+            values["_sqlite_path"] = sqlite_path
+        if sqlite_table is not None:
+            values["_sqlite_table"] = sqlite_table
+        if sqlite_scope is not None:
+            values["_sqlite_scope"] = sqlite_scope
+        if remote_url is not None:
+            values["_remote_url"] = remote_url
         if config_map is not None:
             values["_config_map"] = config_map
         if map_name is not None:
@@ -196,6 +418,269 @@ class BaseConfig(BaseSettings):
             values["_source_priority"] = source_priority
         return cls(**values)
 
+    @classmethod
+    def from_sqlite_scopes(
+        cls,
+        scopes: Iterable[str],
+        *,
+        sqlite_path: str | Path | None = None,
+        sqlite_table: str | None = None,
+        batch_size: int = SQLITE_BATCH_SIZE,
+        **values: Any,
+    ) -> Iterator[Self]:
+        """
+        Creates a config object for every sqlite scope (e.g. tenant).
+        The rows of every batch of scopes are fetched in a single query. The objects of a batch are created before
+        they are yielded, so the prefetched rows are never left in place while the caller holds the generator.
+        """
+        config_dict = cls._get_confident_config_dict()
+        sqlite_path = sqlite_path or config_dict.get("sqlite_path")
+        sqlite_table = sqlite_table or config_dict.get(
+            "sqlite_table", SQLITE_TABLE_DEFAULT
+        )
+        if sqlite_path is None:
+            raise ValueError("No `sqlite_path` was provided.")
+
+        scopes = iter(scopes)
+        while batch := list(islice(scopes, batch_size)):
+            with prefetch_sqlite_scopes(
+                path=sqlite_path,
+                table=sqlite_table,
+                scopes=batch,
+                field_names=sqlite_field_names(cls),
+                read_only=config_dict.get("sqlite_read_only", True),
+            ):
+                configs = [
+                    cls(
+                        _sqlite_path=sqlite_path,
+                        _sqlite_table=sqlite_table,
+                        _sqlite_scope=scope,
+                        **values,
+                    )
+                    for scope in batch
+                ]
+            yield from configs
+
+    @classmethod
+    def build_layered(
+        cls,
+        base_sources: Dict[str, Any] | None,
+        overrides_iter: Iterable[Dict[str, Any]],
+    ) -> Iterator[Self]:
+        """
+        Creates a config object for every overrides dictionary (e.g. tenant) on top of a shared base layer.
+        The base layer is loaded once from `base_sources` (the arguments of `from_sources`).
+        Every object validates only its overridden fields, as `init` values. The other values and fields details
+        are shared with the base layer without copying, so they must not be mutated in place.
+        Overrides of the map field, or of fields that are interpolated into other values, change more than the
+        overridden fields, so their objects are loaded from all the sources instead.
+
+        Raises:
+            ValidationError - If an overridden value is invalid.
+        """
+        base = cls.from_sources(**(base_sources or {}))
+        # Layered objects share the field hashes of the base, so hashing them here once saves hashing per object.
+        base._compute_field_hashes()
+        dependencies = base._layer_dependencies()
+        for overrides in overrides_iter:
+            layered = base._layer(overrides, dependencies)
+            if layered is None:
+                layered = cls.from_sources(**{**(base_sources or {}), **overrides})
+            yield layered
+
+    def _layer_dependencies(self) -> Set[str] | None:
+        """
+        Returns: The fields that other values depend on: the map field, which selects the map config, and the
+            fields that are interpolated into other values. None if every field may be one of them, since the
+            interpolations are not kept (provenance 'none').
+        """
+        specs = self.__specs__
+        dependencies = {specs.map_field} if specs.map_field else set()
+        if specs.interpolate:
+            if specs.provenance == "none":
+                return None
+            for field in self.__full_fields__.values():
+                dependencies.update(
+                    placeholder.partition(".")[0]
+                    for placeholder in field.interpolations
+                )
+        return dependencies
+
+    def _layer(
+        self, overrides: Dict[str, Any], dependencies: Set[str] | None
+    ) -> Self | None:
+        """
+        Args:
+            overrides: The overridden values by the field names.
+            dependencies: The fields that other values depend on (see `_layer_dependencies`).
+
+        Returns:
+            A copy of this object with the overridden fields validated and loaded as `init` values.
+            None if an overridden field is a dependency, so the object has to be loaded from all the sources.
+        """
+        cls = type(self)
+        specs = self.__specs__
+        base_manager: LoaderManager | None = object.__getattribute__(
+            self, LOADER_MANAGER_ATTR
+        )
+
+        priority = specs.source_priority
+        if ConfigSource.init in priority:
+            init_index = priority.index(ConfigSource.init)
+            base_fields = self.__full_fields__
+            # A value of the base layer from a higher priority source is not overridden.
+            overrides = {
+                name: value
+                for name, value in overrides.items()
+                if name not in base_fields
+                or priority.index(base_fields[name].source_type) >= init_index
+            }
+        else:
+            overrides = {}
+        if overrides and (
+            dependencies is None or not dependencies.isdisjoint(overrides)
+        ):
+            return None
+
+        obj = cls.__new__(cls)
+        obj.__setstate__(
+            {
+                "__dict__": dict(self.__dict__),
+                "__pydantic_fields_set__": set(self.__pydantic_fields_set__),
+                "__pydantic_extra__": self.__pydantic_extra__,
+                "__pydantic_private__": self.__pydantic_private__,
+            }
+        )
+
+        init_fields: Dict[str, ConfigField] = {}
+        for name, value in overrides.items():
+            cls.__pydantic_validator__.validate_assignment(obj, name, value)
+            init_fields[name] = ConfigField(
+                name=name,
+                value=obj.__dict__[name],
+                origin_value=value,
+                source_name=ConfigSource.init,
+                source_type=ConfigSource.init,
+                source_location=specs.creation_path,
+            )
+
+        loader_manager = _layered_loader_manager(
+            base_manager=base_manager, init_fields=init_fields, specs=specs
+        )
+
+        base_hashes: Dict[str, str] = object.__getattribute__(self, FIELD_HASHES_ATTR)
+        object.__setattr__(obj, SPECS_ATTR, specs)
+        object.__setattr__(obj, LOADER_MANAGER_ATTR, loader_manager)
+        object.__setattr__(
+            obj,
+            FIELD_HASHES_ATTR,
+            {
+                name: field_hash
+                for name, field_hash in base_hashes.items()
+                if name not in init_fields
+            },
+        )
+        object.__setattr__(obj, FINGERPRINT_ATTR, None)
+        object.__setattr__(obj, SERIALIZATION_CACHE_ATTR, {})
+        return obj
+
+    @classmethod
+    def iter_from_records(
+        cls,
+        records: str | Path | Iterable[Dict[str, Any]],
+        *,
+        chunk_size: int = RECORDS_CHUNK_SIZE,
+        processes: int | None = None,
+        **values: Any,
+    ) -> Iterator[Self | RecordError]:
+        """
+        Creates a config object for every record (e.g. host) of a JSON Lines file (`.jsonl`), a multi-document yaml
+        file or an iterable of dictionaries. The records are `init` values.
+        The other sources are loaded once for all the records, by the keyword arguments (e.g. `_files` and shared
+        `init` values), so only the records are validated for every object.
+        Records are parsed and validated one chunk at a time, so the input is never held in memory all together.
+
+        Args:
+            records: A records file path or an iterable of dictionaries.
+            chunk_size: The number of records that are validated together.
+            processes: The number of processes to validate the chunks with. Objects are still yielded in order.
+                The config class and the records have to be picklable.
+
+        Returns:
+            A generator of the config objects in the order of the records, with a `RecordError` in place of every
+            record that is not valid.
+
+        Raises:
+            ValueError - If the records file is not exists.
+            ValueError - If the records file format is not supported.
+        """
+        creation_path = get_caller_file_path()
+        parsed_records = parse_records(records)
+        base = cls._load_records_base(values=values, creation_path=creation_path)
+        return map_chunks(
+            function=_build_records_chunk,
+            context=base,
+            chunks=chunked(enumerate(parsed_records), chunk_size),
+            processes=processes,
+        )
+
+    @classmethod
+    def _load_records_base(
+        cls, values: Dict[str, Any], creation_path: str | Path
+    ) -> _RecordsBase:
+        """
+        Returns: The loaded sources that are shared by all the records, without validating them.
+        """
+        obj = cls.__new__(cls)
+        specs = obj._build_specs(
+            values=values,
+            class_path=get_class_file_path(cls=obj),
+            creation_path=creation_path,
+        )
+        loader_manager = LoaderManager(
+            settings_obj=obj,
+            source_priority=specs.source_priority,
+            interpolate=specs.interpolate,
+            parallel=specs.parallel_loading,
+        )
+        object.__setattr__(obj, SPECS_ATTR, specs)
+        object.__setattr__(obj, LOADER_MANAGER_ATTR, loader_manager)
+
+        cls._confident_loader_manager_context_ = loader_manager
+        cls._confident_specs_context_ = specs
+        try:
+            source_callables = cls.settings_customise_sources(
+                cls,
+                init_settings=InitSettingsSource(cls, init_kwargs=values),
+                env_settings=EnvSettingsSource(cls),
+                dotenv_settings=DotEnvSettingsSource(cls),
+                file_secret_settings=SecretsSettingsSource(cls),
+            )
+        finally:
+            del cls._confident_loader_manager_context_
+            del cls._confident_specs_context_
+
+        # The records take the place of the init source in the priority.
+        sources_values = [source_callable() for source_callable in source_callables]
+        init_index = (
+            specs.source_priority.index(ConfigSource.init)
+            if ConfigSource.init in specs.source_priority
+            else None
+        )
+        loader_manager.release(provenance=specs.provenance)
+        return _RecordsBase(
+            cls=cls,
+            specs=specs,
+            loader_manager=loader_manager,
+            lower_values=deep_merge(
+                *reversed(sources_values[init_index or 0 :]),
+            ),
+            higher_values=deep_merge(
+                *reversed(sources_values[: init_index or 0]),
+            ),
+            records_ignored=init_index is None,
+        )
+
     @property
     def __specs__(self) -> ConfigSpecs:
         """
@@ -220,12 +705,12 @@ class BaseConfig(BaseSettings):
     @property
     def __full_fields__(self) -> Dict[str, ConfigField]:
         """
-        Returns: A dictionary with details of every field.
+        Returns: A dictionary with details of every field. Empty if the object keeps no provenance.
         """
-        loader_manager: LoaderManager = object.__getattribute__(
+        loader_manager: LoaderManager | None = object.__getattribute__(
             self, LOADER_MANAGER_ATTR
         )
-        return loader_manager.full_fields
+        return {} if loader_manager is None else loader_manager.full_fields
 
     def full_fields(self) -> Dict[str, ConfigField]:
         return deepcopy(self.__full_fields__)
@@ -235,14 +720,336 @@ class BaseConfig(BaseSettings):
         """
         Returns: A dictionary with all the fields that were loaded before the prioritization classified by sources.
         """
-        loader_manager: LoaderManager = object.__getattribute__(
+        loader_manager: LoaderManager | None = object.__getattribute__(
             self, LOADER_MANAGER_ATTR
         )
-        return loader_manager.all_loaded_fields
+        return {} if loader_manager is None else loader_manager.all_loaded_fields
 
     def all_loaded_fields(self) -> Dict[ConfigSource, Dict[str, ConfigField]]:
         return deepcopy(self.__all_loaded_fields__)
 
+    @property
+    def __field_hashes__(self) -> Dict[str, str]:
+        return self._compute_field_hashes()
+
+    def _compute_field_hashes(self) -> Dict[str, str]:
+        """
+        Returns: A stable hash of every field value. Hashes are computed once and reused until the field changes.
+        """
+        try:
+            field_hashes: Dict[str, str] = object.__getattribute__(
+                self, FIELD_HASHES_ATTR
+            )
+        except AttributeError:
+            field_hashes = {}
+            object.__setattr__(self, FIELD_HASHES_ATTR, field_hashes)
+            object.__setattr__(self, FINGERPRINT_ATTR, None)
+
+        for name in type(self).model_fields:
+            if name not in field_hashes:
+                field_hashes[name] = stable_hash(getattr(self, name))
+        return field_hashes
+
+    def fingerprint(self) -> str:
+        """
+        Returns: A stable hash of the class and the resolved values, that can be used as a cache key.
+            Objects of the same class with equal values have the same fingerprint, also across processes.
+            The hashes are reset when a field is assigned, but not when a value is changed in place (e.g. appending
+            to a list field), so assign the changed value instead.
+        """
+        field_hashes = self.__field_hashes__
+        fingerprint: str | None = object.__getattribute__(self, FINGERPRINT_ATTR)
+        if fingerprint is None:
+            fingerprint = stable_hash(
+                {
+                    "class": f"{type(self).__module__}.{type(self).__qualname__}",
+                    "fields": field_hashes,
+                }
+            )
+            object.__setattr__(self, FINGERPRINT_ATTR, fingerprint)
+        return fingerprint
+
+    def diff(self, other: BaseConfig) -> List[ConfigFieldDiff]:
+        """
+        Compares the values of this object to another object of the same class.
+
+        Returns:
+            The fields that have different values, with their old (this object) and new (the other object)
+            values and sources.
+
+        Raises:
+            TypeError - If the other object is not of the same class.
+        """
+        if type(other) is not type(self):
+            raise TypeError(
+                f"Cannot diff {type(self).__name__} with {type(other).__name__}."
+            )
+        if self.fingerprint() == other.fingerprint():
+            return []
+
+        old_hashes, new_hashes = self.__field_hashes__, other.__field_hashes__
+        old_fields, new_fields = self.__full_fields__, other.__full_fields__
+        diffs = []
+        for name in type(self).model_fields:
+            if old_hashes[name] == new_hashes[name]:
+                continue
+            old_field, new_field = old_fields.get(name), new_fields.get(name)
+            diffs.append(
+                ConfigFieldDiff(
+                    name=name,
+                    old_value=getattr(self, name),
+                    new_value=getattr(other, name),
+                    old_source_type=old_field.source_type if old_field else None,
+                    old_source_location=(
+                        old_field.source_location if old_field else None
+                    ),
+                    new_source_type=new_field.source_type if new_field else None,
+                    new_source_location=(
+                        new_field.source_location if new_field else None
+                    ),
+                )
+            )
+        return diffs
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # type: ignore[override]
+        """
+        Same as pydantic `model_dump_json`. The result is memoized per arguments (e.g. `include`, `exclude`
+        and `indent`) until a field is assigned. Calls with a serialization `context` are not memoized.
+        """
+        return self._memoized(
+            key=_serialization_key("model_dump_json", kwargs),
+            serialize=lambda: super(BaseConfig, self).model_dump_json(**kwargs),
+        )
+
+    def provenance_json(self, indent: int | None = None) -> str:
+        """
+        Returns: The details of every field (`full_fields()`) as json, memoized until a field is assigned.
+            Values that were loaded from secrets are hidden.
+        """
+        return self._memoized(
+            key=("provenance_json", indent),
+            serialize=lambda: _FULL_FIELDS_ADAPTER.dump_json(
+                self.__full_fields__, indent=indent, fallback=str
+            ).decode(),
+        )
+
+    def write_provenance(self, file: IO[str]) -> None:
+        """
+        Writes the details of every field (`full_fields()`) as json to a text file, one field per line.
+        Fields are serialized one at a time, so the whole json is never held in memory.
+        Values that were loaded from secrets are hidden.
+        """
+        file.write("{")
+        separator = "\n"
+        for name, field in self.__full_fields__.items():
+            file.write(separator)
+            file.write(json.dumps(name))
+            file.write(": ")
+            file.write(
+                field.__pydantic_serializer__.to_json(field, fallback=str).decode()
+            )
+            separator = ",\n"
+        file.write("\n}")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Pickles only the resolved values, the details of every field and the specs.
+        Unpickling rebuilds the object without loading the sources again.
+        """
+        return _restore_config, (
+            type(self),
+            self.__dict__,
+            self.__pydantic_fields_set__,
+            self.__pydantic_extra__,
+            self.__pydantic_private__,
+            self.__full_fields__,
+            self.__specs__,
+        )
+
+    def freeze(self) -> FrozenConfig:
+        """
+        Returns: An immutable, hashable and cheaply picklable snapshot of the resolved values.
+            The values are frozen copies (e.g. lists as tuples), so later changes of this object do not change
+            the snapshot. Use `to_config()` on the snapshot to get a config object back.
+        """
+        frozen_cls = frozen_class(type(self))
+        return frozen_cls(
+            **{name: getattr(self, name) for name in type(self).model_fields}
+        )
+
+
+def _restore_config(
+    cls: type[BaseConfig],
+    values: Dict[str, Any],
+    fields_set: set[str],
+    extra: Dict[str, Any] | None,
+    private: Dict[str, Any] | None,
+    full_fields: Dict[str, ConfigField],
+    specs: ConfigSpecs,
+) -> BaseConfig:
+    """
+    Rebuilds a pickled config object. Only the fields that were chosen are restored in `all_loaded_fields`.
+    """
+    obj = cls.__new__(cls)
+    obj.__setstate__(
+        {
+            "__dict__": values,
+            "__pydantic_fields_set__": fields_set,
+            "__pydantic_extra__": extra,
+            "__pydantic_private__": private,
+        }
+    )
+
+    loader_manager: LoaderManager | None = None
+    if specs.provenance != "none":
+        loader_manager = LoaderManager(
+            settings_obj=None, source_priority=specs.source_priority
+        )
+        loader_manager.full_fields = full_fields
+        for name, field in full_fields.items():
+            loader_manager.all_loaded_fields.setdefault(field.source_type, {})[name] = (
+                field
+            )
+
+    object.__setattr__(obj, SPECS_ATTR, share_specs(specs))
+    object.__setattr__(obj, LOADER_MANAGER_ATTR, loader_manager)
+    object.__setattr__(obj, FIELD_HASHES_ATTR, {})
+    object.__setattr__(obj, FINGERPRINT_ATTR, None)
+    object.__setattr__(obj, SERIALIZATION_CACHE_ATTR, {})
+    return obj
+
+
+_FULL_FIELDS_ADAPTER = TypeAdapter(Dict[str, ConfigField])
+
+
+def _serialization_key(method: str, kwargs: Dict[str, Any]) -> Hashable | None:
+    """
+    Returns: A hashable key of serialization arguments, or None if they cannot be memoized.
+    """
+    if kwargs.get("context") is not None:
+        return None
+    try:
+        key = (
+            method,
+            frozenset((name, _freeze(value)) for name, value in kwargs.items()),
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns: A hashable form of `include` and `exclude` arguments (sets, lists and dictionaries).
+    """
+    if isinstance(value, dict):
+        return ("dict", frozenset((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return ("set", frozenset(_freeze(item) for item in value))
+    if isinstance(value, (list, tuple)):
+        return ("sequence", tuple(_freeze(item) for item in value))
+    return value
+
+
+class _RecordsBase(NamedTuple):
+    cls: type[BaseConfig]
+    specs: ConfigSpecs
+    loader_manager: LoaderManager
+    # The merged values of the sources below the records (including the shared `init` values), and above them.
+    lower_values: Dict[str, Any]
+    higher_values: Dict[str, Any]
+    # Whether the records are not loaded, since `init` is not in the source priority.
+    records_ignored: bool
+
+
+def _build_records_chunk(
+    base: _RecordsBase, chunk: List[Tuple[int, Dict[str, Any] | RecordError]]
+) -> List[BaseConfig | RecordError]:
+    """
+    Returns: A config object for every record of the chunk, or a `RecordError` if the record is not valid.
+    """
+    results: List[BaseConfig | RecordError] = []
+    for index, record in chunk:
+        if isinstance(record, RecordError):
+            results.append(record)
+            continue
+        try:
+            results.append(_build_record(base=base, record=record))
+        except ValidationError as error:
+            results.append(RecordError(position=index, record=record, error=error))
+    return results
+
+
+def _build_record(base: _RecordsBase, record: Dict[str, Any]) -> BaseConfig:
+    """
+    Returns: A config object of the record values on top of the shared sources.
+
+    Raises:
+        ValidationError - If the values are not valid.
+    """
+    cls, specs = base.cls, base.specs
+    if base.records_ignored:
+        record = {}
+    obj = cls.__new__(cls)
+    # Same as pydantic `BaseModel.__init__`, without loading the sources again.
+    cls.__pydantic_validator__.validate_python(
+        deep_merge(base.lower_values, record, base.higher_values),
+        self_instance=obj,
+    )
+
+    init_fields: Dict[str, ConfigField] = {}
+    for name, value in record.items():
+        if name not in cls.model_fields or name in base.higher_values:
+            continue
+        init_fields[name] = ConfigField(
+            name=name,
+            value=obj.__dict__[name],
+            origin_value=value,
+            source_name=ConfigSource.init,
+            source_type=ConfigSource.init,
+            source_location=specs.creation_path,
+        )
+
+    object.__setattr__(obj, SPECS_ATTR, specs)
+    object.__setattr__(
+        obj,
+        LOADER_MANAGER_ATTR,
+        _layered_loader_manager(
+            base_manager=base.loader_manager, init_fields=init_fields, specs=specs
+        ),
+    )
+    object.__setattr__(obj, FIELD_HASHES_ATTR, {})
+    object.__setattr__(obj, FINGERPRINT_ATTR, None)
+    object.__setattr__(obj, SERIALIZATION_CACHE_ATTR, {})
+    return obj
+
+
+def _layered_loader_manager(
+    base_manager: LoaderManager | None,
+    init_fields: Dict[str, ConfigField],
+    specs: ConfigSpecs,
+) -> LoaderManager | None:
+    """
+    Returns: A loader manager with the fields of a base loader manager, and `init` fields on top of them.
+        None if the objects keep no provenance.
+    """
+    if base_manager is None or specs.provenance == "none":
+        return None
+    loader_manager = LoaderManager(
+        settings_obj=None, source_priority=specs.source_priority
+    )
+    loader_manager.full_fields = {**base_manager.full_fields, **init_fields}
+    loader_manager.all_loaded_fields = {
+        **base_manager.all_loaded_fields,
+        ConfigSource.init: {
+            **base_manager.all_loaded_fields.get(ConfigSource.init, {}),
+            **init_fields,
+        },
+    }
+    loader_manager.release(provenance=specs.provenance)
+    return loader_manager
+
 
 class Confident(BaseConfig):
     pass
@@ -7,15 +7,32 @@ from pydantic._internal._config import config_keys
 from pydantic_settings import SettingsConfigDict
 
 from confident.config_source import ConfigSource
+from confident.specs import ProvenanceLevel
 
 
 class ConfidentConfigDict(SettingsConfigDict, total=False):  # type: ignore[misc]
     files: str | Path | List[str | Path]
     ignore_missing_files: bool
+    deep_merge_files: bool
+    file_cache_dir: str | Path
+    env_files: str | Path | List[str | Path]
+    sqlite_path: str | Path
+    sqlite_table: str
+    sqlite_scope: str
+    sqlite_read_only: bool
+    remote_url: str
+    remote_timeout: float
+    remote_cache_dir: str | Path
     map_name: str
     map_field: str
     config_map: Path | Dict[str, Any]
     source_priority: List[ConfigSource]
+    interpolate: bool
+    parallel_loading: bool
+    validation_memo: bool
+    provenance: ProvenanceLevel
+    bundle: str | Path
+    bundle_root: str | Path
     specs: Any
     specs_path: str | Path
 
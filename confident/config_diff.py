@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from confident.config_source import ConfigSource
+
+
+class ConfigFieldDiff(BaseModel):
+    """
+    Holds details of a single configuration variable that has a different value in two config objects.
+    """
+
+    name: str
+    old_value: Any
+    new_value: Any
+    old_source_type: ConfigSource | None = None
+    old_source_location: str | Path | None = None
+    new_source_type: ConfigSource | None = None
+    new_source_location: str | Path | None = None
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, SecretStr, field_serializer
 
 from confident.config_source import ConfigSource
 
@@ -19,6 +19,10 @@ class ConfigField(BaseModel):
     source_name: str
     source_type: ConfigSource
     source_location: str | Path
+    # Details of the leaf values of nested fields, by their dotted path (e.g. 'pool.size').
+    nested_fields: Dict[str, ConfigField] = {}
+    # Details of the values that were substituted into `${...}` templates, by their placeholder (e.g. 'DB_HOST').
+    interpolations: Dict[str, ConfigField] = {}
 
     def __init__(self, value: Any, **kwargs):
         try:
@@ -26,3 +30,74 @@ class ConfigField(BaseModel):
         except KeyError:
             origin_value = value
         super().__init__(value=value, origin_value=origin_value, **kwargs)
+
+    def __repr_args__(self):
+        for key, value in super().__repr_args__():
+            if key in ("nested_fields", "interpolations") and not value:
+                continue
+            # Values loaded from secrets are hidden the same way as their `SecretStr` origin value.
+            if key == "value" and self.source_type is ConfigSource.secrets:
+                value = SecretStr(str(value))
+            yield key, value
+
+    @field_serializer("value", "origin_value", when_used="json")
+    def _serialize_value(self, value: Any) -> Any:
+        # Values loaded from secrets are hidden in json, the same way as in the repr.
+        if self.source_type is ConfigSource.secrets:
+            return SecretStr(str(value))
+        return value
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickles the attributes as a tuple, and restores them without validation.
+        return _restore_config_field, (
+            self.name,
+            self.value,
+            self.origin_value,
+            self.source_name,
+            self.source_type,
+            self.source_location,
+            self.nested_fields or None,
+            self.interpolations or None,
+        )
+
+
+_CONFIG_FIELD_FIELDS_SET = {
+    "name",
+    "value",
+    "origin_value",
+    "source_name",
+    "source_type",
+    "source_location",
+}
+
+
+def _restore_config_field(
+    name: str,
+    value: Any,
+    origin_value: Any,
+    source_name: str,
+    source_type: ConfigSource,
+    source_location: str | Path,
+    nested_fields: Dict[str, ConfigField] | None,
+    interpolations: Dict[str, ConfigField] | None = None,
+) -> ConfigField:
+    # Same as pydantic unpickling, which is faster than `model_construct` since it does not apply defaults.
+    field = ConfigField.__new__(ConfigField)
+    field.__setstate__(
+        {
+            "__dict__": {
+                "name": name,
+                "value": value,
+                "origin_value": origin_value,
+                "source_name": source_name,
+                "source_type": source_type,
+                "source_location": source_location,
+                "nested_fields": nested_fields or {},
+                "interpolations": interpolations or {},
+            },
+            "__pydantic_fields_set__": _CONFIG_FIELD_FIELDS_SET,
+            "__pydantic_extra__": None,
+            "__pydantic_private__": None,
+        }
+    )
+    return field
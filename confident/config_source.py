@@ -8,6 +8,10 @@ class ConfigSource(str, Enum):
 
     init = "init"
     env_var = "env_var"
+    dotenv = "dotenv"
+    secrets = "secrets"
+    sqlite = "sqlite"
+    remote = "remote"
     map = "map"
     file = "file"
     class_default = "class_default"
@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml  # type: ignore[import-untyped]
+
+from confident.bundle import read_bytes, split_bundle_path
+from confident.utils import (
+    YAML_LOADER,
+    parse_file,
+    parse_file_content,
+    split_file_suffixes,
+)
+
+# Changes whenever the parsing or the cache format changes, so entries of other versions are not used.
+PARSER_VERSION = (
+    f"2:marshal-{marshal.version}:yaml-{yaml.__version__}-{YAML_LOADER.__name__}"
+)
+CACHE_FILE_SUFFIX = ".confident-cache"
+CACHE_INDEX_SUFFIX = ".confident-index"
+CACHE_TEMP_PREFIX = ".tmp-"
+FILE_CACHE_MAX_BYTES_DEFAULT = 64 * 1024 * 1024
+
+FileIdentity = Tuple[int, int, int]
+
+# Parsed config files cached by path and validated by the file inode, modification time and size.
+_files_cache: Dict[str, Tuple[FileIdentity, Dict[str, Any]]] = {}
+
+
+def load_cached_file(
+    path: Path | str,
+    cache_dir: Path | str | None = None,
+    identity: FileIdentity | None = None,
+) -> Dict[str, Any]:
+    """
+    Loads fields from a file into a dictionary, like `load_file`.
+    The parsed content is reused from previous loads as long as the file inode, modification time and size
+    are unchanged, so the returned dictionary is shared and must not be mutated.
+    With a `cache_dir`, the parsed content is also persisted for other processes (see `load_persisted_file`).
+    Files inside a bundle (e.g. 'bundle.zip!/config.yaml') are validated by the identity of the bundle.
+    An `identity` that the caller has just read saves the `stat` of the file.
+
+    Raises:
+        ValueError - If the file is not exists.
+        ValueError - If the file format is not supported.
+        ValueError - If the loaded data is not a dict.
+    """
+    split_path = split_bundle_path(path)
+    if identity is None:
+        try:
+            stat = os.stat(split_path[0] if split_path else path)
+        except FileNotFoundError:
+            raise ValueError(f"{path=} is not exists.")
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    cached = _files_cache.get(str(path))
+    if cached and cached[0] == identity:
+        return cached[1]
+
+    if split_path:
+        loaded = parse_file_content(path=Path(path), content=read_bytes(path))
+    elif cache_dir is None:
+        loaded = parse_file(Path(path))
+    else:
+        loaded = load_persisted_file(path=path, cache_dir=cache_dir, identity=identity)
+    _files_cache[str(path)] = (identity, loaded)
+    return loaded
+
+
+# The size of the entries in every cache directory, as counted by this process since it last scanned the directory.
+_cache_dir_sizes: Dict[str, int] = {}
+
+# Tags of the values that marshal does not support, in encoded content. Every tuple of encoded content is tagged,
+# so tags are unambiguous.
+_TUPLE_TAG = "\x00tuple"
+_DATE_TAG = "\x00date"
+_DATETIME_TAG = "\x00datetime"
+_MARSHAL_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def load_persisted_file(
+    path: Path | str,
+    cache_dir: Path | str,
+    identity: FileIdentity | None = None,
+    max_bytes: int = FILE_CACHE_MAX_BYTES_DEFAULT,
+) -> Dict[str, Any]:
+    """
+    Loads a parsed config file from a cache directory, which can be shared by many processes.
+    Content entries hold the parsed content of a file and are named by the content hash and the parser version,
+    so files with the same content share an entry. Index entries map the path of a file to its identity
+    (inode, modification time and size) and to the content entry. The content entry is used if the identity is
+    unchanged, or else if an entry of the hash of the current content exists. Otherwise, the file is parsed.
+    Entries are written atomically and hold only plain data (encoded by `marshal`), so loading them can't run code.
+
+    Args:
+        path: Path to the config file.
+        cache_dir: The cache directory. Created if not exists.
+        identity: The identity of the file, if it is already known.
+        max_bytes: The maximum size of the cache directory. The least recently written entries are evicted.
+
+    Raises:
+        ValueError - If the file is not exists.
+        ValueError - If the file format is not supported.
+        ValueError - If the loaded data is not a dict.
+    """
+    path = Path(path)
+    cache_dir = Path(cache_dir)
+    if identity is None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise ValueError(f"{path=} is not exists.")
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    index_path = cache_dir / _index_name(path)
+    index = _read_index(index_path)
+    if index is not None and index[0] == tuple(identity):
+        loaded = _read_content(cache_dir / index[1])
+        if loaded is not None:
+            return loaded
+
+    compressed = split_file_suffixes(path)[1] is not None
+    if compressed:
+        # Compressed files are hashed and parsed as streams, so their content is never read into memory at once.
+        with open(path, mode="rb") as file:
+            content_name = _content_name(
+                hashlib.file_digest(file, _new_content_hash).digest()
+            )
+    else:
+        content = path.read_bytes()
+        content_name = _content_name(content)
+    loaded = _read_content(cache_dir / content_name)
+    if loaded is None:
+        if compressed:
+            loaded = parse_file(path)
+            stat = os.stat(path)
+            if (stat.st_ino, stat.st_mtime_ns, stat.st_size) != tuple(identity):
+                # The file changed while it was hashed or parsed, so the content may not match the hash.
+                return loaded
+        else:
+            loaded = parse_file_content(path=path, content=content)
+        try:
+            encoded = marshal.dumps((PARSER_VERSION, False, loaded))
+        except ValueError:
+            # Only content with values that marshal does not support (e.g. dates) is decoded on every read.
+            try:
+                encoded = marshal.dumps((PARSER_VERSION, True, _encode(loaded)))
+            except ValueError:
+                return loaded
+        _write_entry(cache_dir / content_name, encoded, max_bytes=max_bytes)
+
+    _write_entry(
+        index_path,
+        marshal.dumps((PARSER_VERSION, tuple(identity), content_name)),
+        max_bytes=max_bytes,
+    )
+    return loaded
+
+
+def clear_file_cache(cache_dir: Path | str) -> int:
+    """
+    Removes all the entries of a cache directory.
+
+    Returns:
+        The number of removed entries.
+    """
+    _cache_dir_sizes.pop(str(cache_dir), None)
+    removed = 0
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        if _is_entry(entry.name) or entry.name.startswith(CACHE_TEMP_PREFIX):
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def _is_entry(name: str) -> bool:
+    return name.endswith(CACHE_FILE_SUFFIX) or name.endswith(CACHE_INDEX_SUFFIX)
+
+
+def _index_name(path: Path) -> str:
+    real_path = os.path.realpath(path)
+    return f"{hashlib.blake2b(real_path.encode(), digest_size=16).hexdigest()}{CACHE_INDEX_SUFFIX}"
+
+
+def _new_content_hash() -> Any:
+    return hashlib.blake2b(digest_size=16)
+
+
+def _content_name(content: bytes) -> str:
+    """
+    Returns: The name of the content entry of a content (or of the hash of a compressed content).
+    """
+    content_hash = _new_content_hash()
+    content_hash.update(content)
+    content_hash.update(PARSER_VERSION.encode())
+    return f"{content_hash.hexdigest()}{CACHE_FILE_SUFFIX}"
+
+
+def _load_entry(entry_path: Path) -> Tuple[Any, ...] | None:
+    """
+    Returns: The values of the entry after the parser version,
+        or None if there is no valid entry of the current parser version.
+    """
+    try:
+        entry = marshal.loads(entry_path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or not entry or entry[0] != PARSER_VERSION:
+        return None
+    return entry[1:]
+
+
+def _read_index(index_path: Path) -> Tuple[Tuple[Any, ...], str] | None:
+    """
+    Returns: The file identity and the content entry name of the index entry, or None if there is no valid index entry.
+    """
+    index = _load_entry(index_path)
+    if (
+        index is None
+        or len(index) != 2
+        or not isinstance(index[1], str)
+        or not index[1].endswith(CACHE_FILE_SUFFIX)
+        or os.sep in index[1]
+    ):
+        return None
+    return index[0], index[1]
+
+
+def _read_content(entry_path: Path) -> Dict[str, Any] | None:
+    """
+    Returns: The parsed content of the content entry, or None if there is no valid content entry.
+    """
+    entry = _load_entry(entry_path)
+    if entry is None or len(entry) != 2:
+        return None
+    is_encoded, loaded = entry
+    if is_encoded:
+        try:
+            loaded = _decode(loaded)
+        except (ValueError, TypeError):
+            return None
+    return loaded if isinstance(loaded, dict) else None
+
+
+def _encode(value: Any) -> Any:
+    """
+    Converts parsed content to values that marshal supports.
+
+    Raises:
+        ValueError - If the content has a value of an unsupported type.
+    """
+    if isinstance(value, dict):
+        return {_encode(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return (_TUPLE_TAG, tuple(_encode(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return type(value)(_encode(item) for item in value)
+    if isinstance(value, datetime.datetime):
+        return (_DATETIME_TAG, value.isoformat())
+    if isinstance(value, datetime.date):
+        return (_DATE_TAG, value.isoformat())
+    if isinstance(value, _MARSHAL_TYPES):
+        return value
+    raise ValueError(f"{type(value)=} is not supported by the file cache.")
+
+
+def _decode(value: Any) -> Any:
+    """
+    Converts encoded values back to the parsed content.
+
+    Raises:
+        ValueError - If the value is not a valid encoded value.
+    """
+    if isinstance(value, dict):
+        return {_decode(key): _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, tuple):
+        tag, item = value
+        if tag == _TUPLE_TAG:
+            return tuple(_decode(element) for element in item)
+        if tag == _DATETIME_TAG:
+            return datetime.datetime.fromisoformat(item)
+        if tag == _DATE_TAG:
+            return datetime.date.fromisoformat(item)
+        raise ValueError(f"{tag=} is not supported by the file cache.")
+    if isinstance(value, (set, frozenset)):
+        return type(value)(_decode(item) for item in value)
+    if isinstance(value, _MARSHAL_TYPES):
+        return value
+    raise ValueError(f"{type(value)=} is not supported by the file cache.")
+
+
+def _write_entry(entry_path: Path, data: bytes, max_bytes: int) -> None:
+    """
+    Writes an entry atomically, so other processes read either the old or the new entry.
+    The cache directory is scanned for eviction only when the size counted by this process is over `max_bytes`.
+    Failures are ignored, since the cache is only an optimization.
+    """
+    cache_dir = entry_path.parent
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(
+            prefix=CACHE_TEMP_PREFIX, dir=cache_dir
+        )
+        try:
+            with os.fdopen(file_descriptor, mode="wb") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        size = _cache_dir_sizes.get(str(cache_dir))
+        if size is None:
+            size = sum(entry[1] for entry in _scan_entries(cache_dir))
+        else:
+            size += len(data)
+        if size > max_bytes:
+            size = _evict_entries(cache_dir, max_bytes=max_bytes)
+        _cache_dir_sizes[str(cache_dir)] = size
+    except OSError:
+        pass
+
+
+def _scan_entries(cache_dir: Path) -> List[Tuple[int, int, str]]:
+    """
+    Returns: The modification time, size and path of every entry in the cache directory.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if not _is_entry(entry.name):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    return entries
+
+
+def _evict_entries(cache_dir: Path, max_bytes: int) -> int:
+    """
+    Removes the least recently written entries until the cache directory is smaller than 3/4 of `max_bytes`,
+    so the next writes do not scan the directory again right away.
+
+    Returns:
+        The size of the remaining entries.
+    """
+    entries = _scan_entries(cache_dir)
+    total_size = sum(entry[1] for entry in entries)
+    for _, size, entry_path in sorted(entries):
+        if total_size <= max_bytes * 3 // 4:
+            break
+        try:
+            os.remove(entry_path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+    return total_size
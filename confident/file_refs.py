@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from confident import bundle
+from confident.file_cache import load_cached_file
+from confident.session import current_session
+
+# A dictionary with this key is replaced by the content of the referenced file.
+# Other keys next to it override the keys of the referenced content.
+REF_KEY = "$ref"
+
+KeyPath = Tuple[Any, ...]
+FileIdentity = Tuple[int, int, int]
+
+
+class ResolvedFile(NamedTuple):
+    """
+    The content of a config file with all its references replaced by the content of the referenced files.
+    """
+
+    path: Path
+    content: Dict[str, Any]
+    # The file that supplied the values under every key path that was included from another file.
+    locations: Dict[KeyPath, Path]
+    # The inode, modification time and size of every file the content was resolved from.
+    identities: Dict[str, FileIdentity]
+    # The locations of the nested key paths (longer than one key) by their top level key,
+    # so a single key is looked up without going over the locations of the whole file.
+    nested_locations: Dict[Any, Dict[KeyPath, Path]] = {}
+
+    def location(self, key_path: KeyPath) -> Path:
+        """
+        Returns: The file that supplied the value under the key path.
+        """
+        for index in range(len(key_path), -1, -1):
+            location = self.locations.get(key_path[:index])
+            if location is not None:
+                return location
+        return self.path
+
+
+# Resolved files cached by their real path, and validated by the identities of all the files they were resolved from.
+_resolved_cache: Dict[str, ResolvedFile] = {}
+
+
+class RefResolver:
+    """
+    Resolves the `$ref` references of config files as a graph.
+    Every file is resolved once per resolver, even when it is referenced from many places, and every file
+    identity is checked once per resolver, even when it is shared by many files (e.g. the files of a bundle).
+    Use a new resolver for every load. Inside a `ConfigSession`, all the resolvers share the resolved files and
+    the checked identities, so every file is resolved and checked once per session.
+    """
+
+    def __init__(self, cache_dir: Path | str | None = None) -> None:
+        """
+        Args:
+            cache_dir: A directory to persist the parsed files in (see `load_persisted_file`).
+        """
+        self.cache_dir = cache_dir
+        session = current_session()
+        self._resolved: Dict[str, ResolvedFile] = (
+            session.resolved_files if session else {}
+        )
+        self._identities: Dict[str, FileIdentity | None] = (
+            session.file_identities if session else {}
+        )
+        self._stack: List[str] = []
+
+    def resolve(self, path: Path | str) -> ResolvedFile:
+        """
+        Returns: The resolved content of the file.
+
+        Raises:
+            ValueError - If the file or a referenced file is not exists or is not a valid config file.
+            ValueError - If the references are circular.
+        """
+        real_path = bundle.real_path(path)
+        resolved = self._resolved.get(real_path)
+        if resolved is not None:
+            return resolved
+
+        if real_path in self._stack:
+            cycle = [*self._stack[self._stack.index(real_path) :], real_path]
+            raise ValueError(f"Circular `{REF_KEY}` references: {' -> '.join(cycle)}.")
+
+        resolved = _resolved_cache.get(real_path)
+        if resolved is None or not self._is_unchanged(resolved.identities):
+            self._stack.append(real_path)
+            try:
+                resolved = self._resolve_file(Path(path), real_path)
+            finally:
+                self._stack.pop()
+            _resolved_cache[real_path] = resolved
+
+        self._resolved[real_path] = resolved
+        return resolved
+
+    def _file_identity(self, path: str) -> FileIdentity | None:
+        if path not in self._identities:
+            self._identities[path] = _file_identity(path)
+        return self._identities[path]
+
+    def _is_unchanged(self, identities: Dict[str, FileIdentity]) -> bool:
+        return all(
+            self._file_identity(path) == identity
+            for path, identity in identities.items()
+        )
+
+    def _resolve_file(self, path: Path, real_path: str) -> ResolvedFile:
+        # Files inside a bundle are identified by the bundle, so they are validated with a single `stat`.
+        identity_path = bundle.identity_path(path)
+        identity = self._file_identity(identity_path)
+        if identity is None:
+            raise ValueError(f"{path=} is not exists.")
+
+        locations: Dict[KeyPath, Path] = {}
+        identities = {identity_path: identity}
+        content = self._resolve_value(
+            value=load_cached_file(path, cache_dir=self.cache_dir, identity=identity),
+            path=path,
+            key_path=(),
+            locations=locations,
+            identities=identities,
+        )
+        nested_locations: Dict[Any, Dict[KeyPath, Path]] = {}
+        for key_path, location in locations.items():
+            if len(key_path) > 1:
+                nested_locations.setdefault(key_path[0], {})[key_path] = location
+        return ResolvedFile(
+            path=path,
+            content=content,
+            locations=locations,
+            identities=identities,
+            nested_locations=nested_locations,
+        )
+
+    def _resolve_value(
+        self,
+        value: Any,
+        path: Path,
+        key_path: KeyPath,
+        locations: Dict[KeyPath, Path],
+        identities: Dict[str, FileIdentity],
+    ) -> Any:
+        """
+        Returns: The value with its references replaced. Values without references are returned as is.
+        """
+        if isinstance(value, dict):
+            items = value.items()
+        elif isinstance(value, list):
+            items = enumerate(value)  # type: ignore[assignment]
+        else:
+            return value
+
+        resolved_items = {}
+        item_locations: Dict[KeyPath, Path] = {}
+        changed = False
+        for key, item in items:
+            if key == REF_KEY:
+                continue
+            resolved_item = self._resolve_value(
+                value=item,
+                path=path,
+                key_path=(*key_path, key),
+                locations=item_locations,
+                identities=identities,
+            )
+            resolved_items[key] = resolved_item
+            changed = changed or resolved_item is not item
+
+        if isinstance(value, dict) and REF_KEY in value:
+            ref_path = Path(path).parent / value[REF_KEY]
+            included = self.resolve(ref_path)
+            identities.update(included.identities)
+            locations[key_path] = included.path
+            # The keys next to the reference are supplied by the current file.
+            overridden_keys = set(resolved_items)
+            for included_path, location in included.locations.items():
+                if not included_path or included_path[0] not in overridden_keys:
+                    locations[(*key_path, *included_path)] = location
+            for key in overridden_keys:
+                locations[(*key_path, key)] = path
+            locations.update(item_locations)
+            return {**included.content, **resolved_items}
+
+        locations.update(item_locations)
+        if not changed:
+            return value
+        if isinstance(value, list):
+            return list(resolved_items.values())
+        return resolved_items
+
+
+def _file_identity(path: Path | str) -> FileIdentity | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
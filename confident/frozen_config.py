@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Tuple
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+from confident.config_source import ConfigSource
+from confident.utils import stable_hash
+
+FROZEN_CLASS_PREFIX = "Frozen"
+
+# The generated frozen class of every config class.
+_frozen_classes: WeakKeyDictionary[type, type[FrozenConfig]] = WeakKeyDictionary()
+
+
+class FrozenDict(Mapping[Any, Any]):
+    """
+    A read-only and hashable dictionary, used for the dict values of frozen snapshots.
+    """
+
+    __slots__ = ("_items", "_hash")
+
+    _items: Dict[Any, Any]
+
+    def __init__(self, items: Dict[Any, Any]) -> None:
+        object.__setattr__(self, "_items", items)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._items[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen.")
+
+    def __hash__(self) -> int:
+        try:
+            return object.__getattribute__(self, "_hash")  # type: ignore[no-any-return]
+        except AttributeError:
+            items_hash = hash(frozenset(self._items.items()))
+            object.__setattr__(self, "_hash", items_hash)
+            return items_hash
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenDict, (self._items,)
+
+
+class FrozenConfig:
+    """
+    An immutable snapshot of the resolved values of a config object.
+    Every config class has a generated subclass with a slot for every field, so reading attributes is as cheap
+    as reading a plain object attribute. Objects are compared and hashed by their values,
+    and are pickled as the config class and a tuple of the values.
+    The values are frozen recursively when the snapshot is created: lists and tuples become tuples, sets become
+    frozensets, dicts become a `FrozenDict` and models become frozen snapshots of their own class, so neither
+    changing the config object nor the values of the snapshot can change the snapshot.
+    """
+
+    __slots__ = ("_hash",)
+
+    # Field names cannot start with an underscore, so the names of the internals never collide with fields.
+    _config_class: ClassVar[type]
+    _field_names: ClassVar[Tuple[str, ...]]
+
+    def __init__(self, **values: Any) -> None:
+        for name in self._field_names:
+            object.__setattr__(self, name, freeze_value(values[name]))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen.")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        try:
+            return object.__getattribute__(self, "_hash")  # type: ignore[no-any-return]
+        except AttributeError:
+            try:
+                value_hash = hash(self._values())
+            except TypeError:
+                # Values of unhashable types that are not frozen are hashed by their json representation.
+                value_hash = hash(
+                    stable_hash(dict(zip(self._field_names, self._values())))
+                )
+            object.__setattr__(self, "_hash", value_hash)
+            return value_hash
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._field_names
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _restore_frozen_config, (self._config_class, self._values())
+
+    def _values(self) -> Tuple[Any, ...]:
+        """
+        Returns: The field values, in the order of the fields declaration.
+        """
+        return tuple(getattr(self, name) for name in self._field_names)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns: The values converted back to plain lists, sets and dicts (nested snapshots to dicts too),
+            as a copy, so changing it does not change the snapshot.
+        """
+        return {name: thaw_value(getattr(self, name)) for name in self._field_names}
+
+    def to_config(self) -> Any:
+        """
+        Creates a config object of the original class with the values of the snapshot.
+        Only the values of the snapshot are loaded (as `init` source), without loading the other sources again.
+        """
+        return self._config_class(
+            **self.to_dict(), _source_priority=[ConfigSource.init]
+        )
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Returns: An immutable copy of a value: lists and tuples as tuples, sets as frozensets, dicts as a `FrozenDict`
+        and models as frozen snapshots, recursively. Other values are deep copied.
+    """
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(
+            {freeze_value(key): freeze_value(item) for key, item in value.items()}
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_value(item) for item in value)
+    if isinstance(value, (FrozenConfig, FrozenDict)):
+        return value
+    if isinstance(value, BaseModel):
+        return frozen_class(type(value))(
+            **{name: getattr(value, name) for name in type(value).model_fields}
+        )
+    return deepcopy(value)
+
+
+def thaw_value(value: Any) -> Any:
+    """
+    Returns: A mutable copy of a frozen value: tuples as lists, frozensets as sets, and frozen dicts and
+        snapshots as dicts, recursively.
+    """
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    if isinstance(value, FrozenDict):
+        return {thaw_value(key): thaw_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(item) for item in value]
+    if isinstance(value, frozenset):
+        return {thaw_value(item) for item in value}
+    if isinstance(value, FrozenConfig):
+        return value.to_dict()
+    return deepcopy(value)
+
+
+def frozen_class(config_class: type) -> type[FrozenConfig]:
+    """
+    Returns: The frozen class of a config class. The class is generated once for every config class.
+    """
+    frozen_cls = _frozen_classes.get(config_class)
+    if frozen_cls is None:
+        field_names = tuple(config_class.model_fields)  # type: ignore[attr-defined]
+        frozen_cls = type(
+            f"{FROZEN_CLASS_PREFIX}{config_class.__name__}",
+            (FrozenConfig,),
+            {
+                "__slots__": field_names,
+                "__module__": config_class.__module__,
+                "_config_class": config_class,
+                "_field_names": field_names,
+            },
+        )
+        _frozen_classes[config_class] = frozen_cls
+    return frozen_cls
+
+
+def _restore_frozen_config(config_class: type, values: Tuple[Any, ...]) -> FrozenConfig:
+    frozen_cls = frozen_class(config_class)
+    frozen = object.__new__(frozen_cls)
+    for name, value in zip(frozen_cls._field_names, values):
+        object.__setattr__(frozen, name, value)
+    return frozen
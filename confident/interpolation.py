@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+
+# `${NAME}` placeholders, and `$$` that escapes a `$` (e.g. `$${NAME}` is rendered as `${NAME}`).
+_PLACEHOLDER_PATTERN = re.compile(r"\$\$|\$\{([^}]*)\}")
+TEMPLATES_CACHE_SIZE = 4096
+
+# The sources whose values are interpolated.
+INTERPOLATED_SOURCES = (
+    ConfigSource.env_var,
+    ConfigSource.dotenv,
+    ConfigSource.map,
+    ConfigSource.file,
+)
+
+# A template is a tuple of literal text parts, each followed by a placeholder name (None at the end).
+Template = Tuple[Tuple[str, str | None], ...]
+
+
+@lru_cache(maxsize=TEMPLATES_CACHE_SIZE)
+def compile_template(text: str) -> Template:
+    """
+    Parses a string with `${NAME}` placeholders. Templates are cached by their string.
+
+    Returns:
+        A tuple of the literal parts and the placeholder name that follows each of them.
+    """
+    parts = []
+    position = 0
+    literal = ""
+    for match in _PLACEHOLDER_PATTERN.finditer(text):
+        literal += text[position : match.start()]
+        position = match.end()
+        if match.group(1) is None:
+            literal += "$"
+            continue
+        parts.append((literal, match.group(1).strip()))
+        literal = ""
+    parts.append((literal + text[position:], None))
+    return tuple(parts)
+
+
+class Interpolator:
+    """
+    Renders the `${NAME}` templates in the loaded values of a single load.
+    A placeholder is replaced by the chosen value of the field with the same name (a dotted path such as
+    `db.host` refers to a nested value), or else by the environment variable with the same name.
+    Fields are rendered in the order of their dependencies, and environment variables are read from a single
+    snapshot of the environment.
+    """
+
+    def __init__(
+        self,
+        full_fields: Mapping[str, ConfigField],
+        convert: Callable[[str, Any], Any],
+        environ: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Args:
+            full_fields: The chosen field of every field name.
+            convert: Converts a rendered value of a field (by its name) to the type of the field.
+            environ: The environment variables. Defaults to a snapshot of `os.environ` that is taken when needed.
+        """
+        self.full_fields = full_fields
+        self.convert = convert
+        self._environ = environ
+        self._rendered: Dict[str, ConfigField] = {}
+        self._stack: List[str] = []
+
+    @property
+    def environ(self) -> Mapping[str, str]:
+        if self._environ is None:
+            self._environ = dict(os.environ)
+        return self._environ
+
+    def render_chosen_field(self, name: str) -> ConfigField:
+        """
+        Returns: The chosen field of the name with its templates rendered.
+
+        Raises:
+            ValueError - If the templates of the fields refer to each other in a circle.
+        """
+        rendered = self._rendered.get(name)
+        if rendered is not None:
+            return rendered
+        if name in self._stack:
+            cycle = [*self._stack[self._stack.index(name) :], name]
+            raise ValueError(f"Circular interpolation: {' -> '.join(cycle)}.")
+
+        field = self.full_fields[name]
+        if field.source_type in INTERPOLATED_SOURCES:
+            self._stack.append(name)
+            try:
+                field = self.render_field(field)
+            finally:
+                self._stack.pop()
+        self._rendered[name] = field
+        return field
+
+    def render_field(self, field: ConfigField) -> ConfigField:
+        """
+        Returns: The field with its templates rendered. The same field is returned if it has no templates.
+            The original templates are kept in `origin_value`.
+
+        Raises:
+            ValueError - If a placeholder has no matching field or environment variable.
+            ValueError - If the templates of the fields refer to each other in a circle.
+        """
+        interpolations: Dict[str, ConfigField] = {}
+        value = self._render(field.value, field.name, interpolations)
+        if value is field.value:
+            return field
+        if isinstance(value, str):
+            value = self.convert(field.name, value)
+
+        return ConfigField(
+            name=field.name,
+            value=value,
+            origin_value=field.origin_value,
+            source_name=field.source_name,
+            source_type=field.source_type,
+            source_location=field.source_location,
+            nested_fields=field.nested_fields,
+            interpolations=interpolations,
+        )
+
+    def _render(
+        self, value: Any, field_name: str, interpolations: Dict[str, ConfigField]
+    ) -> Any:
+        """
+        Returns: The value with its templates rendered. Values without templates are returned as is.
+        """
+        if isinstance(value, str):
+            if "${" not in value:
+                return value
+            return "".join(
+                literal
+                + (
+                    self._lookup(placeholder, field_name, interpolations)
+                    if placeholder is not None
+                    else ""
+                )
+                for literal, placeholder in compile_template(value)
+            )
+
+        if isinstance(value, dict):
+            rendered_dict = {
+                key: self._render(item, field_name, interpolations)
+                for key, item in value.items()
+            }
+            if any(rendered_dict[key] is not item for key, item in value.items()):
+                return rendered_dict
+        elif isinstance(value, list):
+            rendered_list = [
+                self._render(item, field_name, interpolations) for item in value
+            ]
+            if any(
+                rendered is not item for rendered, item in zip(rendered_list, value)
+            ):
+                return rendered_list
+        return value
+
+    def _lookup(
+        self, placeholder: str, field_name: str, interpolations: Dict[str, ConfigField]
+    ) -> str:
+        """
+        Returns: The value of the placeholder as a string.
+
+        Raises:
+            ValueError - If there is no matching field or environment variable.
+        """
+        name, _, nested_path = placeholder.partition(".")
+        if name in self.full_fields:
+            source_field = self.render_chosen_field(name)
+            value = source_field.value
+            try:
+                for key in nested_path.split(".") if nested_path else ():
+                    value = (
+                        value[key] if isinstance(value, dict) else getattr(value, key)
+                    )
+            except (KeyError, AttributeError):
+                raise ValueError(
+                    f"Cannot interpolate '${{{placeholder}}}' in {field_name=}. "
+                    f"Field '{name}' has no nested value '{nested_path}'."
+                )
+            interpolations[placeholder] = source_field
+            return str(value)
+
+        if placeholder not in self.environ:
+            raise ValueError(
+                f"Cannot interpolate '${{{placeholder}}}' in {field_name=}. "
+                f"No field or environment variable named '{placeholder}'."
+            )
+        env_value = self.environ[placeholder]
+        interpolations[placeholder] = ConfigField(
+            name=placeholder,
+            value=env_value,
+            source_name=placeholder,
+            source_type=ConfigSource.env_var,
+            source_location=placeholder,
+        )
+        return env_value
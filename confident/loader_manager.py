@@ -1,8 +1,75 @@
-from typing import Any, Callable, Dict, List
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+from weakref import WeakKeyDictionary
 
 from confident.config_field import ConfigField
 from confident.config_source import ConfigSource
+from confident.interpolation import INTERPOLATED_SOURCES, Interpolator
 from confident.loaders.source_loader_base import SourceLoader
+from confident.profiling import (
+    LOADER_PHASE_PREFIX,
+    PRIORITIZATION_PHASE,
+    profile_phase,
+)
+from confident.session import current_session
+from confident.specs import PROVENANCE_DEFAULT, ProvenanceLevel
+from confident.utils import convert_field_value, copy_parsed, keeps_input_values
+from confident.validation_memo import (
+    CACHED_VALUE_SOURCES,
+    MemoKey,
+    memo_key,
+    validation_memo,
+)
+
+
+LOADER_THREADS = 8
+
+# The fields of every config class whose cached values are copied before they are validated.
+_copied_fields: WeakKeyDictionary[type, FrozenSet[str]] = WeakKeyDictionary()
+
+# A thread pool shared by all the loader managers, created on the first parallel load.
+_loader_executor: ThreadPoolExecutor | None = None
+_loader_executor_lock = threading.Lock()
+
+
+def _get_loader_executor() -> ThreadPoolExecutor:
+    global _loader_executor
+    with _loader_executor_lock:
+        if _loader_executor is None:
+            _loader_executor = ThreadPoolExecutor(
+                max_workers=LOADER_THREADS, thread_name_prefix="confident-loader"
+            )
+        return _loader_executor
+
+
+def _copy_cached_values(
+    settings_cls: type, source_values: Dict[ConfigSource, Dict[str, Any]]
+) -> None:
+    """
+    Replaces the lists and dictionaries of the cached sources (e.g. the parsed content of files) by copies, when
+    pydantic would keep them as they are (e.g. in a `dict` field or an extra value). Otherwise, changing a value
+    of one config object in place would change the cached content, and every later load of it.
+    """
+    model_fields = getattr(settings_cls, "model_fields", {})
+    copied_fields = _copied_fields.get(settings_cls)
+    if copied_fields is None:
+        copied_fields = frozenset(
+            name
+            for name, model_field in model_fields.items()
+            if keeps_input_values(model_field.annotation)
+        )
+        _copied_fields[settings_cls] = copied_fields
+
+    for source in CACHED_VALUE_SOURCES:
+        values = source_values.get(source, {})
+        for name, value in values.items():
+            if isinstance(value, (dict, list)) and (
+                name in copied_fields or name not in model_fields
+            ):
+                values[name] = copy_parsed(value)
 
 
 class _SimpleSettingsSource:
@@ -22,51 +89,216 @@ class LoaderManager:
         source_priority: List[ConfigSource],
         init_settings_callable: Callable[..., Any] | None = None,
         env_settings_callable: Callable[..., Any] | None = None,
+        dotenv_settings_callable: Callable[..., Any] | None = None,
         file_secret_settings_callable: Callable[..., Any] | None = None,
         loaders: List[SourceLoader] | None = None,
+        interpolate: bool = False,
+        parallel: bool = False,
+        memoize_validation: bool = False,
     ) -> None:
         self.settings_obj = settings_obj
         self.init_settings_callable = init_settings_callable
         self.env_settings_callable = env_settings_callable
+        self.dotenv_settings_callable = dotenv_settings_callable
         self.file_secret_settings_callable = file_secret_settings_callable
         self.loaders = loaders or []
         self.source_priority = source_priority
+        self.interpolate = interpolate
+        self.parallel = parallel
+        self.memoize_validation = memoize_validation
+        # The memo keys of the chosen values that were not memoized, by their field names.
+        self.memo_keys: Dict[str, MemoKey] = {}
+        # The time every loader took, in seconds.
+        self.loader_timings: Dict[ConfigSource, float] = {}
         self.all_loaded_fields: Dict[ConfigSource, Dict[str, ConfigField]] = {}
         self.full_fields: Dict[str, ConfigField] = {}
 
     def load_all(self):
+        self._schedule_loaders()
+
+        with profile_phase(PRIORITIZATION_PHASE):
+            self._build_full_fields()
+            if self.interpolate:
+                self._interpolate_fields()
+
+            # Return source callables that return plain value dicts.
+            # The first callable has the highest priority and so on.
+            source_values = {
+                source: {
+                    name: cf.value
+                    for name, cf in self.all_loaded_fields.get(source, {}).items()
+                }
+                for source in self.source_priority
+            }
+            if self.memoize_validation:
+                self._use_memoized_values(source_values)
+            _copy_cached_values(type(self.settings_obj), source_values)
+
+        return tuple(_SimpleSettingsSource(values) for values in source_values.values())
+
+    def _use_memoized_values(
+        self, source_values: Dict[ConfigSource, Dict[str, Any]]
+    ) -> None:
+        """
+        Replaces the chosen values that were already validated by their memoized validated values.
+        The memo keys of the other chosen values are kept in `memo_keys`, to memoize them after the validation.
+        """
+        settings_cls = type(self.settings_obj)
+        for name, field in self.full_fields.items():
+            # pydantic-settings merges the dictionaries of all the sources, so the validated value depends on them.
+            if isinstance(field.value, dict) and any(
+                source is not field.source_type and isinstance(values.get(name), dict)
+                for source, values in source_values.items()
+            ):
+                continue
+            key = memo_key(cls=settings_cls, field=field)
+            if key is None:
+                continue
+            found, validated_value = validation_memo.get(key)
+            if found:
+                source_values[field.source_type][name] = validated_value
+            else:
+                self.memo_keys[name] = key
+
+    def memoize_validated_values(self, settings_obj: object) -> None:
+        """
+        Memoizes the validated values of the chosen values that were not memoized yet (see `ValidationMemo`).
+        """
+        for name, key in self.memo_keys.items():
+            validation_memo.put(key, getattr(settings_obj, name))
+        self.memo_keys = {}
+
+    def _schedule_loaders(self) -> None:
+        """
+        Loads all the sources in the source priority, every loader once its dependencies are loaded.
+        With `parallel`, loaders that are parallel safe run concurrently on a shared thread pool while the others
+        run on the calling thread. The loaded fields are ordered by the source priority (the map is last)
+        regardless of the completion order.
+
+        Raises:
+            ValueError - If the loaders dependencies cannot be satisfied.
+        """
         loaders_dict = {loader.NAME: loader for loader in self.loaders}
-        for source in self.source_priority:
-            if source is ConfigSource.map:
+        order: List[ConfigSource] = [
+            source for source in self.source_priority if source != ConfigSource.map
+        ]
+        if ConfigSource.map in self.source_priority:
+            order.append(ConfigSource.map)
+        pending = [loaders_dict[source] for source in order]
+        running: Dict[Future, SourceLoader] = {}
+
+        while pending or running:
+            ready = [
+                loader for loader in pending if loader.is_ready(self.all_loaded_fields)
+            ]
+            for loader in ready:
+                pending.remove(loader)
+                if self.parallel and loader.PARALLEL_SAFE:
+                    # Every task runs in a copy of the current context, e.g. for profiling.
+                    future = _get_loader_executor().submit(
+                        copy_context().run, self._run_loader, loader
+                    )
+                    running[future] = loader
+
+            inline_loaders = [
+                loader
+                for loader in ready
+                if not (self.parallel and loader.PARALLEL_SAFE)
+            ]
+            for loader in inline_loaders:
+                self._store_result(loader, self._run_loader(loader))
+            if inline_loaders:
                 continue
-            self.all_loaded_fields[source] = {
-                field.name: field
-                for field in loaders_dict[source].load_fields(
-                    settings=self.settings_obj
+
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._store_result(running.pop(future), future.result())
+            elif pending:
+                raise ValueError(
+                    f"Cannot load sources {[loader.NAME.value for loader in pending]}. "
+                    "Their dependencies are not loaded."
                 )
-            }
 
-        # Load the map config last.
-        if ConfigSource.map in self.source_priority:
-            self.all_loaded_fields[ConfigSource.map] = {
+        ordered = {
+            source: self.all_loaded_fields[source]
+            for source in order
+            if source in self.all_loaded_fields
+        }
+        self.all_loaded_fields.clear()
+        self.all_loaded_fields.update(ordered)
+
+    def _run_loader(self, loader: SourceLoader) -> Tuple[Dict[str, ConfigField], float]:
+        """
+        Returns: The loaded fields by their names, and the time the loader took in seconds.
+        """
+        start = time.perf_counter()
+        with profile_phase(f"{LOADER_PHASE_PREFIX}{loader.NAME.value}"):
+            fields = {
                 field.name: field
-                for field in loaders_dict[ConfigSource.map].load_fields(
-                    settings=self.settings_obj
+                for field in loader.load_fields(
+                    settings=self.settings_obj  # type: ignore[arg-type]
                 )
             }
+        return fields, time.perf_counter() - start
 
+    def _store_result(
+        self, loader: SourceLoader, result: Tuple[Dict[str, ConfigField], float]
+    ) -> None:
+        self.all_loaded_fields[loader.NAME], self.loader_timings[loader.NAME] = result
+
+    def _build_full_fields(self) -> None:
         # Build full_fields: highest priority source wins per field.
         self.full_fields = {}
         for source in reversed(self.source_priority):
             for name, field in self.all_loaded_fields.get(source, {}).items():
                 self.full_fields[name] = field
 
-        # Return source callables that return plain value dicts.
-        # The first callable has the highest priority and so on.
-        source_callables = []
-        for source in self.source_priority:
+    def _interpolate_fields(self) -> None:
+        """
+        Renders the `${NAME}` templates in the loaded fields of the interpolated sources.
+        Placeholders refer to the chosen values of other fields or to environment variables.
+        """
+        session = current_session()
+        interpolator = Interpolator(
+            full_fields=self.full_fields,
+            convert=lambda name, value: convert_field_value(
+                settings=self.settings_obj,  # type: ignore[arg-type]
+                field_name=name,
+                origin_value=value,
+            ),
+            environ=session.environ if session else None,
+        )
+        for source in INTERPOLATED_SOURCES:
             fields = self.all_loaded_fields.get(source, {})
-            values = {name: cf.value for name, cf in fields.items()}
-            source_callables.append(_SimpleSettingsSource(values))
+            for name, field in fields.items():
+                fields[name] = (
+                    interpolator.render_chosen_field(name)
+                    if self.full_fields[name] is field
+                    else interpolator.render_field(field)
+                )
+        self._build_full_fields()
+
+    def release(self, provenance: ProvenanceLevel = PROVENANCE_DEFAULT) -> None:
+        """
+        Drops the state that is needed only while loading: the loaders, the pydantic-settings callables and the
+        reference to the settings object. Fields details are kept according to the provenance level:
+            'full' - All the loaded fields, including the ones that were not chosen.
+            'winners' - Only the chosen fields (`full_fields`).
+            'none' - No fields details.
+        """
+        self.settings_obj = None
+        self.init_settings_callable = None
+        self.env_settings_callable = None
+        self.dotenv_settings_callable = None
+        self.file_secret_settings_callable = None
+        self.loaders = []
+        self.memo_keys = {}
 
-        return tuple(source_callables)
+        if provenance == "winners":
+            self.all_loaded_fields = {}
+            for name, field in self.full_fields.items():
+                self.all_loaded_fields.setdefault(field.source_type, {})[name] = field
+        elif provenance == "none":
+            self.all_loaded_fields = {}
+            self.full_fields = {}
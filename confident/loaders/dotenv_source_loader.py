@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from pydantic_settings import BaseSettings
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+from confident.loaders.source_loader_base import SourceLoader
+from confident.utils import convert_field_value
+
+# A single `KEY=VALUE` entry, optionally prefixed by `export`. Quoted values may span multiple lines.
+_ENTRY_PATTERN = re.compile(
+    r"""
+    [ \t]*(?:export[ \t]+)?
+    (?P<key>[A-Za-z_][A-Za-z0-9_.\-]*)
+    [ \t]*=[ \t]*
+    (?:
+        '(?P<single>[^']*)'
+        | "(?P<double>(?:\\.|[^"\\])*)"
+        | (?P<bare>[^\r\n]*)
+    )
+    """,
+    re.VERBOSE,
+)
+_INLINE_COMMENT_PATTERN = re.compile(r"(?:^|[ \t]+)#.*$")
+_ESCAPE_PATTERN = re.compile(r"\\(.)")
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+# Parsed dotenv files cached by path and validated by the file inode, modification time and size.
+_dotenv_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Tuple[str, int]]]] = {}
+
+
+class DotEnvSourceLoader(SourceLoader):
+    NAME = ConfigSource.dotenv
+    PARALLEL_SAFE = True
+
+    def __init__(self, dotenv_settings_callable: Callable | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.dotenv_settings_callable = dotenv_settings_callable
+
+    def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
+        """
+        Loads requested config fields from `.env` files.
+        When multiple files are provided, the latter ones take priority.
+
+        Raises:
+            ValueError - If file is not exists and ignore_missing_files=False.
+        """
+        case_sensitive = getattr(self.dotenv_settings_callable, "case_sensitive", False)
+        encoding = getattr(self.dotenv_settings_callable, "env_file_encoding", None)
+        field_names = type(settings).model_fields.keys()
+
+        fields: Dict[str, ConfigField] = {}
+        for file_path in self.specs.env_files:
+            if not os.path.isfile(file_path) and self.specs.ignore_missing_files:
+                continue
+            entries = load_dotenv_file(path=file_path, encoding=encoding)
+            if not case_sensitive:
+                entries = {key.lower(): entry for key, entry in entries.items()}
+
+            for field_name in field_names:
+                entry = entries.get(
+                    field_name if case_sensitive else field_name.lower()
+                )
+                if entry is None:
+                    continue
+                value, line_number = entry
+                fields[field_name] = ConfigField(
+                    name=field_name,
+                    value=convert_field_value(
+                        settings=settings, field_name=field_name, origin_value=value
+                    ),
+                    origin_value=value,
+                    source_name=os.path.basename(file_path),
+                    source_type=ConfigSource.dotenv,
+                    source_location=f"{file_path}:{line_number}",
+                )
+
+        return list(fields.values())
+
+
+def load_dotenv_file(
+    path: Path | str, encoding: str | None = None
+) -> Dict[str, Tuple[str, int]]:
+    """
+    Loads the entries of a `.env` file.
+    The parsed content is reused from previous loads as long as the file inode, modification time and size
+    are unchanged.
+
+    Returns:
+        A dictionary of the keys and a tuple of their value and line number.
+
+    Raises:
+        ValueError - If the file is not exists.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise ValueError(f"{path=} is not exists.")
+
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _dotenv_cache.get(str(path))
+    if cached and cached[0] == identity:
+        return cached[1]
+
+    entries = parse_dotenv(Path(path).read_text(encoding=encoding))
+    _dotenv_cache[str(path)] = (identity, entries)
+    return entries
+
+
+def parse_dotenv(text: str) -> Dict[str, Tuple[str, int]]:
+    """
+    Parses the content of a `.env` file in a single pass.
+    Supports `export` prefixes, comments, single quoted (literal) and double quoted (escaped) values.
+    Quoted values can span multiple lines. Lines that are not valid entries are skipped.
+
+    Returns:
+        A dictionary of the keys and a tuple of their value and the line number the entry starts at.
+    """
+    entries: Dict[str, Tuple[str, int]] = {}
+    position = 0
+    line_number = 1
+    length = len(text)
+
+    while position < length:
+        match = _ENTRY_PATTERN.match(text, position)
+        end = match.end() if match else position
+        # Skips the rest of the line, which may hold a comment or an invalid entry.
+        line_end = text.find("\n", end)
+        line_end = length if line_end == -1 else line_end + 1
+
+        if match:
+            if match.group("single") is not None:
+                value = match.group("single")
+            elif match.group("double") is not None:
+                value = _ESCAPE_PATTERN.sub(
+                    lambda escape: _ESCAPES.get(escape.group(1), escape.group(1)),
+                    match.group("double"),
+                )
+            else:
+                value = _INLINE_COMMENT_PATTERN.sub("", match.group("bare")).strip()
+            entries[match.group("key")] = (value, line_number)
+
+        line_number += text.count("\n", position, line_end)
+        position = line_end
+
+    return entries
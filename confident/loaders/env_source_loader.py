@@ -1,12 +1,49 @@
+from __future__ import annotations
+
 import os
-from typing import Callable, List
+import threading
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
 from confident.config_field import ConfigField
 from confident.config_source import ConfigSource
 from confident.loaders.source_loader_base import SourceLoader
-from confident.utils import convert_field_value
+from confident.session import current_session
+from confident.utils import convert_value
+
+
+class EnvTrieNode:
+    """
+    A node in a trie of environment variable names split by the nested delimiter.
+    """
+
+    __slots__ = ("env_name", "value", "children")
+
+    def __init__(self) -> None:
+        self.env_name: str | None = None
+        self.value: str | None = None
+        self.children: Dict[str, EnvTrieNode] = {}
+
+
+# Tries of the environment variables by the options they were built with. They are reused as long as the
+# environment variables are unchanged, e.g. until a test sets one with `monkeypatch.setenv`.
+_env_tries_cache: Dict[Tuple[str, str | None, bool, bool], EnvTrieNode] = {}
+_environ_snapshot: Dict[Any, Any] = {}
+_env_tries_lock = threading.Lock()
 
 
 class EnvSourceLoader(SourceLoader):
@@ -19,30 +56,253 @@ class EnvSourceLoader(SourceLoader):
     def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
         """
         Finds and loads requested settings fields from environment variables into a dictionary.
+        Uses `env_prefix`, `env_nested_delimiter` and `case_sensitive` settings of the class.
+        Fields of nested models (or dicts) can be set by their nested keys, e.g. `DB__POOL__SIZE`.
+        """
+        model_config = type(settings).model_config
+        case_sensitive = bool(
+            getattr(
+                self.env_settings_callable,
+                "case_sensitive",
+                model_config.get("case_sensitive", False),
+            )
+        )
+        prefix = getattr(
+            self.env_settings_callable,
+            "env_prefix",
+            model_config.get("env_prefix", ""),
+        )
+        delimiter = getattr(
+            self.env_settings_callable,
+            "env_nested_delimiter",
+            model_config.get("env_nested_delimiter"),
+        )
+        ignore_empty = getattr(
+            self.env_settings_callable,
+            "env_ignore_empty",
+            model_config.get("env_ignore_empty", False),
+        )
+
+        root = cached_env_trie(
+            prefix=prefix or "",
+            delimiter=delimiter,
+            case_sensitive=case_sensitive,
+            ignore_empty=ignore_empty,
+        )
+
+        fields = []
+        for field_name, model_field in type(settings).model_fields.items():
+            node = root.children.get(
+                field_name if case_sensitive else field_name.lower()
+            )
+            if node is None and case_sensitive:
+                node = root.children.get(field_name.upper())
+            if node is None:
+                continue
+
+            if node.children and _is_nested_annotation(model_field.annotation):
+                fields.append(
+                    self._load_nested_field(
+                        field_name=field_name,
+                        node=node,
+                        annotation=model_field.annotation,
+                        env_group=f"{prefix or ''}{field_name}{delimiter}",
+                    )
+                )
+            elif node.env_name is not None:
+                fields.append(
+                    ConfigField(
+                        name=field_name,
+                        value=convert_value(
+                            annotation=model_field.annotation, origin_value=node.value
+                        ),
+                        origin_value=node.value,
+                        source_name=node.env_name,
+                        source_type=ConfigSource.env_var,
+                        source_location=node.env_name,
+                    )
+                )
+        return fields
+
+    @staticmethod
+    def _load_nested_field(
+        field_name: str, node: EnvTrieNode, annotation: Any, env_group: str
+    ) -> ConfigField:
         """
-        fields = self.env_settings_callable()
-
-        # pydantic-settings v2 may filter out env vars parsed to None (e.g. "null").
-        # Supplement with direct os.environ lookups for any missing model fields.
-        for field_name in type(settings).model_fields:
-            if field_name not in fields:
-                env_value = os.environ.get(field_name) or os.environ.get(
-                    field_name.upper()
+        Assembles the nested dictionary of a field from the environment variables of its trie node.
+        A value of the field itself (json object) is used as the base and is updated by the nested variables.
+        The origin value is a dictionary of all the environment variables that were used and their values.
+        """
+        origin_value: Dict[str, str | None] = {}
+        nested_fields: Dict[str, ConfigField] = {}
+
+        def assemble(
+            current: EnvTrieNode, current_annotation: Any, path: List[str]
+        ) -> Any:
+            value: Any = {}
+            if current.env_name is not None:
+                value = convert_value(
+                    annotation=current_annotation, origin_value=current.value
                 )
-                if env_value is not None:
-                    fields[field_name] = env_value
-
-        full_fields = [
-            ConfigField(
-                name=key,
-                value=convert_field_value(
-                    settings=settings, field_name=key, origin_value=value
-                ),
-                origin_value=value,
-                source_name=key,
-                source_type=ConfigSource.env_var,
-                source_location=key,
+                origin_value[current.env_name] = current.value
+                if path:
+                    dotted_path = ".".join(path)
+                    nested_fields[dotted_path] = ConfigField(
+                        name=f"{field_name}.{dotted_path}",
+                        value=value,
+                        origin_value=current.value,
+                        source_name=current.env_name,
+                        source_type=ConfigSource.env_var,
+                        source_location=current.env_name,
+                    )
+                if not current.children:
+                    return value
+                # Nested variables update a json object value, and replace any other value.
+                value = dict(value) if isinstance(value, dict) else {}
+
+            for key, child in current.children.items():
+                child_key, child_annotation = _nested_key(current_annotation, key)
+                value[child_key] = assemble(child, child_annotation, [*path, child_key])
+            return value
+
+        value = assemble(node, annotation, [])
+        # Uses the spelling of the actual variables, since the group may be matched case insensitively.
+        env_group = next(iter(origin_value))[: len(env_group)]
+        return ConfigField(
+            name=field_name,
+            value=value,
+            origin_value=origin_value,
+            source_name=node.env_name or env_group,
+            source_type=ConfigSource.env_var,
+            source_location=node.env_name or env_group,
+            nested_fields=nested_fields,
+        )
+
+
+def cached_env_trie(
+    prefix: str = "",
+    delimiter: str | None = None,
+    case_sensitive: bool = False,
+    ignore_empty: bool = False,
+) -> EnvTrieNode:
+    """
+    Returns: The trie of the current environment variables (see `build_env_trie`). Tries are reused until the
+        environment changes, which is detected by comparing it to a snapshot, much cheaper than building a trie.
+        Inside a `ConfigSession`, the trie is of the environment snapshot of the session.
+        The returned trie is shared and must not be mutated.
+    """
+    session = current_session()
+    if session is not None:
+        return session.shared(  # type: ignore[no-any-return]
+            key=(EnvTrieNode, prefix, delimiter, case_sensitive, ignore_empty),
+            build=lambda: build_env_trie(
+                environ=session.environ,
+                prefix=prefix,
+                delimiter=delimiter,
+                case_sensitive=case_sensitive,
+                ignore_empty=ignore_empty,
+            ),
+        )
+
+    # The raw variables of `os.environ`, to compare them without decoding every one of them.
+    environ = getattr(os.environ, "_data", os.environ)
+    key = (prefix, delimiter, case_sensitive, ignore_empty)
+    with _env_tries_lock:
+        if environ != _environ_snapshot:
+            _env_tries_cache.clear()
+            _environ_snapshot.clear()
+            _environ_snapshot.update(environ)
+        root = _env_tries_cache.get(key)
+        if root is None:
+            root = build_env_trie(
+                environ=os.environ,
+                prefix=prefix,
+                delimiter=delimiter,
+                case_sensitive=case_sensitive,
+                ignore_empty=ignore_empty,
             )
-            for key, value in fields.items()
+            _env_tries_cache[key] = root
+    return root
+
+
+def build_env_trie(
+    environ: Mapping[str, str],
+    prefix: str = "",
+    delimiter: str | None = None,
+    case_sensitive: bool = False,
+    ignore_empty: bool = False,
+) -> EnvTrieNode:
+    """
+    Builds a trie of the environment variables in a single pass.
+    Only variables that start with the prefix are added, split into nested keys by the delimiter.
+
+    Returns:
+        The root node of the trie.
+    """
+    root = EnvTrieNode()
+    if not case_sensitive:
+        prefix = prefix.lower()
+        delimiter = delimiter.lower() if delimiter else delimiter
+
+    for env_name, value in environ.items():
+        if ignore_empty and value == "":
+            continue
+        key = env_name if case_sensitive else env_name.lower()
+        if not key.startswith(prefix):
+            continue
+        key = key[len(prefix) :]
+
+        node = root
+        for segment in key.split(delimiter) if delimiter else (key,):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = EnvTrieNode()
+            node = child
+        node.env_name = env_name
+        node.value = value
+    return root
+
+
+def _unwrap_annotation(annotation: Any) -> List[Any]:
+    """
+    Returns: The possible types of an annotation, without `Optional`, `Union` and `Annotated` wrappers.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _unwrap_annotation(get_args(annotation)[0])
+    if origin in (Union, UnionType):
+        return [
+            unwrapped
+            for arg in get_args(annotation)
+            for unwrapped in _unwrap_annotation(arg)
         ]
-        return full_fields
+    return [annotation]
+
+
+def _is_nested_annotation(annotation: Any) -> bool:
+    for option in _unwrap_annotation(annotation):
+        if isinstance(option, type) and issubclass(option, (BaseModel, dict)):
+            return True
+        if get_origin(option) in (dict, Dict):
+            return True
+    return False
+
+
+def _nested_key(annotation: Any, key: str) -> tuple[str, Any]:
+    """
+    Finds a nested key inside a model or a dict annotation.
+
+    Returns:
+        The key as declared in the model (the trie keys may be case folded) and its annotation.
+        The annotation is None if unknown.
+    """
+    for option in _unwrap_annotation(annotation):
+        if isinstance(option, type) and issubclass(option, BaseModel):
+            for name, model_field in option.model_fields.items():
+                if name.lower() == key.lower():
+                    return name, model_field.annotation
+        elif get_origin(option) in (dict, Dict):
+            args = get_args(option)
+            if len(args) == 2:
+                return key, args[1]
+    return key, None
@@ -1,51 +1,162 @@
 import os
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from pydantic_settings import BaseSettings
 
+from confident.bundle import bundled_path, is_file, open_bundle
 from confident.config_field import ConfigField
 from confident.config_source import ConfigSource
+from confident.file_refs import KeyPath, RefResolver, ResolvedFile
 from confident.loaders.source_loader_base import SourceLoader
-from confident.utils import load_file, convert_field_value
+from confident.utils import convert_field_value
 
 
 class FileSourceLoader(SourceLoader):
     NAME = ConfigSource.file
+    PARALLEL_SAFE = True
 
     def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
         """
-        Finds and loads requested config fields from files into a dictionary.
+        Finds and loads requested config fields from files.
+        When multiple files are provided, the latter ones take priority. The files are looked up as layers over
+        their cached parsed content, and only the fields of the class are looked up and converted, so the cost
+        depends on the number of fields and not on the size of the files.
+        With `deep_merge_files`, nested dictionaries are merged across the files instead of being replaced,
+        and the file of every nested value is kept in `nested_fields` by its dotted path (e.g. 'pool.size').
+        `$ref` references in the files are replaced by the content of the referenced files, and the source location
+        of every value is the file that supplied it.
+        With a `bundle`, files that were bundled are read from it (see `confident.bundle`).
 
         Raises:
             ValueError -
                 If file is not exists and ignore_missing_files=False.
                 If the file is not in a supported format.
+                If the `$ref` references are circular.
         """
-        fields = {}
+        # The last file has the highest priority, so it is the first layer.
+        resolver = RefResolver(cache_dir=self.specs.file_cache_dir)
+        bundle = open_bundle(self.specs.bundle) if self.specs.bundle else None
+        layers: List[ResolvedFile] = []
         for file_path in self.specs.files:
-            if not os.path.isfile(file_path) and self.specs.ignore_missing_files:
+            file_path = bundled_path(file_path, bundle, self.specs.bundle_root)
+            if not is_file(file_path, bundle) and self.specs.ignore_missing_files:
                 continue
-            file_dict = load_file(path=file_path)
-
-            # Creates a dict with `ConfigField` from the file data and merges them with the rest of the properties
-            # from other files.
-            fields.update(
-                {
-                    key: ConfigField(
-                        name=key,
-                        value=convert_field_value(
-                            settings=settings, field_name=key, origin_value=value
-                        ),
-                        origin_value=value,
-                        source_name=os.path.basename(file_path),
-                        source_type=ConfigSource.file,
-                        source_location=file_path,
-                    )
-                    for key, value in file_dict.items()
-                }
+            layers.insert(0, resolver.resolve(file_path))
+
+        fields = []
+        for field_name in type(settings).model_fields:
+            field_layers = [
+                (resolved_file, resolved_file.content[field_name])
+                for resolved_file in layers
+                if field_name in resolved_file.content
+            ]
+            if not field_layers:
+                continue
+
+            resolved_file, value = field_layers[0]
+            file_path = resolved_file.location((field_name,))
+            nested_fields: Dict[str, ConfigField] = {}
+            if self.specs.deep_merge_files and isinstance(value, dict):
+                value = _merge_layers(
+                    field_name=field_name,
+                    layers=field_layers,
+                    path=(field_name,),
+                    nested_fields=nested_fields,
+                )
+            else:
+                nested_fields = _included_fields(
+                    field_name=field_name, resolved_file=resolved_file, value=value
+                )
+
+            fields.append(
+                ConfigField(
+                    name=field_name,
+                    value=convert_field_value(
+                        settings=settings, field_name=field_name, origin_value=value
+                    ),
+                    origin_value=value,
+                    source_name=os.path.basename(file_path),
+                    source_type=ConfigSource.file,
+                    source_location=file_path,
+                    nested_fields=nested_fields,
+                )
             )
+        return fields
+
+
+def _merge_layers(
+    field_name: str,
+    layers: List[Tuple[ResolvedFile, Any]],
+    path: KeyPath,
+    nested_fields: Dict[str, ConfigField],
+) -> Dict[str, Any]:
+    """
+    Merges the values of the same key path from multiple files, ordered from the highest priority.
+    Dictionaries are merged recursively, and a value that is not a dictionary replaces the values of the lower
+    layers. The details of every merged leaf value are added to `nested_fields`.
 
-        # Returns only the properties that are relevant to the class definition.
-        return [
-            fields[key] for key in fields.keys() & type(settings).model_fields.keys()
+    Returns:
+        A new dictionary, the parsed files are not changed.
+    """
+    dict_layers = []
+    for layer in layers:
+        if not isinstance(layer[1], dict):
+            break
+        dict_layers.append(layer)
+
+    merged: Dict[str, Any] = {}
+    # Keeps the keys order of the lowest layer, like updating it with the higher layers.
+    for key in dict.fromkeys(
+        key for _, value in reversed(dict_layers) for key in value
+    ):
+        key_layers = [
+            (resolved_file, value[key])
+            for resolved_file, value in dict_layers
+            if key in value
         ]
+        resolved_file, value = key_layers[0]
+        key_path = (*path, key)
+        if isinstance(value, dict):
+            merged[key] = _merge_layers(
+                field_name=field_name,
+                layers=key_layers,
+                path=key_path,
+                nested_fields=nested_fields,
+            )
+            continue
+
+        merged[key] = value
+        file_path = resolved_file.location(key_path)
+        dotted_path = ".".join(map(str, key_path[1:]))
+        nested_fields[dotted_path] = ConfigField(
+            name=f"{field_name}.{dotted_path}",
+            value=value,
+            source_name=os.path.basename(file_path),
+            source_type=ConfigSource.file,
+            source_location=file_path,
+        )
+    return merged
+
+
+def _included_fields(
+    field_name: str, resolved_file: ResolvedFile, value: Any
+) -> Dict[str, ConfigField]:
+    """
+    Returns: The details of the nested values of a field that were included from other files by their dotted path.
+    """
+    nested_fields = {}
+    for key_path, file_path in resolved_file.nested_locations.get(
+        field_name, {}
+    ).items():
+        nested_value = value
+        for key in key_path[1:]:
+            nested_value = nested_value[key]
+        dotted_path = ".".join(map(str, key_path[1:]))
+        nested_fields[dotted_path] = ConfigField(
+            name=f"{field_name}.{dotted_path}",
+            value=nested_value,
+            source_name=os.path.basename(file_path),
+            source_type=ConfigSource.file,
+            source_location=file_path,
+        )
+    return nested_fields
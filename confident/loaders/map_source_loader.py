@@ -1,26 +1,53 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from pydantic_settings import BaseSettings
 
+from confident.bundle import bundled_path, open_bundle
 from confident.config_field import ConfigField
 from confident.config_source import ConfigSource
+from confident.file_refs import RefResolver, ResolvedFile
 from confident.loaders.source_loader_base import SourceLoader
-from confident.utils import load_file, convert_field_value
+from confident.map_shards import list_map_shards
+from confident.utils import convert_field_value
 
 
 class MapSourceLoader(SourceLoader):
     NAME = ConfigSource.map
+    PARALLEL_SAFE = True
 
     def __init__(self, all_loaded_fields: dict, **kwargs):
         super().__init__(**kwargs)
         self.all_loaded_fields = all_loaded_fields
 
+    def is_ready(
+        self, loaded_fields: Mapping[ConfigSource, Dict[str, ConfigField]]
+    ) -> bool:
+        """
+        The map can be loaded as soon as its name is known: Right away with `map_name`, and with `map_field`
+        once the sources are loaded up to the first one (by priority) that has the map field.
+        """
+        map_field = self.specs.map_field
+        if map_field is None:
+            return True
+        for source in self.specs.source_priority:
+            if source == ConfigSource.map:
+                continue
+            if source not in loaded_fields:
+                return False
+            if loaded_fields[source].get(map_field):
+                return True
+        return True
+
     def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
         """
         Loads the relevant map config properties.
+        The config map can be a dictionary, a file, or a directory with a file for every map name (see
+        `list_map_shards`), in which only the file of the map name is loaded.
+        `$ref` references in the map files are replaced by the content of the referenced files, and the source
+        location of every value is the file that supplied it.
 
         Raises:
             ValueError - If wrong combination or values of fields is detected in the following cases:
@@ -28,6 +55,7 @@ class MapSourceLoader(SourceLoader):
                 If no `config_map` is provided.
                 If the `map_name` is not of type `str`.
                 If the `map_field` appears inside the `config_map`.
+                If the `$ref` references are circular.
         """
         # Extracts the map metadata field and validates them.
         map_name = self.specs.map_name
@@ -43,16 +71,28 @@ class MapSourceLoader(SourceLoader):
             )
         if config_map is None:
             raise ValueError("No `config_map` was provided.")
+        resolver = RefResolver(cache_dir=self.specs.file_cache_dir)
+        bundle = open_bundle(self.specs.bundle) if self.specs.bundle else None
+        resolved_file: ResolvedFile | None = None
+        # The key path of the selected config inside the resolved file.
+        selected_path: tuple = ()
         if isinstance(config_map, Path):
-            map_location = config_map
-            config_map = load_file(map_location)
-
-        selected_config: Dict[str, Any] | None = {}
+            map_location = bundled_path(config_map, bundle, self.specs.bundle_root)
+            shards = list_map_shards(map_location)
+            if shards is not None:
+                # A sharded config map: only the shard of the map name is loaded.
+                config_map = shards
+            else:
+                resolved_file = resolver.resolve(map_location)
+                config_map = resolved_file.content
+
+        selected_config: Dict[str, Any] | str | Path | None = {}
         config_fields: List[ConfigField] = []
 
         # According to the map name, extracts the chosen config.
         if map_name:
             selected_config = config_map.get(map_name)
+            selected_path = (map_name,)
         if map_field:
             # Search for the map name in all possible sources ordered by priority.
             for source in self.specs.source_priority:
@@ -69,6 +109,7 @@ class MapSourceLoader(SourceLoader):
                     f"type={type(map_name)}"
                 )
             selected_config = config_map.get(map_name)  # type: ignore[union-attr]
+            selected_path = (map_name,)
 
         if selected_config is None:
             raise KeyError(
@@ -76,9 +117,16 @@ class MapSourceLoader(SourceLoader):
             )
 
         if isinstance(selected_config, str) or isinstance(selected_config, Path):
-            selected_config = load_file(selected_config)
+            map_location = bundled_path(selected_config, bundle, self.specs.bundle_root)
+            resolved_file = resolver.resolve(map_location)
+            selected_config = resolved_file.content
+            selected_path = ()
 
         # Creates the `ConfigField` dictionary.
+        # Keys that are not fields are dropped by pydantic when the class ignores extra values, so they are skipped.
+        # Otherwise they are loaded, so pydantic rejects or keeps them.
+        model_fields = type(settings).model_fields
+        fields_only = type(settings).model_config.get("extra") == "ignore"
         for name, value in selected_config.items():
             if name == map_field:
                 raise ValueError(
@@ -86,6 +134,8 @@ class MapSourceLoader(SourceLoader):
                     f"Look for {map_location=} at '{map_name}'. "
                     f"Remove '{map_field}' key or change the map field."
                 )
+            if fields_only and name not in model_fields:
+                continue
             config_fields.append(
                 ConfigField(
                     name=name,
@@ -95,7 +145,11 @@ class MapSourceLoader(SourceLoader):
                     origin_value=value,
                     source_name=map_name,
                     source_type=ConfigSource.map,
-                    source_location=map_location,
+                    source_location=(
+                        resolved_file.location((*selected_path, name))
+                        if resolved_file
+                        else map_location
+                    ),
                 )
             )
 
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import http.client
+import io
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+from urllib.parse import urlsplit
+
+import yaml  # type: ignore[import-untyped]
+from pydantic_settings import BaseSettings
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+from confident.loaders.source_loader_base import SourceLoader
+from confident.utils import convert_field_value, load_yaml
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive connections that are idle, pooled by (scheme, host, port).
+_connection_pools: Dict[
+    Tuple[str, str, int | None], List[http.client.HTTPConnection]
+] = {}
+_connection_pools_lock = threading.Lock()
+
+# The last successful response of every url: (etag, content).
+_responses: Dict[str, Tuple[str | None, Dict[str, Any]]] = {}
+
+# Urls that are being revalidated in the background after a stale response was served.
+_revalidating: Set[str] = set()
+_revalidating_lock = threading.Lock()
+
+
+class RemoteSourceLoader(SourceLoader):
+    NAME = ConfigSource.remote
+    PARALLEL_SAFE = True
+
+    def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
+        """
+        Loads requested config fields from a config server url that returns a json (or yaml) object.
+        If the server is slow or down, the last known content is served from the cache.
+
+        Raises:
+            ValueError - If the url cannot be loaded and there is no cached content of it.
+        """
+        url = self.specs.remote_url
+        if url is None:
+            return []
+
+        content = load_remote_config(
+            url=url,
+            timeout=self.specs.remote_timeout,
+            cache_dir=self.specs.remote_cache_dir,
+        )
+        model_fields = type(settings).model_fields
+        return [
+            ConfigField(
+                name=key,
+                value=convert_field_value(
+                    settings=settings, field_name=key, origin_value=value
+                ),
+                origin_value=value,
+                source_name=urlsplit(url).netloc,
+                source_type=ConfigSource.remote,
+                source_location=url,
+            )
+            for key, value in content.items()
+            if key in model_fields
+        ]
+
+
+def load_remote_config(
+    url: str, timeout: float, cache_dir: Path | str | None = None
+) -> Dict[str, Any]:
+    """
+    Loads the content of a config server url.
+    The request is revalidated with the `ETag` of the last response, so unchanged content costs a
+    `304 Not Modified` response. If the request fails or does not finish before the timeout, the cached content
+    is returned and the url is revalidated in the background.
+
+    Args:
+        url: The config server url.
+        timeout: The maximal time in seconds for the whole load.
+        cache_dir: A directory to store the last response in, to be used when the server is unavailable
+            on process start.
+
+    Raises:
+        ValueError - If the url cannot be loaded and there is no cached content of it.
+    """
+    cached = _responses.get(url)
+    if cached is None:
+        cached = _read_cache_file(url=url, cache_dir=cache_dir)
+        if cached is not None:
+            # The disk cache is the last known response, so the background revalidation sends its `ETag` too.
+            _responses.setdefault(url, cached)
+    try:
+        return _revalidate(
+            url=url,
+            cached=cached,
+            deadline=time.monotonic() + timeout,
+            cache_dir=cache_dir,
+        )
+    except (OSError, ValueError, yaml.YAMLError, http.client.HTTPException) as error:
+        # A partial or invalid response is handled as a failed request, so the cached content is served.
+        if cached is None:
+            raise ValueError(f"Could not load {url=}: {error!r}") from error
+
+    _revalidate_in_background(url=url, timeout=timeout, cache_dir=cache_dir)
+    return cached[1]
+
+
+def _revalidate(
+    url: str,
+    cached: Tuple[str | None, Dict[str, Any]] | None,
+    deadline: float,
+    cache_dir: Path | str | None,
+) -> Dict[str, Any]:
+    headers = {"Accept": "application/json, application/yaml"}
+    if cached and cached[0]:
+        headers["If-None-Match"] = cached[0]
+
+    status, response_headers, body = _request(
+        url=url, headers=headers, deadline=deadline
+    )
+    if status == http.client.NOT_MODIFIED and cached:
+        _responses[url] = cached
+        return cached[1]
+    if status != http.client.OK:
+        raise ConnectionError(f"Unexpected response status {status}.")
+
+    content_type = response_headers.get("Content-Type", "")
+    content = _parse_body(url=url, content_type=content_type, body=body)
+    etag = response_headers.get("ETag")
+    _responses[url] = (etag, content)
+    _write_cache_file(
+        url=url, cache_dir=cache_dir, etag=etag, content_type=content_type, body=body
+    )
+    return content
+
+
+def _parse_body(url: str, content_type: str, body: bytes) -> Dict[str, Any]:
+    """
+    Raises:
+        ValueError - If the body is not a valid json (or yaml) object.
+        yaml.YAMLError - If the yaml body is not valid.
+    """
+    if "yaml" in content_type.lower():
+        content = load_yaml(body)
+    else:
+        content = json.loads(body)
+    if content is None:
+        content = {}
+    if not isinstance(content, dict):
+        raise ValueError(f"{url=} has to have a valid dict content.")
+    return content
+
+
+def _revalidate_in_background(
+    url: str, timeout: float, cache_dir: Path | str | None
+) -> None:
+    with _revalidating_lock:
+        if url in _revalidating:
+            return
+        _revalidating.add(url)
+
+    def revalidate() -> None:
+        try:
+            _revalidate(
+                url=url,
+                cached=_responses.get(url),
+                deadline=time.monotonic() + timeout,
+                cache_dir=cache_dir,
+            )
+        except (OSError, ValueError, yaml.YAMLError, http.client.HTTPException):
+            pass
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(url)
+
+    threading.Thread(target=revalidate, daemon=True).start()
+
+
+def _request(
+    url: str, headers: Dict[str, str], deadline: float
+) -> Tuple[int, http.client.HTTPMessage, bytes]:
+    """
+    Sends a GET request using a pooled keep-alive connection of the url host.
+    A pooled connection that was closed by the server is replaced by a new one.
+    Every read of the response waits at most until the deadline, so a server that sends it slowly cannot delay
+    the load past the deadline.
+    """
+    parts = urlsplit(url)
+    pool_key = (parts.scheme, parts.hostname or "", parts.port)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    while True:
+        with _connection_pools_lock:
+            pool = _connection_pools.setdefault(pool_key, [])
+            connection = pool.pop() if pool else None
+        reused = connection is not None
+        if connection is None:
+            connection_cls = (
+                http.client.HTTPSConnection
+                if parts.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_cls(parts.hostname or "", parts.port)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            connection.close()
+            raise TimeoutError(f"Loading {url=} exceeded its deadline.")
+        connection.timeout = remaining
+        if connection.sock is not None:
+            connection.sock.settimeout(remaining)
+        connection.response_class = functools.partial(  # type: ignore[assignment]
+            _DeadlineResponse, deadline=deadline
+        )
+
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ):
+            connection.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            with _connection_pools_lock:
+                _connection_pools[pool_key].append(connection)
+        return response.status, response.msg, body
+
+
+class _DeadlineSocketReader(io.RawIOBase):
+    """
+    Reads from a socket with the time left until the deadline as the timeout of every read.
+    """
+
+    def __init__(self, sock: socket.socket, deadline: float) -> None:
+        super().__init__()
+        self._sock = sock
+        self._deadline = deadline
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Reading the response exceeded its deadline.")
+        self._sock.settimeout(remaining)
+        return self._sock.recv_into(buffer)
+
+
+class _DeadlineResponse(http.client.HTTPResponse):
+    def __init__(self, sock: Any, *args: Any, deadline: float, **kwargs: Any) -> None:
+        super().__init__(sock, *args, **kwargs)
+        # Replaces the socket file, and closes it so it does not keep the socket open.
+        self.fp.close()
+        self.fp = io.BufferedReader(_DeadlineSocketReader(sock, deadline))
+
+
+def _cache_file_path(url: str, cache_dir: Path | str) -> Path:
+    return Path(cache_dir, hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+
+def _read_cache_file(
+    url: str, cache_dir: Path | str | None
+) -> Tuple[str | None, Dict[str, Any]] | None:
+    if cache_dir is None:
+        return None
+    try:
+        cached = json.loads(_cache_file_path(url=url, cache_dir=cache_dir).read_text())
+        if cached.get("url") != url:
+            return None
+        content = _parse_body(
+            url=url,
+            content_type=cached["content_type"],
+            body=base64.b64decode(cached["body"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError):
+        return None
+    return cached.get("etag"), content
+
+
+def _write_cache_file(
+    url: str,
+    cache_dir: Path | str | None,
+    etag: str | None,
+    content_type: str,
+    body: bytes,
+) -> None:
+    """
+    Writes the raw response to the cache directory atomically, so concurrent processes never read a partial file.
+    Failures are logged and ignored, since the cache only serves loads when the server is unavailable.
+    """
+    if cache_dir is None:
+        return
+    cached = {
+        "url": url,
+        "etag": etag,
+        "content_type": content_type,
+        "body": base64.b64encode(body).decode(),
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump(cached, file)
+            os.replace(temp_path, _cache_file_path(url=url, cache_dir=cache_dir))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, TypeError, ValueError) as error:
+        logger.warning("Could not cache the response of %s: %r", url, error)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+from confident.loaders.source_loader_base import SourceLoader
+from confident.utils import convert_field_value
+
+# Kubernetes mounts secrets as `<key> -> ..data/<key>` symlinks, where `..data` itself is a symlink
+# to a timestamped directory that is swapped atomically on every update.
+K8S_DATA_DIR = "..data"
+K8S_INTERNAL_PREFIX = ".."
+
+# Secret file contents cached by path and validated by the file inode, modification time and size.
+_secrets_cache: Dict[str, Tuple[Tuple[int, int, int], str]] = {}
+
+
+class SecretsSourceLoader(SourceLoader):
+    NAME = ConfigSource.secrets
+    PARALLEL_SAFE = True
+
+    def __init__(self, file_secret_settings_callable: Callable | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.file_secret_settings_callable = file_secret_settings_callable
+
+    def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
+        """
+        Loads requested config fields from secrets directories, where every file name is a field name
+        and the file content is its value (Docker secrets, Kubernetes mounted secrets).
+        When multiple directories are provided, the latter ones take priority.
+
+        Raises:
+            ValueError - If the directory is not exists and ignore_missing_files=False.
+        """
+        case_sensitive = getattr(
+            self.file_secret_settings_callable, "case_sensitive", False
+        )
+        field_names = type(settings).model_fields.keys()
+
+        fields: Dict[str, ConfigField] = {}
+        for secrets_dir in self.specs.secrets_dir:
+            entries = scan_secrets_dir(secrets_dir)
+            if entries is None:
+                if self.specs.ignore_missing_files:
+                    continue
+                raise ValueError(f"{secrets_dir=} is not exists.")
+            if not case_sensitive:
+                entries = {name.lower(): entry for name, entry in entries.items()}
+
+            for field_name in field_names:
+                entry = entries.get(
+                    field_name if case_sensitive else field_name.lower()
+                )
+                if entry is None:
+                    continue
+                value = read_secret(entry)
+                fields[field_name] = ConfigField(
+                    name=field_name,
+                    value=convert_field_value(
+                        settings=settings, field_name=field_name, origin_value=value
+                    ),
+                    origin_value=SecretStr(value),
+                    source_name=entry.name,
+                    source_type=ConfigSource.secrets,
+                    source_location=Path(secrets_dir, entry.name),
+                )
+
+        return list(fields.values())
+
+
+def scan_secrets_dir(path: Path | str) -> Dict[str, os.DirEntry] | None:
+    """
+    Lists the secret files of a directory with a single `os.scandir` call.
+    If the directory has the Kubernetes `..data` layout, the files are listed from the current data directory,
+    so all the values are taken from the same secret version.
+
+    Returns:
+        A dictionary of the secret file names and their directory entries. None if the directory is not exists.
+    """
+    try:
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    for entry in entries:
+        if entry.name == K8S_DATA_DIR and entry.is_dir():
+            with os.scandir(entry.path) as iterator:
+                entries = list(iterator)
+            break
+
+    return {
+        entry.name: entry
+        for entry in entries
+        if not entry.name.startswith(K8S_INTERNAL_PREFIX) and entry.is_file()
+    }
+
+
+def read_secret(entry: os.DirEntry) -> str:
+    """
+    Reads the content of a secret file.
+    The content is reused from previous loads as long as the file inode, modification time and size are unchanged.
+    """
+    stat = entry.stat()
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _secrets_cache.get(entry.path)
+    if cached and cached[0] == identity:
+        return cached[1]
+
+    value = Path(entry.path).read_text().strip()
+    _secrets_cache[entry.path] = (identity, value)
+    return value
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar, List
+from typing import ClassVar, Dict, List, Mapping, Tuple
 
 from pydantic_settings import BaseSettings
 
@@ -10,9 +10,28 @@ from confident.config_field import ConfigField
 
 class SourceLoader(ABC):
     NAME: ClassVar[ConfigSource]
+    # The sources that have to be loaded before this source.
+    DEPENDS_ON: ClassVar[Tuple[ConfigSource, ...]] = ()
+    # Whether the loader can run on a worker thread, concurrently with other loaders.
+    PARALLEL_SAFE: ClassVar[bool] = False
 
     def __init__(self, specs: ConfigSpecs | None = None):
         self.specs = specs or ConfigSpecs()
 
     @abstractmethod
     def load_fields(self, settings: BaseSettings) -> List[ConfigField]: ...
+
+    def is_ready(
+        self, loaded_fields: Mapping[ConfigSource, Dict[str, ConfigField]]
+    ) -> bool:
+        """
+        Args:
+            loaded_fields: The fields of the sources that were already loaded.
+
+        Returns:
+            Whether the loader can start. Dependencies that are not in the source priority are ignored.
+        """
+        return all(
+            source in loaded_fields or source not in self.specs.source_priority
+            for source in self.DEPENDS_ON
+        )
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import quote
+from weakref import WeakKeyDictionary
+
+from pydantic_settings import BaseSettings
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+from confident.loaders.source_loader_base import SourceLoader
+from confident.utils import convert_field_value
+
+# Rows of a single scope: {key: (rowid, value)}.
+ScopeRows = Dict[str, Tuple[int, str]]
+
+_TABLE_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# The field names of every config class, computed once per class.
+_field_names: WeakKeyDictionary[type, Tuple[str, ...]] = WeakKeyDictionary()
+
+# Connections are reused per thread, since sqlite connections cannot be shared between threads.
+_thread_local = threading.local()
+
+
+class SQLiteSourceLoader(SourceLoader):
+    NAME = ConfigSource.sqlite
+    # Runs on the creating thread, since the rows prefetched by `from_sqlite_scopes` are thread local.
+    PARALLEL_SAFE = False
+
+    def load_fields(self, settings: BaseSettings) -> List[ConfigField]:
+        """
+        Loads requested config fields of a scope from a sqlite key/value table with `scope`, `key` and `value`
+        columns. Only the keys of the declared fields are fetched, in a single query.
+
+        Raises:
+            ValueError - If the table name is not valid.
+            ValueError - If the database file is not exists and ignore_missing_files=False.
+        """
+        path = self.specs.sqlite_path
+        if path is None:
+            return []
+        if not os.path.isfile(path):
+            if self.specs.ignore_missing_files:
+                return []
+            raise ValueError(f"{path=} is not exists.")
+
+        table = self.specs.sqlite_table
+        scope = self.specs.sqlite_scope
+        field_names = sqlite_field_names(type(settings))
+        rows = _get_prefetched_rows(
+            path=path, table=table, field_names=field_names, scope=scope
+        )
+        if rows is None:
+            rows = fetch_sqlite_scopes(
+                path=path,
+                table=table,
+                scopes=[scope],
+                field_names=field_names,
+                read_only=self.specs.sqlite_read_only,
+            )[scope]
+
+        return [
+            ConfigField(
+                name=key,
+                value=convert_field_value(
+                    settings=settings, field_name=key, origin_value=value
+                ),
+                origin_value=value,
+                source_name=scope,
+                source_type=ConfigSource.sqlite,
+                source_location=f"{path}:{table}:{rowid}",
+            )
+            for key, (rowid, value) in rows.items()
+        ]
+
+
+def sqlite_field_names(config_cls: type) -> Tuple[str, ...]:
+    """
+    Returns: The field names of the config class, computed once per class.
+    """
+    field_names = _field_names.get(config_cls)
+    if field_names is None:
+        field_names = tuple(config_cls.model_fields)  # type: ignore[attr-defined]
+        _field_names[config_cls] = field_names
+    return field_names
+
+
+def fetch_sqlite_scopes(
+    path: Path | str,
+    table: str,
+    scopes: Iterable[str],
+    field_names: Iterable[str],
+    read_only: bool = True,
+) -> Dict[str, ScopeRows]:
+    """
+    Fetches the rows of the given fields for multiple scopes in a single query.
+    The query is split into chunks if it has more parameters than the sqlite limit of the connection.
+
+    Returns:
+        A dictionary of every scope and its rows.
+
+    Raises:
+        ValueError - If the table name is not valid.
+    """
+    if not _TABLE_NAME_PATTERN.fullmatch(table):
+        raise ValueError(f"{table=} is not a valid table name.")
+    scopes_list = list(scopes)
+    keys = list(field_names)
+    result: Dict[str, ScopeRows] = {scope: {} for scope in scopes_list}
+    if not scopes_list or not keys:
+        return result
+
+    connection = _get_connection(path=path, read_only=read_only)
+    max_variables = connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    # Usually all the keys fit in a chunk, and the rest of the parameters are left to the scopes.
+    keys_chunk_size = min(
+        len(keys), max(max_variables // 2, max_variables - len(scopes_list))
+    )
+    for keys_start in range(0, len(keys), keys_chunk_size):
+        keys_chunk = keys[keys_start : keys_start + keys_chunk_size]
+        scopes_chunk_size = max_variables - len(keys_chunk)
+        for scopes_start in range(0, len(scopes_list), scopes_chunk_size):
+            scopes_chunk = scopes_list[scopes_start : scopes_start + scopes_chunk_size]
+            query = (
+                f'SELECT rowid, scope, key, value FROM "{table}" '
+                f"WHERE scope IN ({', '.join('?' * len(scopes_chunk))}) "
+                f"AND key IN ({', '.join('?' * len(keys_chunk))})"
+            )
+            for rowid, scope, key, value in connection.execute(
+                query, [*scopes_chunk, *keys_chunk]
+            ):
+                result[scope][key] = (rowid, value)
+    return result
+
+
+@contextmanager
+def prefetch_sqlite_scopes(
+    path: Path | str,
+    table: str,
+    scopes: Iterable[str],
+    field_names: Iterable[str],
+    read_only: bool = True,
+) -> Iterator[Dict[str, ScopeRows]]:
+    """
+    Fetches the rows of multiple scopes in a single query, to be used by the configs created in the current
+    thread inside the context instead of querying the database for every scope.
+    """
+    field_names = tuple(field_names)
+    rows = fetch_sqlite_scopes(
+        path=path,
+        table=table,
+        scopes=scopes,
+        field_names=field_names,
+        read_only=read_only,
+    )
+    previous = getattr(_thread_local, "prefetched", None)
+    _thread_local.prefetched = ((str(path), table, field_names), rows)
+    try:
+        yield rows
+    finally:
+        _thread_local.prefetched = previous
+
+
+def _get_prefetched_rows(
+    path: Path | str, table: str, field_names: Tuple[str, ...], scope: str
+) -> ScopeRows | None:
+    prefetched = getattr(_thread_local, "prefetched", None)
+    if prefetched is None or prefetched[0] != (str(path), table, field_names):
+        return None
+    rows: ScopeRows | None = prefetched[1].get(scope)
+    return rows
+
+
+def _get_connection(path: Path | str, read_only: bool) -> sqlite3.Connection:
+    """
+    Returns a connection to the database that is reused by the current thread.
+    The connection is reopened if the database file was replaced.
+    """
+    connections: Dict[Tuple[str, bool], Tuple[Tuple[int, int], sqlite3.Connection]]
+    connections = _thread_local.__dict__.setdefault("connections", {})
+    stat = os.stat(path)
+    identity = (stat.st_dev, stat.st_ino)
+    key = (str(path), read_only)
+
+    cached = connections.get(key)
+    if cached and cached[0] == identity:
+        return cached[1]
+    if cached:
+        cached[1].close()
+
+    if read_only:
+        connection = sqlite3.connect(
+            f"file:{quote(os.path.abspath(path))}?mode=ro", uri=True
+        )
+        connection.execute("PRAGMA query_only = 1")
+    else:
+        connection = sqlite3.connect(path)
+    connections[key] = (identity, connection)
+    return connection
@@ -0,0 +1,132 @@
+"""
+Sharded config maps: a directory with a config file for every map name, e.g. 'config_map/prod.yaml'.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from confident.bundle import BUNDLE_SEPARATOR, open_bundle, split_bundle_path
+from confident.file_refs import RefResolver
+from confident.utils import COMPRESSION_OPENERS, JSON_SUFFIXES, YAML_SUFFIXES
+
+CONFIG_SUFFIXES = JSON_SUFFIXES + YAML_SUFFIXES
+
+
+class ShardsListing(NamedTuple):
+    # The inode and modification time of the directory, which changes whenever a file is added, removed or renamed.
+    identity: Tuple[int, int]
+    # The shard file path of every map name.
+    shards: Dict[str, str]
+
+
+# Listings of sharded config maps cached by the directory path, and validated by the directory identity.
+_listings_cache: Dict[str, ShardsListing] = {}
+
+
+def list_map_shards(path: Path | str) -> Dict[str, str] | None:
+    """
+    Lists the shards of a sharded config map: every `<map_name>.json|yaml|yml` file in the directory, possibly
+    compressed (e.g. 'prod.json.gz'). Hidden files are ignored. No shard is read.
+    The listing is reused as long as the directory modification time is unchanged, so looking up a map name costs
+    a single `stat` of the directory. The shards themselves are checked for changes when they are loaded.
+
+    A directory inside a bundle (e.g. 'bundle.zip!/config_map') is listed from the names of the bundled files.
+
+    Returns:
+        The shard file path of every map name, or None if the path is not a directory.
+
+    Raises:
+        ValueError - If the path is not exists.
+        ValueError - If a map name has more than one shard.
+    """
+    split_path = split_bundle_path(path)
+    if split_path is not None:
+        return _list_bundled_shards(*split_path)
+
+    try:
+        path_stat = os.stat(path)
+    except FileNotFoundError:
+        raise ValueError(f"{path=} is not exists.")
+    if not stat.S_ISDIR(path_stat.st_mode):
+        return None
+
+    identity = (path_stat.st_ino, path_stat.st_mtime_ns)
+    cached = _listings_cache.get(str(path))
+    if cached and cached.identity == identity:
+        return cached.shards
+
+    # The names are split with string operations, since creating a `Path` for every file of a large directory
+    # costs more than listing it.
+    shards: Dict[str, str] = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                _add_shard(shards, path, entry.name, entry.path)
+
+    _listings_cache[str(path)] = ShardsListing(identity=identity, shards=shards)
+    return shards
+
+
+def _list_bundled_shards(bundle_path: str, directory: str) -> Dict[str, str] | None:
+    bundle = open_bundle(bundle_path)
+    if directory not in bundle.directories:
+        return None
+    path = f"{bundle_path}{BUNDLE_SEPARATOR}{directory}"
+    cached = _listings_cache.get(path)
+    if cached and cached.identity == bundle.identity[:2]:
+        return cached.shards
+
+    shards: Dict[str, str] = {}
+    for name in bundle.names:
+        parent, _, file_name = name.rpartition("/")
+        if parent == directory:
+            _add_shard(shards, path, file_name, f"{path}/{file_name}")
+
+    _listings_cache[path] = ShardsListing(identity=bundle.identity[:2], shards=shards)
+    return shards
+
+
+def _add_shard(
+    shards: Dict[str, str], path: Path | str, file_name: str, file_path: str
+) -> None:
+    """
+    Adds a file of a sharded config map directory by its map name, unless it is hidden or not a config file.
+
+    Raises:
+        ValueError - If the map name already has a shard.
+    """
+    if file_name.startswith("."):
+        return
+    map_name, _, format_suffix = file_name.rpartition(".")
+    if f".{format_suffix}" in COMPRESSION_OPENERS:
+        map_name, _, format_suffix = map_name.rpartition(".")
+    if f".{format_suffix}" not in CONFIG_SUFFIXES or not map_name:
+        return
+    if map_name in shards:
+        raise ValueError(
+            f"{map_name=} has more than one shard in {path=}: "
+            f"{os.path.basename(shards[map_name])}, {file_name}."
+        )
+    shards[map_name] = file_path
+
+
+def list_map_names(
+    config_map: Path | str | Dict[str, Any], cache_dir: Path | str | None = None
+) -> List[str]:
+    """
+    Returns: The sorted map names of a config map. The shards of a sharded config map are not read, while a config
+        map file is loaded (and cached) as usual.
+
+    Raises:
+        ValueError - If the config map is not exists or is not a valid config file.
+    """
+    if isinstance(config_map, dict):
+        return sorted(config_map)
+    shards = list_map_shards(config_map)
+    if shards is not None:
+        return sorted(shards)
+    return sorted(RefResolver(cache_dir=cache_dir).resolve(config_map).content)
@@ -0,0 +1,132 @@
+"""
+Overriding the values of config objects in place, without loading their sources again. Mainly for tests.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Tuple
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+
+if TYPE_CHECKING:
+    from confident.confident import BaseConfig
+
+# The source name and location of overridden fields in the provenance.
+OVERRIDE_SOURCE_NAME = "override_config"
+
+# Values that override every object of a config class that is created inside `override_config`, by the class.
+# The values are replaced and never mutated, since they are shared by the contexts that copied them.
+_class_overrides: ContextVar[Dict[type, Dict[str, Any]] | None] = ContextVar(
+    "_class_overrides", default=None
+)
+
+
+@contextmanager
+def override_config(
+    config: BaseConfig | type[BaseConfig], **values: Any
+) -> Iterator[None]:
+    """
+    Overrides values of a config object inside the context. The values are validated, but the sources are not
+    loaded again, so it is much cheaper than creating another object. The previous values and their provenance
+    are restored when the context exits.
+    With a config class, the values override every object of the class that is created inside the context.
+
+    Args:
+        config: The config object or class to override.
+        values: The new values by the field names.
+
+    Raises:
+        ValueError - If a value is not of a field of the config class.
+        pydantic.ValidationError - If a value is not valid.
+    """
+    config_class = config if isinstance(config, type) else type(config)
+    _check_fields(config_class, values)
+
+    if isinstance(config, type):
+        overrides = _class_overrides.get() or {}
+        token = _class_overrides.set(
+            {**overrides, config: {**overrides.get(config, {}), **values}}
+        )
+        try:
+            yield
+        finally:
+            _class_overrides.reset(token)
+        return
+
+    previous = apply_overrides(config, values)
+    try:
+        yield
+    finally:
+        _restore(config, previous)
+
+
+def class_overrides(config_class: type) -> Dict[str, Any] | None:
+    """
+    Returns: A copy of the values that override the objects of the config class that are created now,
+        if there are any.
+    """
+    overrides = _class_overrides.get()
+    if not overrides or config_class not in overrides:
+        return None
+    return dict(overrides[config_class])
+
+
+def apply_overrides(
+    config: BaseConfig, values: Dict[str, Any]
+) -> Dict[str, Tuple[Any, ConfigField | None]]:
+    """
+    Validates the values and sets them on the config object, with an `init` provenance named `override_config`.
+
+    Returns:
+        The previous value and provenance of every overridden field, for restoring them.
+
+    Raises:
+        pydantic.ValidationError - If a value is not valid.
+    """
+    # Validates on a copy, the same way as an assignment, so the object is unchanged if a value is not valid.
+    scratch = config.model_copy()
+    for name, value in values.items():
+        type(config).__pydantic_validator__.validate_assignment(scratch, name, value)
+    validated = scratch.__dict__
+    full_fields = config.__full_fields__
+    keep_provenance = config.__specs__.provenance != "none"
+
+    previous = {}
+    for name, origin_value in values.items():
+        previous[name] = (config.__dict__[name], full_fields.get(name))
+        config.__dict__[name] = validated[name]
+        if keep_provenance:
+            full_fields[name] = ConfigField(
+                name=name,
+                value=validated[name],
+                origin_value=origin_value,
+                source_name=OVERRIDE_SOURCE_NAME,
+                source_type=ConfigSource.init,
+                source_location=OVERRIDE_SOURCE_NAME,
+            )
+        config._reset_field_hash(name)
+    config._reset_serialization_cache()
+    return previous
+
+
+def _restore(
+    config: BaseConfig, previous: Dict[str, Tuple[Any, ConfigField | None]]
+) -> None:
+    full_fields = config.__full_fields__
+    for name, (value, field) in previous.items():
+        config.__dict__[name] = value
+        if field is None:
+            full_fields.pop(name, None)
+        else:
+            full_fields[name] = field
+        config._reset_field_hash(name)
+    config._reset_serialization_cache()
+
+
+def _check_fields(config_class: type, values: Dict[str, Any]) -> None:
+    unknown_names = sorted(set(values) - set(config_class.model_fields))  # type: ignore[attr-defined]
+    if unknown_names:
+        raise ValueError(f"{unknown_names=} are not fields of {config_class.__name__}.")
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Tuple
+
+CALLER_INSPECTION_PHASE = "caller_inspection"
+SPECS_PHASE = "specs"
+LOADER_PHASE_PREFIX = "loader:"
+PRIORITIZATION_PHASE = "prioritization"
+SETTINGS_PHASE = "settings"
+VALIDATION_PHASE = "validation"
+TOTAL_PHASE = "total"
+
+# A shared context for the phases when nothing is profiled, so timing points cost almost nothing.
+_NO_PHASE = nullcontext()
+
+
+class ConstructionProfile:
+    """
+    Collects the time spent in every phase of config objects creation, and the files that were parsed.
+    """
+
+    def __init__(self) -> None:
+        self.constructions = 0
+        self.phases: Dict[str, float] = {}
+        self.files: List[Dict[str, Any]] = []
+        # The total time of every object creation, with the name of its class.
+        self.creations: List[Tuple[float, str]] = []
+
+    def add_phase(self, name: str, seconds: float, label: str | None = None) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if name == TOTAL_PHASE:
+            self.constructions += 1
+            if label is not None:
+                self.creations.append((seconds, label))
+
+    def add_file(self, path: Path | str, size: int, seconds: float) -> None:
+        self.files.append(
+            {"path": str(path), "bytes": size, "parse_ms": seconds * 1000}
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns: The average time of every phase per object in milliseconds, and the parsed files.
+            Validation is the time pydantic-settings spent outside the loaders.
+        """
+        phases = dict(self.phases)
+        settings_seconds = phases.pop(SETTINGS_PHASE, 0.0)
+        loading_seconds = sum(
+            seconds
+            for name, seconds in phases.items()
+            if name.startswith(LOADER_PHASE_PREFIX) or name == PRIORITIZATION_PHASE
+        )
+        phases[VALIDATION_PHASE] = max(settings_seconds - loading_seconds, 0.0)
+        phases[TOTAL_PHASE] = phases.pop(TOTAL_PHASE, 0.0)
+
+        constructions = max(self.constructions, 1)
+        return {
+            "constructions": self.constructions,
+            "phases_ms": {
+                name: seconds * 1000 / constructions for name, seconds in phases.items()
+            },
+            "files": self.files,
+        }
+
+
+_current_profile: ContextVar[ConstructionProfile | None] = ContextVar(
+    "_current_profile", default=None
+)
+
+
+def current_profile() -> ConstructionProfile | None:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_constructions() -> Iterator[ConstructionProfile]:
+    """
+    Profiles the config objects that are created inside the context.
+    """
+    profile = ConstructionProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "label", "start")
+
+    def __init__(
+        self, profile: ConstructionProfile, name: str, label: str | None = None
+    ) -> None:
+        self.profile = profile
+        self.name = name
+        self.label = label
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.profile.add_phase(
+            self.name, time.perf_counter() - self.start, label=self.label
+        )
+
+
+def profile_phase(name: str, label: str | None = None) -> ContextManager[None]:
+    """
+    Returns: A context that adds its duration to the phase of the current profile, if there is one.
+        The label names what the phase belongs to, e.g. the config class of a creation.
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NO_PHASE
+    return _Phase(profile, name, label)
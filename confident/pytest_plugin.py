@@ -0,0 +1,67 @@
+"""
+A pytest plugin, registered with the `pytest11` entry point.
+`--confident-durations N` reports the N slowest config objects creations of the session in the terminal summary.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Generator, List, Tuple
+
+import pytest
+
+from confident.profiling import profile_constructions
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("confident")
+    group.addoption(
+        "--confident-durations",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Show the N slowest config objects creations (N=0 for all).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    count = config.getoption("confident_durations")
+    if count is not None:
+        config.pluginmanager.register(
+            CreationDurations(count=count), "confident-durations"
+        )
+
+
+class CreationDurations:
+    """
+    Profiles the config objects creations of every test, and keeps the slowest ones of the session.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.creations = 0
+        # A min heap of the slowest creations: the seconds, the config class and the test id.
+        self.slowest: List[Tuple[float, str, str]] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(
+        self, item: pytest.Item, nextitem: pytest.Item | None
+    ) -> Generator[None, Any, None]:
+        with profile_constructions() as profile:
+            yield
+        self.creations += len(profile.creations)
+        for seconds, class_name in profile.creations:
+            creation = (seconds, class_name, item.nodeid)
+            if self.count and len(self.slowest) >= self.count:
+                heapq.heappushpop(self.slowest, creation)
+            else:
+                heapq.heappush(self.slowest, creation)
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        terminalreporter.write_sep(
+            "=", f"slowest config creations ({self.creations} creations)"
+        )
+        for seconds, class_name, node_id in sorted(self.slowest, reverse=True):
+            terminalreporter.write_line(
+                f"{seconds * 1000:8.2f}ms {class_name:<24} {node_id}"
+            )
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple
+
+import yaml  # type: ignore[import-untyped]
+
+from confident.utils import YAML_LOADER, YAML_SUFFIXES
+
+RECORDS_CHUNK_SIZE = 1000
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+class RecordError(NamedTuple):
+    """
+    A record that could not be parsed or validated, in place of its config object.
+    """
+
+    # The position of the record in the input, from 0.
+    position: int
+    record: Any
+    error: Exception
+
+
+def parse_records(
+    records: str | Path | Iterable[Dict[str, Any]],
+) -> Iterator[Dict[str, Any] | RecordError]:
+    """
+    Parses records one at a time from a JSON Lines file (a json object in every line), a multi-document yaml file
+    or an iterable of dictionaries.
+
+    Returns:
+        A generator of the records, with a `RecordError` in place of every record that is not a dictionary.
+        A yaml syntax error ends the records, since the documents that follow it cannot be parsed.
+
+    Raises:
+        ValueError - If the file is not exists.
+        ValueError - If the file format is not supported.
+    """
+    if not isinstance(records, (str, Path)):
+        return _check_records(enumerate(records))
+
+    path = Path(records)
+    if not path.is_file():
+        raise ValueError(f"{path=} is not exists.")
+    if path.suffix in JSON_LINES_SUFFIXES:
+        return _check_records(_parse_json_lines(path))
+    if path.suffix in YAML_SUFFIXES:
+        return _check_records(_parse_yaml_documents(path))
+    raise ValueError(f"{path=} is not a supported records file.")
+
+
+def _parse_json_lines(path: Path) -> Iterator[tuple[int, Any]]:
+    with open(path, mode="rb") as file:
+        index = 0
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield index, json.loads(line)
+            except ValueError as error:
+                yield (
+                    index,
+                    RecordError(
+                        position=index,
+                        record=line.decode(errors="replace"),
+                        error=error,
+                    ),
+                )
+            index += 1
+
+
+def _parse_yaml_documents(path: Path) -> Iterator[tuple[int, Any]]:
+    with open(path, mode="rb") as file:
+        index = 0
+        try:
+            for document in yaml.load_all(file, Loader=YAML_LOADER):
+                if document is not None:
+                    yield index, document
+                    index += 1
+        except yaml.YAMLError as error:
+            yield (
+                index,
+                RecordError(
+                    position=index, record=None, error=ValueError(f"{path=}: {error}")
+                ),
+            )
+
+
+def _check_records(
+    indexed_records: Iterable[tuple[int, Any]],
+) -> Iterator[Dict[str, Any] | RecordError]:
+    for index, record in indexed_records:
+        if isinstance(record, RecordError) or isinstance(record, dict):
+            yield record
+        else:
+            yield RecordError(
+                position=index,
+                record=record,
+                error=ValueError(f"Record {index} has to be a dict."),
+            )
+
+
+def chunked(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def map_chunks(
+    function: Callable[[Any, List[Any]], List[Any]],
+    context: Any,
+    chunks: Iterable[List[Any]],
+    processes: int | None = None,
+) -> Iterator[Any]:
+    """
+    Applies a function to every chunk with a shared context, and yields the results of all the chunks in order.
+    With `processes`, chunks are processed by a process pool. Only a few chunks are submitted ahead of the
+    results that were yielded, so the memory is bounded regardless of the number of chunks.
+    The function and the context have to be picklable.
+    """
+    if not processes:
+        for chunk in chunks:
+            yield from function(context, chunk)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=processes)
+    try:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(function, context, chunk))
+            if len(pending) > processes * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def deep_merge(*mappings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merges dictionaries the same way pydantic-settings merges its sources: the latter ones take priority, and
+    dictionaries that are in several of them are merged recursively.
+
+    Returns:
+        A new dictionary, the merged dictionaries are not changed.
+    """
+    merged: Dict[str, Any] = {}
+    for mapping in mappings:
+        for key, value in mapping.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = deep_merge(merged[key], value)
+            else:
+                merged[key] = value
+    return merged
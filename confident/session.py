@@ -0,0 +1,160 @@
+"""
+Sessions: many config objects created over the same snapshot of their sources.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Type,
+    TypeVar,
+)
+
+from confident.utils import get_caller_file_path
+
+if TYPE_CHECKING:
+    from confident.confident import BaseConfig
+
+ConfigT = TypeVar("ConfigT", bound="BaseConfig")
+
+_current_session: ContextVar[ConfigSession | None] = ContextVar(
+    "_current_session", default=None
+)
+
+
+def current_session() -> ConfigSession | None:
+    return _current_session.get()
+
+
+class ConfigSession:
+    """
+    Creates config objects over shared sources: the environment variables are read once when the session starts,
+    and every config file (including config maps and `$ref` references) is resolved and checked for changes once.
+    Objects that are created inside the `with` block share the session too, not only the ones of `load`.
+    Files that change while the session is active are not loaded again, and the caches are released on exit.
+
+    Example:
+        with ConfigSession() as session:
+            db_config = session.load(DbConfig)
+            api_config, worker_config = session.load_all([ApiConfig, WorkerConfig])
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Args:
+            max_workers: The number of threads that `load_all` creates objects with. Defaults to the number of
+                classes.
+        """
+        self.max_workers = max_workers
+        # A snapshot of the environment variables, taken when the session starts.
+        self.environ: Dict[str, str] = {}
+        # Resolved config files by their real path, and file identities by their path (see `RefResolver`).
+        self.resolved_files: Dict[str, Any] = {}
+        self.file_identities: Dict[str, Any] = {}
+        self._shared: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._active = False
+        self._tokens: List[Any] = []
+
+    def __enter__(self) -> ConfigSession:
+        self.environ = dict(os.environ)
+        self._active = True
+        self._tokens.append(_current_session.set(self))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _current_session.reset(self._tokens.pop())
+        if not self._tokens:
+            self.release()
+
+    def release(self) -> None:
+        """
+        Drops the snapshot and the shared caches of the session.
+        """
+        self._active = False
+        self.environ = {}
+        self.resolved_files = {}
+        self.file_identities = {}
+        self._shared = {}
+
+    def shared(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Returns: The value of the key that is shared by all the objects of the session, built once by `build`.
+        """
+        with self._lock:
+            if key not in self._shared:
+                self._shared[key] = build()
+            return self._shared[key]
+
+    def load(self, config_class: Type[ConfigT], **values: Any) -> ConfigT:
+        """
+        Creates a config object in the session.
+
+        Args:
+            config_class: The config class to create.
+            values: The keyword arguments of the object, the same as the ones of the class constructor.
+
+        Raises:
+            ValueError - If the session is not active.
+        """
+        return self._load(config_class, values, get_caller_file_path())
+
+    def load_all(self, config_classes: Iterable[Type[BaseConfig]]) -> List[BaseConfig]:
+        """
+        Creates an object of every config class concurrently, in a thread for every class. Creating objects
+        concurrently pays off when their sources are slow to read, e.g. files on network storage.
+
+        Returns:
+            The objects in the order of the classes.
+
+        Raises:
+            ValueError - If the session is not active.
+            ValueError - If a class appears more than once, since objects of the same class cannot be created
+                concurrently.
+        """
+        config_classes = list(config_classes)
+        if len(set(config_classes)) != len(config_classes):
+            raise ValueError("Every config class can appear only once.")
+        if not config_classes:
+            return []
+
+        creation_path = get_caller_file_path()
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers or len(config_classes),
+            thread_name_prefix="confident-session",
+        ) as executor:
+            futures = [
+                # Every object is created in a copy of the current context, e.g. for profiling.
+                executor.submit(
+                    copy_context().run, self._load, config_class, {}, creation_path
+                )
+                for config_class in config_classes
+            ]
+            return [future.result() for future in futures]
+
+    def _load(
+        self, config_class: Type[ConfigT], values: Dict[str, Any], creation_path: Any
+    ) -> ConfigT:
+        if not self._active:
+            raise ValueError("The session is not active, use it in a `with` block.")
+        token = _current_session.set(self)
+        try:
+            return config_class(_creation_path=creation_path, **values)
+        finally:
+            _current_session.reset(token)
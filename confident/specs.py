@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from copy import copy
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List, Literal, Tuple
+from weakref import WeakValueDictionary
 
 from pydantic import BaseModel
 
+from confident.bundle import read_bytes
 from confident.config_source import ConfigSource
 from confident.map_field import MAP_FIELD_FLAG
 
 IGNORE_MISSING_FILES_DEFAULT = True
+REMOTE_TIMEOUT_DEFAULT = 5.0
+# How many details about the loaded fields are kept after the object is created.
+ProvenanceLevel = Literal["full", "winners", "none"]
+PROVENANCE_DEFAULT: ProvenanceLevel = "full"
+SQLITE_TABLE_DEFAULT = "config"
+SQLITE_SCOPE_DEFAULT = "default"
 DEFAULT_SOURCE_PRIORITY = [
     ConfigSource.init,
     ConfigSource.env_var,
+    ConfigSource.dotenv,
+    ConfigSource.secrets,
+    ConfigSource.sqlite,
+    ConfigSource.remote,
     ConfigSource.map,
     ConfigSource.file,
     ConfigSource.class_default,
@@ -26,12 +39,40 @@ class ConfigSpecs(BaseModel):
     specs_path: Path | None = None
     files: List[Path] = []
     ignore_missing_files: bool = IGNORE_MISSING_FILES_DEFAULT
+    deep_merge_files: bool = False
+    file_cache_dir: Path | None = None
+    env_files: List[Path] = []
+    secrets_dir: List[Path] = []
+    sqlite_path: Path | None = None
+    sqlite_table: str = SQLITE_TABLE_DEFAULT
+    sqlite_scope: str = SQLITE_SCOPE_DEFAULT
+    sqlite_read_only: bool = True
+    remote_url: str | None = None
+    remote_timeout: float = REMOTE_TIMEOUT_DEFAULT
+    remote_cache_dir: Path | None = None
     map_name: str | None = None
     map_field: str | None = None
     config_map: Path | dict | None = None
     class_path: Path | None = None
     creation_path: Path | None = None
     source_priority: List[ConfigSource] = DEFAULT_SOURCE_PRIORITY
+    interpolate: bool = False
+    parallel_loading: bool = False
+    validation_memo: bool = False
+    provenance: ProvenanceLevel = PROVENANCE_DEFAULT
+    bundle: Path | None = None
+    bundle_root: Path | None = None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickles only the values that are different from the defaults.
+        defaults = _specs_defaults()
+        return _restore_specs, (
+            {
+                name: value
+                for name, value in self.__dict__.items()
+                if value != defaults[name]
+            },
+        )
 
     @classmethod
     def from_path(
@@ -41,7 +82,7 @@ class ConfigSpecs(BaseModel):
         creation_path: str | Path | None = None,
         source_priority: List[ConfigSource] | None = None,
     ) -> ConfigSpecs:
-        obj = cls.model_validate_json(Path(path).read_text())
+        obj = cls.model_validate_json(read_bytes(path))
         obj.specs_path = Path(path)
         obj.class_path = Path(class_path) if class_path else obj.class_path
         obj.creation_path = Path(creation_path) if creation_path else obj.creation_path
@@ -63,10 +104,27 @@ class ConfigSpecs(BaseModel):
             for key in (
                 "files",
                 "ignore_missing_files",
+                "deep_merge_files",
+                "file_cache_dir",
+                "env_files",
+                "secrets_dir",
+                "sqlite_path",
+                "sqlite_table",
+                "sqlite_scope",
+                "sqlite_read_only",
+                "remote_url",
+                "remote_timeout",
+                "remote_cache_dir",
                 "map_name",
                 "map_field",
                 "config_map",
                 "source_priority",
+                "interpolate",
+                "parallel_loading",
+                "validation_memo",
+                "provenance",
+                "bundle",
+                "bundle_root",
                 "specs",
                 "specs_path",
             )
@@ -89,10 +147,47 @@ class ConfigSpecs(BaseModel):
             else model_config.get("ignore_missing_files", IGNORE_MISSING_FILES_DEFAULT)
         )
 
+        deep_merge_files = values.pop("_deep_merge_files", None)
+        deep_merge_files = (
+            deep_merge_files
+            if deep_merge_files is not None
+            else model_config.get("deep_merge_files", False)
+        )
+
+        env_files = values.pop("_env_files", None) or model_config.get("env_files")
+        env_files = (
+            [env_files] if isinstance(env_files, (str, Path)) else env_files or []
+        )
+
+        secrets_dir = values.pop("_secrets_dir", None) or model_config.get(
+            "secrets_dir"
+        )
+        secrets_dir = (
+            [secrets_dir] if isinstance(secrets_dir, (str, Path)) else secrets_dir or []
+        )
+
         obj = cls(
             specs_path=values.pop("_specs_path", None),
             files=files,
             ignore_missing_files=ignore_missing_files,
+            deep_merge_files=deep_merge_files,
+            file_cache_dir=values.pop("_file_cache_dir", None)
+            or model_config.get("file_cache_dir"),
+            env_files=env_files,
+            secrets_dir=secrets_dir,
+            sqlite_path=values.pop("_sqlite_path", None)
+            or model_config.get("sqlite_path"),
+            sqlite_table=values.pop("_sqlite_table", None)
+            or model_config.get("sqlite_table", SQLITE_TABLE_DEFAULT),
+            sqlite_scope=values.pop("_sqlite_scope", None)
+            or model_config.get("sqlite_scope", SQLITE_SCOPE_DEFAULT),
+            sqlite_read_only=model_config.get("sqlite_read_only", True),
+            remote_url=values.pop("_remote_url", None)
+            or model_config.get("remote_url"),
+            remote_timeout=values.pop("_remote_timeout", None)
+            or model_config.get("remote_timeout", REMOTE_TIMEOUT_DEFAULT),
+            remote_cache_dir=values.pop("_remote_cache_dir", None)
+            or model_config.get("remote_cache_dir"),
             map_name=values.pop("_map_name", None) or model_config.get("map_name"),
             map_field=map_field,
             config_map=values.pop("_config_map", None)
@@ -104,6 +199,17 @@ class ConfigSpecs(BaseModel):
                 or model_config.get("source_priority")
                 or DEFAULT_SOURCE_PRIORITY
             ),
+            interpolate=values.pop("_interpolate", None)
+            or model_config.get("interpolate", False),
+            parallel_loading=values.pop("_parallel_loading", None)
+            or model_config.get("parallel_loading", False),
+            validation_memo=values.pop("_validation_memo", None)
+            or model_config.get("validation_memo", False),
+            provenance=values.pop("_provenance", None)
+            or model_config.get("provenance", PROVENANCE_DEFAULT),
+            bundle=values.pop("_bundle", None) or model_config.get("bundle"),
+            bundle_root=values.pop("_bundle_root", None)
+            or model_config.get("bundle_root"),
         )
         return obj
 
@@ -137,3 +243,53 @@ class ConfigSpecs(BaseModel):
                 f"Cannot have more then one `MapField()` in {model.__class__.__name__} declaration"
             )
         return properties_marked_as_map_field[0]
+
+
+# Specs that are shared by the config objects with equal specs, by their values.
+_shared_specs: WeakValueDictionary[Tuple[Any, ...], ConfigSpecs] = WeakValueDictionary()
+
+
+def share_specs(specs: ConfigSpecs) -> ConfigSpecs:
+    """
+    Returns: An equal specs object that is shared by every config object with equal specs (e.g. objects of the
+        same class created in the same module), instead of a copy for every object. The shared specs are kept
+        as long as an object uses them, and must not be changed.
+    """
+    key = tuple(_hashable(value) for value in specs.__dict__.values())
+    shared = _shared_specs.get(key)
+    if shared is None:
+        _shared_specs[key] = shared = specs
+    return shared
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        # A config map dictionary is compared by identity, since it can be large. It is alive as long as the
+        # shared specs are, so its id is not reused.
+        return dict, id(value)
+    return value
+
+
+def _specs_defaults() -> Dict[str, Any]:
+    return {
+        name: model_field.default
+        for name, model_field in ConfigSpecs.model_fields.items()
+    }
+
+
+def _restore_specs(values: Dict[str, Any]) -> ConfigSpecs:
+    specs = ConfigSpecs.__new__(ConfigSpecs)
+    specs.__setstate__(
+        {
+            "__dict__": {
+                **{name: copy(value) for name, value in _specs_defaults().items()},
+                **values,
+            },
+            "__pydantic_fields_set__": set(values),
+            "__pydantic_extra__": None,
+            "__pydantic_private__": None,
+        }
+    )
+    return specs
@@ -1,13 +1,80 @@
 from __future__ import annotations
 
+import bz2
+import collections.abc
+import datetime
+import gzip
+import hashlib
 import importlib
+import io
 import json
-from pathlib import Path
-from typing import Any, Dict
+import lzma
+import sys
+import time
+import uuid
+import zlib
+from copy import deepcopy
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path, PurePath
+from types import UnionType
+from typing import (
+    IO,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import yaml  # type: ignore[import-untyped]
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from pydantic_settings import BaseSettings
 
+from confident.profiling import current_profile
+
+# The libyaml parser is several times faster than the pure python one, when pyyaml is built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+JSON_SUFFIXES = (".json",)
+YAML_SUFFIXES = (".yaml", ".yml")
+# Openers of decompressing streams by the compression suffix of a file, e.g. 'config_map.json.gz'.
+COMPRESSION_OPENERS: Dict[str, Callable[..., Any]] = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+}
+# Annotations of values that pydantic validates by their items (see `keeps_input_values`).
+_CONTAINER_TYPES = (
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+    collections.abc.Sequence,
+    collections.abc.Mapping,
+)
+_SCALAR_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    Enum,
+    PurePath,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    type(None),
+)
+
 
 def load_file(path: Path | str) -> Dict[str, Any]:
     """
@@ -26,26 +93,117 @@ def load_file(path: Path | str) -> Dict[str, Any]:
     if not path.is_file():
         raise ValueError(f"{path=} is not exists.")
 
-    if path.suffix == ".json":
-        with open(path, mode="r") as file:
-            loaded = json.load(file)
+    return parse_file(path)
+
+
+def parse_file(path: Path) -> Dict[str, Any]:
+    """
+    Parses a config file by the format of the file suffix.
+    Compressed files (e.g. 'config.json.gz', 'config.yaml.xz' or 'config.json.bz2') are opened as a
+    decompressing stream into the parser, so the compressed content is never read into memory at once,
+    and yaml files are never decompressed fully in memory. json files are decompressed fully into the parser,
+    since the json parser is not incremental.
+
+    Raises:
+        ValueError - If the file is not exists.
+        ValueError - If the file format is not supported.
+        ValueError - If the compressed content is not valid.
+        ValueError - If the loaded data is not a dict.
+    """
+    format_suffix, compression_suffix = split_file_suffixes(path)
+    if compression_suffix is None:
+        try:
+            return parse_file_content(path=path, content=path.read_bytes())
+        except FileNotFoundError:
+            raise ValueError(f"{path=} is not exists.")
+    _check_file_format(path, format_suffix)
+
+    start = time.perf_counter()
+    try:
+        with COMPRESSION_OPENERS[compression_suffix](path) as stream:
+            loaded = _parse_stream(format_suffix, stream)
+    except FileNotFoundError:
+        raise ValueError(f"{path=} is not exists.")
+    except (OSError, EOFError, lzma.LZMAError, zlib.error) as error:
+        raise ValueError(f"{path=} is not a valid compressed file: {error}")
+
+    profile = current_profile()
+    if profile is not None:
+        profile.add_file(
+            path=path, size=path.stat().st_size, seconds=time.perf_counter() - start
+        )
+    return _check_loaded(path, loaded)
 
-    elif path.suffix in (".yaml", ".yml"):
-        with open(path, mode="r") as file:
-            loaded = yaml.safe_load(file)
 
+def parse_file_content(path: Path, content: bytes) -> Dict[str, Any]:
+    """
+    Parses the content of a config file by the format of the file suffix, like `parse_file`.
+    Compressed content is decompressed as a stream into the parser.
+
+    Raises:
+        ValueError - If the file format is not supported.
+        ValueError - If the compressed content is not valid.
+        ValueError - If the loaded data is not a dict.
+    """
+    start = time.perf_counter()
+    format_suffix, compression_suffix = split_file_suffixes(path)
+    _check_file_format(path, format_suffix)
+
+    if compression_suffix is None:
+        loaded = _parse_stream(format_suffix, content)
     else:
+        try:
+            with COMPRESSION_OPENERS[compression_suffix](io.BytesIO(content)) as stream:
+                loaded = _parse_stream(format_suffix, stream)
+        except (OSError, EOFError, lzma.LZMAError, zlib.error) as error:
+            raise ValueError(f"{path=} is not a valid compressed file: {error}")
+
+    profile = current_profile()
+    if profile is not None:
+        profile.add_file(
+            path=path, size=len(content), seconds=time.perf_counter() - start
+        )
+    return _check_loaded(path, loaded)
+
+
+def _check_file_format(path: Path, format_suffix: str) -> None:
+    if format_suffix not in JSON_SUFFIXES + YAML_SUFFIXES:
         raise ValueError(f"{path=} is not a supported file.")
 
-    # Check the loaded data
+
+def _check_loaded(path: Path, loaded: Any) -> Dict[str, Any]:
     if loaded is None:
-        loaded = {}
+        return {}
     if not isinstance(loaded, dict):
         raise ValueError(f"{path=} has to have a valid dict content.")
-
     return loaded
 
 
+def split_file_suffixes(path: Path) -> Tuple[str, str | None]:
+    """
+    Returns: The format suffix of a config file (e.g. '.json'), and its compression suffix (e.g. '.gz') if it is
+        compressed.
+    """
+    if path.suffix in COMPRESSION_OPENERS:
+        return Path(path.stem).suffix, path.suffix
+    return path.suffix, None
+
+
+def _parse_stream(format_suffix: str, content: bytes | IO[bytes]) -> Any:
+    if format_suffix in JSON_SUFFIXES:
+        if isinstance(content, bytes):
+            return json.loads(content)
+        return json.load(content)
+    return load_yaml(content)
+
+
+def load_yaml(content: bytes | str | IO[bytes]) -> Any:
+    """
+    Same as `yaml.safe_load`, with the libyaml parser when it is available.
+    """
+    return yaml.load(content, Loader=YAML_LOADER)
+
+
 def get_class_file_path(cls: object) -> str | Path:
     """
     Gets the path that the config class is initiated from.
@@ -62,6 +220,18 @@ def get_class_file_path(cls: object) -> str | Path:
         return Path.cwd()
 
 
+def get_caller_file_path(depth: int = 1) -> str | Path:
+    """
+    Gets the path of the module that called a function, by reading a single frame instead of inspecting the whole
+    stack. If the caller has no module file, returns the current working path. Mainly happens when running on
+    terminal.
+    Args:
+        depth: The number of frames above the function that calls this one, e.g. 1 for its direct caller.
+    """
+    file_path = sys._getframe(depth + 1).f_globals.get("__file__")
+    return file_path if file_path else Path.cwd()
+
+
 def convert_field_value(
     settings: BaseSettings, field_name: str, origin_value: Any
 ) -> Any:
@@ -77,12 +247,24 @@ def convert_field_value(
         The converted origin value. Can also be untouched.
     """
     model_field = type(settings).model_fields.get(field_name)
-    # model_field.annotation can be type annotation and not type.
-    if (
-        model_field
-        and isinstance(model_field.annotation, type)
-        and isinstance(origin_value, model_field.annotation)
-    ):
+    return convert_value(
+        annotation=model_field.annotation if model_field else None,
+        origin_value=origin_value,
+    )
+
+
+def convert_value(annotation: Any, origin_value: Any) -> Any:
+    """
+    Tries to convert a value to the type of the annotation, by loading json strings.
+    Args:
+        annotation: The expected type. Can be None if unknown.
+        origin_value: The original value retrieved from the config source.
+
+    Returns:
+        The converted origin value. Can also be untouched.
+    """
+    # annotation can be type annotation and not type.
+    if isinstance(annotation, type) and isinstance(origin_value, annotation):
         return origin_value
     if isinstance(origin_value, str):
         try:
@@ -90,3 +272,87 @@ def convert_field_value(
         except (TypeError, ValueError):
             pass
     return origin_value
+
+
+def copy_parsed(value: Any) -> Any:
+    """
+    Returns: A deep copy of a parsed (json or yaml) value. Faster than `deepcopy` for dictionaries, lists and
+        scalars, and falls back to it for other values.
+    """
+    if isinstance(value, dict):
+        return {key: copy_parsed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_parsed(item) for item in value]
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    return deepcopy(value)
+
+
+def keeps_input_values(annotation: Any) -> bool:
+    """
+    Returns: Whether pydantic may keep parts of the input value as they are when it validates a value of the
+        annotation, e.g. the nested dictionaries of a `dict` or `Dict[str, Any]` field. Scalars, models and
+        containers of typed items are validated into new objects. Unknown annotations are assumed to keep them.
+    """
+    return _keeps_input_values(annotation, seen=set())
+
+
+def _keeps_input_values(annotation: Any, seen: Set[type]) -> bool:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _keeps_input_values(get_args(annotation)[0], seen)
+    if origin is Literal:
+        return False
+    if origin in (Union, UnionType) or origin in _CONTAINER_TYPES:
+        args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+        return not args or any(_keeps_input_values(arg, seen) for arg in args)
+    if not isinstance(annotation, type) or origin is not None:
+        return True
+    if issubclass(annotation, BaseModel):
+        if annotation in seen:
+            return False
+        seen.add(annotation)
+        return any(
+            _keeps_input_values(model_field.annotation, seen)
+            for model_field in annotation.model_fields.values()
+        )
+    return not issubclass(annotation, _SCALAR_TYPES)
+
+
+def stable_hash(value: Any) -> str:
+    """
+    Hashes a value by its json representation, so equal values have the same hash in every process.
+    Dictionaries are hashed regardless of their keys order, and sets regardless of their iteration order (which
+    depends on the hash seed of the process).
+    Args:
+        value: Any value that pydantic can serialize. Unknown types are represented by `str()`.
+
+    Returns:
+        A hex digest of the value.
+    """
+    return hashlib.blake2b(
+        _canonical_json(_canonical_value(value)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(
+        to_jsonable_python(value, fallback=str),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _canonical_value(value: Any) -> Any:
+    """
+    Returns: The value with every set replaced by a list sorted by the json of its items.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump()
+    if isinstance(value, dict):
+        return {key: _canonical_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical_value(item) for item in value), key=_canonical_json)
+    return value
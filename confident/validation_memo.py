@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import datetime
+import threading
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Hashable, NamedTuple, Tuple
+
+from pydantic import BaseModel
+
+from confident.config_field import ConfigField
+from confident.config_source import ConfigSource
+
+VALIDATION_MEMO_SIZE = 1024
+
+# The sources whose loaded values are cached and shared by all the loads, e.g. the parsed content of files.
+# Their values are copied before they are validated, so they are never changed by a config object.
+CACHED_VALUE_SOURCES = (ConfigSource.map, ConfigSource.file, ConfigSource.remote)
+# The sources whose loaded values are shared by all the loads and are never changed.
+SHARED_VALUE_SOURCES = (*CACHED_VALUE_SOURCES, ConfigSource.class_default)
+
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    Enum,
+    PurePath,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+MemoKey = Tuple[type, str, Hashable]
+
+
+class ValidationMemoStats(NamedTuple):
+    hits: int
+    misses: int
+    # Validated values that were not memoized since they are mutable.
+    skipped: int
+    size: int
+    max_size: int
+
+
+class ValidationMemo:
+    """
+    A bounded memo of validated field values, shared by all the config objects.
+    Values are keyed by the class, the field name and the value that was loaded for the field, and only immutable
+    validated values are memoized, so the same object can be shared by many config objects.
+    The least recently used values are evicted when the memo is full.
+    """
+
+    def __init__(self, max_size: int = VALIDATION_MEMO_SIZE) -> None:
+        self.max_size = max_size
+        self._values: OrderedDict[MemoKey, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+
+    def get(self, key: MemoKey) -> Tuple[bool, Any]:
+        """
+        Returns: Whether the key is memoized, and its validated value.
+        """
+        with self._lock:
+            try:
+                value = self._values[key]
+            except KeyError:
+                self._misses += 1
+                return False, None
+            self._values.move_to_end(key)
+            self._hits += 1
+            return True, value
+
+    def put(self, key: MemoKey, value: Any) -> bool:
+        """
+        Memoizes a validated value if it is immutable.
+
+        Returns: Whether the value was memoized.
+        """
+        if not is_immutable(value):
+            with self._lock:
+                self._skipped += 1
+            return False
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+        return True
+
+    def stats(self) -> ValidationMemoStats:
+        with self._lock:
+            return ValidationMemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                skipped=self._skipped,
+                size=len(self._values),
+                max_size=self.max_size,
+            )
+
+    def clear(self) -> None:
+        """
+        Drops all the memoized values and resets the statistics.
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = self._skipped = 0
+
+
+# The memo of all the config classes with `validation_memo` enabled.
+validation_memo = ValidationMemo()
+
+
+def memo_key(cls: type, field: ConfigField) -> MemoKey | None:
+    """
+    Returns: The memo key of a loaded field, or None if its value is not memoized.
+        Only lists and dictionaries are memoized, since scalars are validated faster than they are looked up.
+        A value that was converted from a string (e.g. a json environment variable) is keyed by the string.
+        A value of a shared source (e.g. the cached content of a file) is keyed by the identity of the object,
+        since these objects are shared by all the loads and are never changed.
+    """
+    if type(field.value) not in (list, dict) or field.interpolations:
+        return None
+    if isinstance(field.origin_value, str):
+        return cls, field.name, (str, field.origin_value)
+    if field.source_type in SHARED_VALUE_SOURCES and field.origin_value is field.value:
+        return cls, field.name, _Identity(field.value)
+    return None
+
+
+class _Identity:
+    """
+    Compares objects by identity, and keeps the object alive so its id is not reused while it is memoized.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def is_immutable(value: Any) -> bool:
+    """
+    Returns: Whether a validated value cannot be changed in place: scalars, tuples and frozen sets of immutable
+        values, and frozen pydantic models of immutable values.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    if isinstance(value, BaseModel):
+        return bool(value.model_config.get("frozen")) and all(
+            is_immutable(item) for item in value.__dict__.values()
+        )
+    return False
@@ -0,0 +1,284 @@
+import json
+import logging
+import shutil
+import zipfile
+
+import pytest
+
+from confident import BaseConfig, ConfigSource
+from confident import bundle
+from confident.bundle import MANIFEST_NAME, create_bundle, open_bundle, read_bytes
+from confident.cli import main
+
+
+class BundledConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    region: str = "eu"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    config_dir = tmp_path / "config"
+    (config_dir / "common").mkdir(parents=True)
+    (config_dir / "common" / "region.yaml").write_text("region: us\n")
+    (config_dir / "app.yaml").write_text("$ref: common/ports.json\nhost: example.com\n")
+    (config_dir / "common" / "ports.json").write_text(json.dumps({"port": 8080}))
+    return config_dir
+
+
+def test__bundle__files_loaded_from_bundle(config_dir, tmp_path):
+    # Arrange
+    app_path = config_dir / "app.yaml"
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(
+        paths=[app_path, config_dir / "common" / "ports.json"], output=bundle_path
+    )
+    app_path.write_text("host: changed.com\n")
+
+    # Act
+    config = BundledConfig(_files=[app_path], _bundle=bundle_path)
+
+    # Assert
+    assert config.host == "example.com"
+    assert config.port == 8080
+    full_fields = config.full_fields()
+    assert full_fields["host"].source_type == ConfigSource.file
+    assert str(full_fields["host"].source_location) == f"{bundle_path}!/app.yaml"
+
+
+def test__bundle__files_not_in_bundle(config_dir, tmp_path):
+    # Arrange
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=[config_dir / "common" / "region.yaml"], output=bundle_path)
+
+    # Act
+    config = BundledConfig(
+        _files=[config_dir / "common" / "region.yaml", tmp_path / "missing.yaml"],
+        _bundle=bundle_path,
+        _ignore_missing_files=True,
+    )
+
+    # Assert
+    assert config.region == "us"
+    assert str(config.full_fields()["region"].source_location) == (
+        f"{bundle_path}!/region.yaml"
+    )
+
+
+def test__bundle__config_map_entries(config_dir, tmp_path):
+    # Arrange
+    region_path = config_dir / "common" / "region.yaml"
+    map_path = config_dir / "map.json"
+    map_path.write_text(json.dumps({"prod": str(region_path)}))
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=[map_path, region_path], output=bundle_path)
+    region_path.unlink()
+
+    # Act
+    config = BundledConfig(_config_map=map_path, _map_name="prod", _bundle=bundle_path)
+
+    # Assert
+    assert config.region == "us"
+    assert str(config.full_fields()["region"].source_location) == (
+        f"{bundle_path}!/common/region.yaml"
+    )
+
+
+def test__bundle__specs_path(config_dir, tmp_path):
+    # Arrange
+    specs_path = config_dir / "specs.json"
+    specs_path.write_text(json.dumps({"files": [str(config_dir / "app.yaml")]}))
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(
+        paths=[
+            specs_path,
+            config_dir / "app.yaml",
+            config_dir / "common" / "ports.json",
+        ],
+        output=bundle_path,
+    )
+    specs_path.unlink()
+
+    # Act
+    config = BundledConfig(_specs_path=specs_path, _bundle=bundle_path)
+
+    # Assert
+    assert config.host == "example.com"
+    assert config.port == 8080
+
+
+def test__bundle__moved_with_config_files(config_dir, tmp_path, monkeypatch):
+    # Arrange
+    create_bundle(
+        paths=[config_dir / "app.yaml", config_dir / "common" / "ports.json"],
+        output=tmp_path / "bundle.zip",
+    )
+    deploy_dir = tmp_path / "deploy"
+    deploy_dir.mkdir()
+    shutil.move(tmp_path / "bundle.zip", deploy_dir / "bundle.zip")
+    monkeypatch.chdir(deploy_dir)
+
+    # Act
+    config = BundledConfig(_files=["config/app.yaml"], _bundle="bundle.zip")
+
+    # Assert
+    assert (config.host, config.port) == ("example.com", 8080)
+    assert str(config.full_fields()["host"].source_location) == "bundle.zip!/app.yaml"
+
+
+def test__bundle__bundle_root(config_dir, tmp_path, caplog):
+    # Arrange
+    mount_dir = tmp_path / "mount"
+    mount_dir.mkdir()
+    bundle_path = mount_dir / "bundle.zip"
+    create_bundle(
+        paths=[config_dir / "common" / "region.yaml"],
+        output=bundle_path,
+        root=config_dir,
+    )
+    # The config files of the deployed application are elsewhere than the bundle root.
+    app_config_dir = tmp_path / "app" / "config"
+    region_path = app_config_dir / "common" / "region.yaml"
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger=bundle.__name__):
+        missed = BundledConfig(
+            _files=[region_path], _bundle=bundle_path, _ignore_missing_files=True
+        )
+    config = BundledConfig(
+        _files=[region_path], _bundle=bundle_path, _bundle_root=app_config_dir
+    )
+
+    # Assert
+    assert missed.region == "eu"
+    assert f"{region_path} is not in the bundle" in caplog.text
+    assert config.region == "us"
+    assert str(config.full_fields()["region"].source_location) == (
+        f"{bundle_path}!/common/region.yaml"
+    )
+
+
+def test__bundle__sharded_config_map(config_dir, tmp_path):
+    # Arrange
+    shards_dir = config_dir / "config_map"
+    shards_dir.mkdir()
+    (shards_dir / "dev.json").write_text(json.dumps({"port": 8000}))
+    (shards_dir / "prod.yaml").write_text("host: 0.0.0.0\n")
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=list(shards_dir.iterdir()), output=bundle_path, root=config_dir)
+    shutil.rmtree(shards_dir)
+
+    # Act
+    config = BundledConfig(
+        _config_map=shards_dir, _map_name="prod", _bundle=bundle_path
+    )
+
+    # Assert
+    assert config.host == "0.0.0.0"
+    assert str(config.full_fields()["host"].source_location) == (
+        f"{bundle_path}!/config_map/prod.yaml"
+    )
+    with pytest.raises(KeyError):
+        BundledConfig(_config_map=shards_dir, _map_name="qa", _bundle=bundle_path)
+
+
+@pytest.mark.parametrize(
+    "paths, root",
+    [([], None), (["missing.yaml"], None), (["config/app.yaml"], "config/common")],
+)
+def test__create_bundle__invalid(config_dir, tmp_path, monkeypatch, paths, root):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        create_bundle(paths=paths, output=tmp_path / "bundle.zip", root=root)
+
+
+def test__create_bundle__replaced_atomically(config_dir, tmp_path, monkeypatch):
+    # Arrange
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=[config_dir / "app.yaml"], output=bundle_path)
+    write = zipfile.ZipFile.write
+
+    def failing_write(archive, filename, arcname=None, *args, **kwargs):
+        if arcname == "common/region.yaml":
+            # The bundle is still valid while the new bundle is written.
+            assert read_bytes(f"{bundle_path}!/app.yaml").startswith(b"$ref:")
+            raise OSError("No space left on device")
+        return write(archive, filename, arcname, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", failing_write)
+
+    # Act
+    with pytest.raises(OSError):
+        create_bundle(
+            paths=[config_dir / "app.yaml", config_dir / "common" / "region.yaml"],
+            output=bundle_path,
+        )
+
+    # Assert
+    assert list(tmp_path.glob("*.zip")) == [bundle_path]
+    assert list(tmp_path.glob(".tmp-*")) == []
+    assert open_bundle(bundle_path).names == {"app.yaml"}
+
+
+def test__open_bundle__changed_bundle_evicted(config_dir, tmp_path):
+    # Arrange
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=[config_dir / "app.yaml"], output=bundle_path)
+    open_bundle(bundle_path)
+    bundle_path.write_bytes(b"not a bundle")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        open_bundle(bundle_path)
+    assert str(bundle_path) not in bundle._bundles_cache
+
+
+def test__read_bytes__missing_member(config_dir, tmp_path):
+    # Arrange
+    bundle_path = tmp_path / "bundle.zip"
+    create_bundle(paths=[config_dir / "app.yaml"], output=bundle_path)
+
+    # Act & Assert
+    assert read_bytes(f"{bundle_path}!/app.yaml").startswith(b"$ref:")
+    with pytest.raises(ValueError):
+        read_bytes(f"{bundle_path}!/other.yaml")
+
+
+def test__bundle_command(config_dir, tmp_path, capsys):
+    # Arrange
+    region_path = config_dir / "common" / "region.yaml"
+    map_path = config_dir / "map.json"
+    map_path.write_text(json.dumps({"prod": str(region_path)}))
+    module_path = tmp_path / "bundled_config.py"
+    module_path.write_text(
+        "from confident import BaseConfig, ConfidentConfigDict\n"
+        "class AppConfig(BaseConfig):\n"
+        "    model_config = ConfidentConfigDict(\n"
+        f"        files=[{str(config_dir / 'app.yaml')!r}],\n"
+        f"        config_map={str(map_path)!r},\n"
+        "        map_name='prod',\n"
+        "    )\n"
+        "    host: str\n"
+        "    port: int\n"
+        "    region: str = 'eu'\n"
+    )
+    bundle_path = tmp_path / "bundle.zip"
+
+    # Act
+    exit_code = main(["bundle", f"{module_path}:AppConfig", "-o", str(bundle_path)])
+
+    # Assert
+    assert exit_code == 0
+    assert "Bundled 4 files" in capsys.readouterr().out
+    with zipfile.ZipFile(bundle_path) as archive:
+        assert set(archive.namelist()) == {
+            MANIFEST_NAME,
+            "app.yaml",
+            "map.json",
+            "common/ports.json",
+            "common/region.yaml",
+        }
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from confident import BaseConfig
+from confident.cli import discover_config_classes, load_config_class, main
+
+
+class ProfiledConfig(BaseConfig):
+    title: str = "app"
+    port: int = 80
+
+
+def test__profile(tmp_path, capsys):
+    # Arrange
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"port": 81}))
+    module_path = tmp_path / "app_config.py"
+    module_path.write_text(
+        "from confident import BaseConfig, ConfidentConfigDict\n"
+        "class AppConfig(BaseConfig):\n"
+        f"    model_config = ConfidentConfigDict(files=[{str(config_path)!r}])\n"
+        "    port: int = 80\n"
+    )
+
+    # Act
+    json_path = tmp_path / "report.json"
+    exit_code = main(
+        [
+            "profile",
+            f"{module_path}:AppConfig",
+            "--repeat",
+            "2",
+            "--json-out",
+            str(json_path),
+        ]
+    )
+
+    # Assert
+    assert exit_code == 0
+    assert "Profile of app_config:AppConfig (average of 2 objects)" in (
+        capsys.readouterr().out
+    )
+    (report,) = json.loads(json_path.read_text())
+    assert report["constructions"] == 2
+    assert {
+        "caller_inspection",
+        "specs",
+        "loader:env_var",
+        "loader:file",
+        "prioritization",
+        "validation",
+        "total",
+    } <= set(report["phases_ms"])
+    assert report["files"][0]["path"] == str(config_path)
+    assert report["files"][0]["bytes"] == config_path.stat().st_size
+
+
+def test__profile__table(capsys):
+    # Act
+    exit_code = main(
+        [
+            "profile",
+            "tests.test_cli:ProfiledConfig",
+            "--memory",
+            "--cprofile",
+            "3",
+        ]
+    )
+
+    # Assert
+    assert exit_code == 0
+    output = capsys.readouterr().out
+    assert "Profile of tests.test_cli:ProfiledConfig (average of 1 objects)" in output
+    assert "loader:class_default" in output
+    assert "Memory: current" in output
+    assert "cumulative ms" in output
+
+
+@pytest.mark.parametrize("target", ["tests.test_cli", "tests.test_cli:main"])
+def test__load_config_class__invalid(target):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        load_config_class(target)
+
+
+def test__profile__package(tmp_path, monkeypatch, capsys):
+    # Arrange
+    package_path = tmp_path / "app_package"
+    (package_path / "services").mkdir(parents=True)
+    (package_path / "__init__.py").write_text(
+        "from confident import BaseConfig\n"
+        "class RootConfig(BaseConfig):\n"
+        "    port: int = 80\n"
+    )
+    (package_path / "services" / "__init__.py").write_text("")
+    (package_path / "services" / "api.py").write_text(
+        "from confident import BaseConfig\n"
+        "from app_package import RootConfig\n"
+        "class ApiConfig(RootConfig):\n"
+        "    host: str = 'localhost'\n"
+        "class RequiredConfig(BaseConfig):\n"
+        "    token: str\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    json_path = tmp_path / "report.json"
+
+    # Act
+    config_classes = discover_config_classes("app_package")
+    exit_code = main(["profile", "app_package", "--json-out", str(json_path)])
+
+    # Assert
+    assert [cls.__qualname__ for cls in config_classes] == [
+        "RootConfig",
+        "ApiConfig",
+        "RequiredConfig",
+    ]
+    assert exit_code == 0
+    reports = json.loads(json_path.read_text())
+    assert [report["config_class"] for report in reports] == [
+        "app_package:RootConfig",
+        "app_package.services.api:ApiConfig",
+        "app_package.services.api:RequiredConfig",
+    ]
+    assert reports[1]["constructions"] == 1
+    assert "token" in reports[2]["error"]
+    output = capsys.readouterr().out
+    assert "Profile of app_package.services.api:ApiConfig" in output
+    assert "Profile of app_package.services.api:RequiredConfig failed" in output
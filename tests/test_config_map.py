@@ -1,7 +1,11 @@
+import gzip
+import json
+import lzma
+
 import pytest
-from pydantic import create_model
+from pydantic import ValidationError, create_model
 
-from confident import BaseConfig, MapField
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource, MapField
 from confident.map_field import MAP_FIELD_FLAG
 from tests.conftest import CONFIG_SAMPLE_1_FIELD_1, MAP_FIELD_1, SAMPLE_4_FIELD_1
 
@@ -258,3 +262,76 @@ def test__load_config_map__map_field_also_inside_config_map(
     assert """map_field='host' cannot appear in the map config key 'prod'.""" in str(
         error.value
     )
+
+
+def test__load_config_map__extra_ignored():
+    # Arrange
+    class IgnoreExtraConfig(BaseConfig):
+        model_config = ConfidentConfigDict(extra="ignore")
+
+        host: str = "localhost"
+
+    config_map = {"prod": {"host": "0.0.0.0", "undeclared": "value"}}
+
+    # Act
+    config = IgnoreExtraConfig(_map_name="prod", _config_map=config_map)
+
+    # Assert
+    assert config.host == "0.0.0.0"
+    assert set(config.all_loaded_fields()[ConfigSource.map]) == {"host"}
+
+
+def test__load_config_map__extra_forbidden():
+    # Arrange
+    class ForbidExtraConfig(BaseConfig):
+        host: str = "localhost"
+
+    config_map = {"prod": {"host": "0.0.0.0", "undeclared": "value"}}
+
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ForbidExtraConfig(_map_name="prod", _config_map=config_map)
+
+
+def test__load_config_map__compressed(tmp_path):
+    # Arrange
+    class MapConfig(BaseConfig):
+        host: str = "localhost"
+        port: int = 80
+
+    prod_path = tmp_path / "prod.yaml.xz"
+    prod_path.write_bytes(lzma.compress(b"host: 0.0.0.0\nport: 8080\n"))
+    map_path = tmp_path / "config_map.json.gz"
+    map_path.write_bytes(
+        gzip.compress(json.dumps({"prod": str(prod_path), "dev": {}}).encode())
+    )
+
+    # Act
+    config = MapConfig(_map_name="prod", _config_map=map_path)
+
+    # Assert
+    assert (config.host, config.port) == ("0.0.0.0", 8080)
+    assert config.full_fields()["port"].source_location == prod_path
+
+
+@pytest.mark.parametrize("sharded", [False, True])
+def test__load_config_map__loaded_values_not_shared(tmp_path, sharded):
+    # Arrange
+    class UntypedMapConfig(BaseConfig):
+        db: dict = {}
+
+    if sharded:
+        config_map = tmp_path / "config_map"
+        config_map.mkdir()
+        (config_map / "prod.json").write_text(json.dumps({"db": {"pool": {"size": 1}}}))
+    else:
+        config_map = tmp_path / "config_map.json"
+        config_map.write_text(json.dumps({"prod": {"db": {"pool": {"size": 1}}}}))
+    config = UntypedMapConfig(_map_name="prod", _config_map=config_map)
+
+    # Act
+    config.db["pool"]["size"] = 999
+    reloaded = UntypedMapConfig(_map_name="prod", _config_map=config_map)
+
+    # Assert
+    assert reloaded.db == {"pool": {"size": 1}}
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident.loaders.dotenv_source_loader import parse_dotenv
+
+DOTENV_CONTENT = """# Comment line
+export title=my_app
+host = 127.0.0.1  # inline comment
+
+port=5001
+labels='["a", "b"]'
+description="first line
+second line\\tend"
+invalid line
+"""
+
+
+class DotEnvConfig(BaseConfig):
+    title: str
+    host: str
+    port: int
+    labels: list
+    description: str = ""
+
+
+@pytest.fixture
+def dotenv_file_path(tmp_path) -> Path:
+    path = tmp_path / ".env"
+    path.write_text(DOTENV_CONTENT)
+    return path
+
+
+def test__parse_dotenv():
+    # Act
+    entries = parse_dotenv(DOTENV_CONTENT)
+
+    # Assert
+    assert entries == {
+        "title": ("my_app", 2),
+        "host": ("127.0.0.1", 3),
+        "port": ("5001", 5),
+        "labels": ('["a", "b"]', 6),
+        "description": ("first line\nsecond line\tend", 7),
+    }
+
+
+def test__load_dotenv_file(dotenv_file_path):
+    # Act
+    config = DotEnvConfig(_env_files=dotenv_file_path)
+
+    # Assert
+    assert config.model_dump() == {
+        "title": "my_app",
+        "host": "127.0.0.1",
+        "port": 5001,
+        "labels": ["a", "b"],
+        "description": "first line\nsecond line\tend",
+    }
+    field = config.full_fields()["port"]
+    assert field.source_type == ConfigSource.dotenv
+    assert field.source_name == ".env"
+    assert field.source_location == f"{dotenv_file_path}:5"
+    assert field.origin_value == "5001"
+
+
+def test__load_dotenv_file__model_config(dotenv_file_path):
+    # Arrange
+    class MyConfig(BaseConfig):
+        model_config = ConfidentConfigDict(env_files=str(dotenv_file_path))
+        title: str
+
+    # Act
+    config = MyConfig()
+
+    # Assert
+    assert config.title == "my_app"
+    assert config.specs().env_files == [dotenv_file_path]
+
+
+def test__load_dotenv_file__priority(dotenv_file_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv("title", "env_title")
+
+    # Act
+    config = DotEnvConfig.from_sources(env_files=dotenv_file_path, port=80)
+
+    # Assert
+    assert config.title == "env_title"
+    assert config.port == 80
+    assert config.host == "127.0.0.1"
+
+
+def test__load_dotenv_file__missing_file(tmp_path):
+    # Arrange
+    missing_file = tmp_path / "missing.env"
+
+    class MyConfig(BaseConfig):
+        title: str = "default"
+
+    # Act & Assert
+    assert MyConfig(_env_files=missing_file).title == "default"
+    with pytest.raises(ValueError) as error:
+        MyConfig(_env_files=missing_file, _ignore_missing_files=False)
+    assert "is not exists." in str(error.value)
+
+
+def test__load_dotenv_file__cached_parse(dotenv_file_path, monkeypatch):
+    # Arrange
+    DotEnvConfig(_env_files=dotenv_file_path)
+    monkeypatch.setattr("confident.loaders.dotenv_source_loader.parse_dotenv", None)
+
+    # Act - An unchanged file is not parsed again.
+    config = DotEnvConfig(_env_files=dotenv_file_path)
+
+    # Assert
+    assert config.title == "my_app"
+    monkeypatch.undo()
+
+    # Act - A modified file is parsed again.
+    dotenv_file_path.write_text(DOTENV_CONTENT.replace("my_app", "changed_app"))
+    config = DotEnvConfig(_env_files=dotenv_file_path)
+
+    # Assert
+    assert config.title == "changed_app"
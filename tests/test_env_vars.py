@@ -0,0 +1,117 @@
+import os
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident.loaders.env_source_loader import build_env_trie
+
+
+class PoolConfig(BaseModel):
+    size: int = 1
+    timeout: float = 1.0
+
+
+class DatabaseConfig(BaseModel):
+    host: str = "localhost"
+    pool: PoolConfig = PoolConfig()
+    hosts: List[str] = []
+
+
+class ServiceConfig(BaseConfig):
+    model_config = ConfidentConfigDict(env_prefix="APP_", env_nested_delimiter="__")
+
+    name: str = "service"
+    db: DatabaseConfig = DatabaseConfig()
+    labels: Optional[Dict[str, int]] = None
+
+
+@patch.dict(
+    os.environ,
+    {
+        "APP_NAME": "my_service",
+        "APP_DB__HOST": "db.local",
+        "APP_DB__POOL__SIZE": "5",
+        "APP_DB__HOSTS": '["a", "b"]',
+        "APP_LABELS__team": "3",
+        "NAME": "not_prefixed",
+    },
+)
+def test__load_nested_env_vars():
+    # Act
+    config = ServiceConfig()
+
+    # Assert
+    assert config.model_dump() == {
+        "name": "my_service",
+        "db": {
+            "host": "db.local",
+            "pool": {"size": 5, "timeout": 1.0},
+            "hosts": ["a", "b"],
+        },
+        "labels": {"team": 3},
+    }
+    db_field = config.full_fields()["db"]
+    assert db_field.source_type == ConfigSource.env_var
+    assert db_field.source_location == "APP_DB__"
+    assert db_field.origin_value == {
+        "APP_DB__HOST": "db.local",
+        "APP_DB__POOL__SIZE": "5",
+        "APP_DB__HOSTS": '["a", "b"]',
+    }
+    pool_size = db_field.nested_fields["pool.size"]
+    assert pool_size.name == "db.pool.size"
+    assert pool_size.value == 5
+    assert pool_size.source_location == "APP_DB__POOL__SIZE"
+    assert config.full_fields()["name"].source_location == "APP_NAME"
+
+
+@patch.dict(
+    os.environ,
+    {
+        "APP_DB": '{"host": "json.local", "hosts": ["x"]}',
+        "APP_DB__POOL__TIMEOUT": "2.5",
+    },
+)
+def test__load_nested_env_vars__json_object_updated():
+    # Act
+    config = ServiceConfig()
+
+    # Assert
+    assert config.db == DatabaseConfig(
+        host="json.local", hosts=["x"], pool=PoolConfig(timeout=2.5)
+    )
+    db_field = config.full_fields()["db"]
+    assert db_field.source_location == "APP_DB"
+    assert list(db_field.nested_fields) == ["pool.timeout"]
+
+
+@patch.dict(os.environ, {"db__host": "no_delimiter"})
+def test__load_nested_env_vars__no_delimiter():
+    # Arrange
+    class MyConfig(BaseConfig):
+        db: DatabaseConfig = DatabaseConfig()
+        db__host: str = "default"
+
+    # Act
+    config = MyConfig()
+
+    # Assert
+    assert config.db == DatabaseConfig()
+    assert config.db__host == "no_delimiter"
+
+
+def test__build_env_trie():
+    # Act
+    root = build_env_trie(
+        environ={"APP_A__B": "1", "APP_A": "2", "OTHER": "3"},
+        prefix="app_",
+        delimiter="__",
+    )
+
+    # Assert
+    assert list(root.children) == ["a"]
+    node = root.children["a"]
+    assert (node.env_name, node.value) == ("APP_A", "2")
+    assert (node.children["b"].env_name, node.children["b"].value) == ("APP_A__B", "1")
@@ -0,0 +1,234 @@
+import datetime
+import json
+import os
+import pickle
+from multiprocessing import Pool
+
+from confident import BaseConfig, ConfidentConfigDict
+from confident import file_cache
+from confident.cli import main
+from confident.file_cache import (
+    CACHE_FILE_SUFFIX,
+    CACHE_INDEX_SUFFIX,
+    clear_file_cache,
+    load_persisted_file,
+)
+
+
+class CachedConfig(BaseConfig):
+    title: str = "app"
+    port: int = 80
+
+
+def count_parses(monkeypatch):
+    parsed_paths = []
+    parse_file_content = file_cache.parse_file_content
+
+    def counting_parse(path, content):
+        parsed_paths.append(path)
+        return parse_file_content(path=path, content=content)
+
+    monkeypatch.setattr(file_cache, "parse_file_content", counting_parse)
+    return parsed_paths
+
+
+def test__load_persisted_file(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text("title: cached\n")
+    parsed_paths = count_parses(monkeypatch)
+
+    # Act
+    first = load_persisted_file(file_path, cache_dir=cache_dir)
+    second = load_persisted_file(file_path, cache_dir=cache_dir)
+    # Same content with a new modification time is validated by the content hash.
+    os.utime(file_path, ns=(1, 1))
+    third = load_persisted_file(file_path, cache_dir=cache_dir)
+    file_path.write_text("title: changed\n")
+    fourth = load_persisted_file(file_path, cache_dir=cache_dir)
+
+    # Assert
+    assert first == second == third == {"title": "cached"}
+    assert fourth == {"title": "changed"}
+    assert parsed_paths == [file_path, file_path]
+    assert len(list(cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"))) == 2
+    assert len(list(cache_dir.glob(f"*{CACHE_INDEX_SUFFIX}"))) == 1
+
+
+def test__load_persisted_file__shared_content(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    first_path = tmp_path / "first.yaml"
+    second_path = tmp_path / "second.yaml"
+    for path in (first_path, second_path):
+        path.write_text("title: same\n")
+    parsed_paths = count_parses(monkeypatch)
+
+    # Act
+    first = load_persisted_file(first_path, cache_dir=cache_dir)
+    second = load_persisted_file(second_path, cache_dir=cache_dir)
+
+    # Assert
+    assert first == second == {"title": "same"}
+    assert parsed_paths == [first_path]
+    assert len(list(cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"))) == 1
+
+
+def test__load_persisted_file__values_not_supported_by_marshal(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text(
+        "day: 2024-01-02\n"
+        "time: 2024-01-02T03:04:05+01:00\n"
+        "pairs: !!omap [{a: 1}, {b: 2}]\n"
+        "names: !!set {x, y}\n"
+    )
+    load_persisted_file(file_path, cache_dir=cache_dir)
+    parsed_paths = count_parses(monkeypatch)
+
+    # Act
+    loaded = load_persisted_file(file_path, cache_dir=cache_dir)
+
+    # Assert
+    assert parsed_paths == []
+    assert loaded == {
+        "day": datetime.date(2024, 1, 2),
+        "time": datetime.datetime(
+            2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+        ),
+        "pairs": [("a", 1), ("b", 2)],
+        "names": {"x", "y"},
+    }
+
+
+def test__load_persisted_file__broken_entry(tmp_path):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps({"port": 81}))
+    load_persisted_file(file_path, cache_dir=cache_dir)
+    for entry_path in cache_dir.iterdir():
+        entry_path.write_bytes(b"broken")
+
+    # Act & Assert
+    assert load_persisted_file(file_path, cache_dir=cache_dir) == {"port": 81}
+    assert load_persisted_file(file_path, cache_dir=cache_dir) == {"port": 81}
+
+
+def test__load_persisted_file__pickle_entry_not_loaded(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps({"port": 81}))
+    load_persisted_file(file_path, cache_dir=cache_dir)
+    for entry_path in cache_dir.iterdir():
+        entry_path.write_bytes(pickle.dumps(CachedConfig))
+    parsed_paths = count_parses(monkeypatch)
+
+    # Act
+    loaded = load_persisted_file(file_path, cache_dir=cache_dir)
+
+    # Assert
+    assert loaded == {"port": 81}
+    assert parsed_paths == [file_path]
+
+
+def test__load_persisted_file__eviction(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"config{index}.json"
+        path.write_text(
+            json.dumps({"labels": [f"{index}-{i}" * 10 for i in range(40)]})
+        )
+        paths.append(path)
+    scans = []
+    scan_entries = file_cache._scan_entries
+
+    def counting_scan(cache_dir):
+        scans.append(cache_dir)
+        return scan_entries(cache_dir)
+
+    monkeypatch.setattr(file_cache, "_scan_entries", counting_scan)
+    load_persisted_file(paths[0], cache_dir=cache_dir)
+    entries_size = sum(path.stat().st_size for path in cache_dir.iterdir())
+    max_bytes = entries_size * 5 // 2
+
+    # Act
+    written_entries = set()
+    for tick, path in enumerate(paths, start=1):
+        load_persisted_file(path, cache_dir=cache_dir, max_bytes=max_bytes)
+        # Older files are written at distinct times, so the order of eviction is known.
+        for entry_path in set(cache_dir.iterdir()) - written_entries:
+            os.utime(entry_path, ns=(tick, tick))
+            written_entries.add(entry_path)
+    latest_entries = set(cache_dir.iterdir())
+
+    # Assert
+    # The directory is scanned to count its size once, and again only when the count is over the cap.
+    assert scans == [cache_dir, cache_dir]
+    assert sum(path.stat().st_size for path in latest_entries) <= max_bytes
+    parsed_paths = count_parses(monkeypatch)
+    load_persisted_file(paths[2], cache_dir=cache_dir, max_bytes=max_bytes)
+    load_persisted_file(paths[0], cache_dir=cache_dir, max_bytes=max_bytes)
+    assert parsed_paths == [paths[0]]
+
+
+def test__file_cache_dir(tmp_path, monkeypatch):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps({"port": 81}))
+
+    class FileCachedConfig(CachedConfig):
+        model_config = ConfidentConfigDict(files=[file_path], file_cache_dir=cache_dir)
+
+    # Act
+    config = FileCachedConfig()
+
+    # Assert
+    assert config.port == 81
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def load_in_process(args):
+    file_path, cache_dir = args
+    return load_persisted_file(file_path, cache_dir=cache_dir)
+
+
+def test__load_persisted_file__many_processes(tmp_path):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text("title: shared\n")
+
+    # Act
+    with Pool(4) as pool:
+        results = pool.map(load_in_process, [(file_path, cache_dir)] * 16)
+
+    # Assert
+    assert results == [{"title": "shared"}] * 16
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [
+        CACHE_FILE_SUFFIX,
+        CACHE_INDEX_SUFFIX,
+    ]
+
+
+def test__cache_clear_command(tmp_path, capsys):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps({"port": 81}))
+    load_persisted_file(file_path, cache_dir=cache_dir)
+
+    # Act
+    exit_code = main(["cache", "clear", str(cache_dir)])
+
+    # Assert
+    assert exit_code == 0
+    assert f"Removed 2 cache entries from {cache_dir}." in capsys.readouterr().out
+    assert list(cache_dir.iterdir()) == []
+    assert clear_file_cache(tmp_path / "missing") == 0
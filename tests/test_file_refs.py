@@ -0,0 +1,137 @@
+import json
+from typing import Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from confident import BaseConfig, ConfigSource
+from confident import file_cache, file_refs
+from confident.file_refs import RefResolver
+
+
+class PoolConfig(BaseModel):
+    size: int = 1
+    timeout: float = 1.0
+
+
+class DatabaseConfig(BaseModel):
+    host: str = "localhost"
+    pool: PoolConfig = PoolConfig()
+
+
+class RefsConfig(BaseConfig):
+    name: str = "service"
+    db: DatabaseConfig = DatabaseConfig()
+    replicas: List[DatabaseConfig] = []
+    labels: Dict[str, str] = {}
+
+
+def write_json(path, content):
+    path.write_text(json.dumps(content))
+    return path
+
+
+@pytest.fixture
+def ref_files(tmp_path):
+    (tmp_path / "fragments").mkdir()
+    pool_path = write_json(tmp_path / "fragments" / "pool.json", {"size": 5})
+    (tmp_path / "fragments" / "db.yaml").write_text(
+        "host: db.local\npool:\n  $ref: pool.json\n"
+    )
+    config_path = write_json(
+        tmp_path / "config.json",
+        {
+            "name": "main",
+            "db": {"$ref": "fragments/db.yaml"},
+            "replicas": [
+                {"$ref": "fragments/db.yaml", "host": "replica.local"},
+            ],
+        },
+    )
+    return config_path, tmp_path / "fragments" / "db.yaml", pool_path
+
+
+def test__load_file_refs(ref_files):
+    # Arrange
+    config_path, db_path, pool_path = ref_files
+
+    # Act
+    config = RefsConfig(_files=[config_path])
+
+    # Assert
+    assert config.db == DatabaseConfig(host="db.local", pool=PoolConfig(size=5))
+    assert config.replicas == [
+        DatabaseConfig(host="replica.local", pool=PoolConfig(size=5))
+    ]
+    full_fields = config.full_fields()
+    assert full_fields["name"].source_location == config_path
+    assert full_fields["db"].source_location == db_path
+    assert full_fields["db"].nested_fields["pool"].source_location == pool_path
+    replica_fields = full_fields["replicas"].nested_fields
+    assert replica_fields["0"].source_location == db_path
+    assert replica_fields["0.host"].source_location == config_path
+    assert replica_fields["0.pool"].source_location == pool_path
+
+
+def test__load_file_refs__parsed_once(ref_files, monkeypatch):
+    # Arrange
+    config_path, _, _ = ref_files
+    file_refs._resolved_cache.clear()
+    loaded_paths = []
+    load_cached_file = file_cache.load_cached_file
+
+    def counting_load(path, **kwargs):
+        loaded_paths.append(path)
+        return load_cached_file(path, **kwargs)
+
+    monkeypatch.setattr(file_refs, "load_cached_file", counting_load)
+
+    # Act
+    RefsConfig(_files=[config_path])
+    RefsConfig(_files=[config_path])
+
+    # Assert - db.yaml is referenced twice and both constructions reuse the resolved files.
+    assert len(loaded_paths) == 3
+
+
+def test__load_file_refs__reloaded_on_change(ref_files):
+    # Arrange
+    config_path, _, pool_path = ref_files
+    RefsConfig(_files=[config_path])
+
+    # Act
+    write_json(pool_path, {"size": 10})
+    config = RefsConfig(_files=[config_path])
+
+    # Assert
+    assert config.db.pool.size == 10
+
+
+def test__load_file_refs__cycle(tmp_path):
+    # Arrange
+    first_path = write_json(tmp_path / "first.json", {"db": {"$ref": "second.json"}})
+    write_json(tmp_path / "second.json", {"pool": {"$ref": "first.json"}})
+
+    # Act & Assert
+    with pytest.raises(ValueError) as error:
+        RefResolver().resolve(first_path)
+    assert "Circular `$ref` references:" in str(error.value)
+    assert "first.json -> " in str(error.value)
+
+
+def test__load_map_file_refs(tmp_path):
+    # Arrange
+    db_path = write_json(tmp_path / "db.json", {"host": "prod.local"})
+    map_path = write_json(
+        tmp_path / "map.json",
+        {"prod": {"name": "prod", "db": {"$ref": "db.json"}}},
+    )
+
+    # Act
+    config = RefsConfig(_config_map=map_path, _map_name="prod")
+
+    # Assert
+    assert config.db.host == "prod.local"
+    assert config.full_fields()["db"].source_type == ConfigSource.map
+    assert config.full_fields()["db"].source_location == db_path
+    assert config.full_fields()["name"].source_location == map_path
@@ -0,0 +1,247 @@
+import bz2
+import gzip
+import json
+import lzma
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from pydantic import BaseModel
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident import file_cache
+from confident.loaders import file_source_loader
+from confident.utils import keeps_input_values
+
+
+class PoolConfig(BaseModel):
+    size: int = 1
+    timeout: float = 1.0
+
+
+class DatabaseConfig(BaseModel):
+    host: str = "localhost"
+    pool: PoolConfig = PoolConfig()
+
+
+class FilesConfig(BaseConfig):
+    name: str = "service"
+    db: DatabaseConfig = DatabaseConfig()
+    labels: Dict[str, str] = {}
+
+
+def write_files(tmp_path):
+    base_path = tmp_path / "base.json"
+    base_path.write_text(
+        json.dumps(
+            {
+                "name": "base",
+                "db": {"host": "base.local", "pool": {"size": 2, "timeout": 3.0}},
+                "labels": {"team": "a"},
+                "undeclared": {"a": 1},
+            }
+        )
+    )
+    override_path = tmp_path / "override.yaml"
+    override_path.write_text("db:\n  pool:\n    size: 5\n")
+    return base_path, override_path
+
+
+def test__load_files__last_file_replaces(tmp_path):
+    # Arrange
+    base_path, override_path = write_files(tmp_path)
+
+    # Act
+    config = FilesConfig(_files=[base_path, override_path])
+
+    # Assert
+    assert config.db == DatabaseConfig(pool=PoolConfig(size=5))
+    assert config.full_fields()["db"].nested_fields == {}
+    assert config.full_fields()["name"].source_location == base_path
+
+
+def test__load_files__deep_merge(tmp_path):
+    # Arrange
+    base_path, override_path = write_files(tmp_path)
+
+    class MergedConfig(FilesConfig):
+        model_config = ConfidentConfigDict(
+            files=[base_path, override_path], deep_merge_files=True
+        )
+
+    # Act
+    config = MergedConfig()
+
+    # Assert
+    assert config.db == DatabaseConfig(
+        host="base.local", pool=PoolConfig(size=5, timeout=3.0)
+    )
+    db_field = config.full_fields()["db"]
+    assert db_field.source_type == ConfigSource.file
+    assert db_field.source_location == override_path
+    assert db_field.nested_fields["pool.size"].value == 5
+    assert db_field.nested_fields["pool.size"].name == "db.pool.size"
+    assert db_field.nested_fields["pool.size"].source_location == override_path
+    assert db_field.nested_fields["pool.timeout"].source_location == base_path
+    assert db_field.nested_fields["host"].source_location == base_path
+    # Parsed files are not changed by the merge.
+    assert file_cache.load_cached_file(override_path) == {"db": {"pool": {"size": 5}}}
+
+
+def test__load_cached_file__reloaded_on_change(tmp_path):
+    # Arrange
+    file_path = tmp_path / "config.json"
+    file_path.write_text(json.dumps({"name": "a"}))
+    first = file_cache.load_cached_file(file_path)
+
+    # Act
+    second = file_cache.load_cached_file(file_path)
+    file_path.write_text(json.dumps({"name": "bb"}))
+    third = file_cache.load_cached_file(file_path)
+
+    # Assert
+    assert second is first
+    assert third == {"name": "bb"}
+
+
+def test__load_files__only_fields_converted(tmp_path, monkeypatch):
+    # Arrange
+    file_path = tmp_path / "platform.yaml"
+    file_path.write_text(
+        "".join(f"key_{index}: value_{index}\n" for index in range(1000))
+        + "name: platform\n"
+    )
+    converted = []
+
+    def counting_convert(settings, field_name, origin_value):
+        converted.append(field_name)
+        return origin_value
+
+    monkeypatch.setattr(file_source_loader, "convert_field_value", counting_convert)
+
+    # Act
+    config = FilesConfig(_files=[file_path])
+
+    # Assert
+    assert config.name == "platform"
+    assert converted == ["name"]
+    assert set(config.all_loaded_fields()[ConfigSource.file]) == {"name"}
+
+
+@pytest.mark.parametrize(
+    "file_name, compress",
+    [
+        ("config.json.gz", gzip.compress),
+        ("config.yaml.xz", lzma.compress),
+        ("config.json.bz2", bz2.compress),
+        ("config.yml.gz", gzip.compress),
+    ],
+)
+def test__load_files__compressed(tmp_path, file_name, compress):
+    # Arrange
+    file_path = tmp_path / file_name
+    file_path.write_bytes(compress(json.dumps({"name": "compressed"}).encode()))
+
+    # Act
+    config = FilesConfig(_files=[file_path], _file_cache_dir=tmp_path / "cache")
+
+    # Assert
+    assert config.name == "compressed"
+    assert config.full_fields()["name"].source_location == file_path
+    assert file_cache.load_persisted_file(file_path, tmp_path / "cache") == {
+        "name": "compressed"
+    }
+
+
+@pytest.mark.parametrize("file_cache_dir", [None, "cache"])
+def test__load_files__compressed_streamed(tmp_path, monkeypatch, file_cache_dir):
+    # Arrange
+    file_path = tmp_path / "config.yaml.gz"
+    file_path.write_bytes(gzip.compress(b"name: streamed\n"))
+    read_paths = []
+    read_bytes = Path.read_bytes
+
+    def recording_read_bytes(self):
+        read_paths.append(self)
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", recording_read_bytes)
+    cache_dir = file_cache_dir and tmp_path / file_cache_dir
+
+    # Act
+    config = FilesConfig(_files=[file_path], _file_cache_dir=cache_dir)
+
+    # Assert
+    assert config.name == "streamed"
+    assert file_path not in read_paths
+
+
+def corrupt_gzip_body(content: bytes) -> bytes:
+    compressed = bytearray(gzip.compress(content, mtime=0))
+    # The header of 10 bytes stays valid, and the first byte of the deflate stream is flipped.
+    compressed[10] ^= 0xFF
+    return bytes(compressed)
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    [
+        ("config.json.gz", b"not compressed"),
+        ("config.yaml.gz", corrupt_gzip_body(b"name: a\n" * 100)),
+        ("config.txt.gz", gzip.compress(b"name: a")),
+        ("config.gz", gzip.compress(b"name: a")),
+    ],
+)
+def test__load_files__invalid_compressed(tmp_path, file_name, content):
+    # Arrange
+    file_path = tmp_path / file_name
+    file_path.write_bytes(content)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        FilesConfig(_files=[file_path])
+
+
+class UntypedConfig(BaseConfig):
+    model_config = ConfidentConfigDict(validation_memo=True)
+
+    db: dict = {}
+    hosts: list = []
+
+
+@pytest.mark.parametrize("deep_merge_files", [False, True])
+def test__load_files__loaded_values_not_shared(tmp_path, deep_merge_files):
+    # Arrange
+    (tmp_path / "db.json").write_text(json.dumps({"pool": {"size": 1}}))
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("db:\n  $ref: db.json\nhosts:\n  - a.local\n")
+    config = UntypedConfig(_files=[config_path], _deep_merge_files=deep_merge_files)
+
+    # Act
+    config.db["pool"]["size"] = 999
+    config.hosts.append("b.local")
+    reloaded = UntypedConfig(_files=[config_path], _deep_merge_files=deep_merge_files)
+
+    # Assert
+    assert reloaded.db == {"pool": {"size": 1}}
+    assert reloaded.hosts == ["a.local"]
+    assert reloaded.full_fields()["db"].value == {"pool": {"size": 1}}
+
+
+@pytest.mark.parametrize(
+    "annotation, keeps_input",
+    [
+        (int, False),
+        (List[str], False),
+        (Dict[str, int], False),
+        (Optional[Tuple[int, ...]], False),
+        (DatabaseConfig, False),
+        (dict, True),
+        (Dict[str, Any], True),
+        (List[dict], True),
+        (Optional[Dict[str, List[Any]]], True),
+    ],
+)
+def test__keeps_input_values(annotation, keeps_input):
+    # Act & Assert
+    assert keeps_input_values(annotation) == keeps_input
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident import confident as confident_module
+
+
+class FingerprintConfig(BaseConfig):
+    model_config = ConfidentConfigDict(validate_assignment=True)
+
+    host: str = "localhost"
+    port: int = 80
+    labels: Dict[str, List[int]] = {}
+
+
+class OtherConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    labels: Dict[str, List[int]] = {}
+
+
+def test__fingerprint__equal_values():
+    # Act
+    config_a = FingerprintConfig(labels={"a": [1], "b": [2]})
+    config_b = FingerprintConfig(labels={"b": [2], "a": [1]})
+
+    # Assert
+    assert config_a.fingerprint() == config_b.fingerprint()
+    assert config_a.fingerprint() != FingerprintConfig(port=81).fingerprint()
+    assert config_a.fingerprint() != OtherConfig(**config_a.model_dump()).fingerprint()
+
+
+def test__fingerprint__memoized_per_field(monkeypatch):
+    # Arrange
+    config = FingerprintConfig()
+    fingerprint = config.fingerprint()
+    hashed_values = []
+
+    def counting_hash(value):
+        hashed_values.append(value)
+        return str(value)
+
+    monkeypatch.setattr(confident_module, "stable_hash", counting_hash)
+
+    # Act & Assert - Cached fingerprint is reused.
+    assert config.fingerprint() == fingerprint
+    assert hashed_values == []
+
+    # Act & Assert - Only the assigned field is hashed again.
+    config.port = 81
+    config.fingerprint()
+    assert hashed_values[0] == 81
+    assert len(hashed_values) == 2  # The field and the combined fingerprint.
+
+
+def test__fingerprint__sets_across_processes():
+    # Arrange
+    code = (
+        "from typing import Dict, FrozenSet, Set\n"
+        "from confident import BaseConfig\n"
+        "class SetsConfig(BaseConfig):\n"
+        "    names: Set[str] = {'alpha', 'beta', 'gamma', 'delta', 'epsilon'}\n"
+        "    groups: Dict[str, FrozenSet[str]] = {'a': frozenset({'x', 'y', 'z', 'w'})}\n"
+        "print(SetsConfig().fingerprint())\n"
+    )
+
+    # Act
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for hash_seed in ("1", "2", "3")
+    }
+
+    # Assert
+    assert len(fingerprints) == 1
+
+
+def test__diff():
+    # Arrange
+    old_config = FingerprintConfig(port=81)
+    with patch.dict(os.environ, {"port": "82", "host": "remote"}):
+        new_config = FingerprintConfig()
+
+    # Act
+    diffs = {diff.name: diff for diff in old_config.diff(new_config)}
+
+    # Assert
+    assert set(diffs) == {"host", "port"}
+    assert diffs["port"].old_value == 81
+    assert diffs["port"].new_value == 82
+    assert diffs["port"].old_source_type == ConfigSource.init
+    assert diffs["port"].new_source_type == ConfigSource.env_var
+    assert diffs["port"].new_source_location == "port"
+    assert diffs["host"].old_source_type == ConfigSource.class_default
+
+
+def test__diff__no_changes():
+    # Act & Assert
+    assert FingerprintConfig().diff(FingerprintConfig()) == []
+
+
+def test__diff__different_classes():
+    # Act & Assert
+    with pytest.raises(TypeError) as error:
+        FingerprintConfig().diff(OtherConfig())
+    assert "Cannot diff FingerprintConfig with OtherConfig." in str(error.value)
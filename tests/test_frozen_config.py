@@ -0,0 +1,135 @@
+import pickle
+from typing import Dict, List, Set
+
+import pytest
+from pydantic import BaseModel
+
+from confident import BaseConfig, ConfigSource, FrozenConfig, FrozenDict
+
+
+class SnapshotConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    labels: List[str] = []
+
+
+class Database(BaseModel):
+    hosts: List[str] = ["db.local"]
+
+
+class NestedSnapshotConfig(BaseConfig):
+    limits: Dict[str, List[int]] = {"cpu": [1, 2]}
+    tags: Set[str] = {"a"}
+    database: Database = Database()
+
+
+def test__freeze():
+    # Act
+    frozen = SnapshotConfig(port=81, labels=["a"]).freeze()
+
+    # Assert
+    assert isinstance(frozen, FrozenConfig)
+    assert type(frozen).__name__ == "FrozenSnapshotConfig"
+    assert (frozen.host, frozen.port, frozen.labels) == ("localhost", 81, ("a",))
+    assert frozen.to_dict() == {"host": "localhost", "port": 81, "labels": ["a"]}
+    assert (
+        repr(frozen) == "FrozenSnapshotConfig(host='localhost', port=81, labels=('a',))"
+    )
+    assert not hasattr(frozen, "__dict__")
+
+
+def test__freeze__same_class_for_every_object():
+    # Act & Assert
+    assert type(SnapshotConfig().freeze()) is type(SnapshotConfig(port=1).freeze())
+
+
+def test__freeze__immutable():
+    # Arrange
+    frozen = SnapshotConfig().freeze()
+
+    # Act & Assert
+    with pytest.raises(AttributeError) as error:
+        frozen.port = 1  # type: ignore[misc]
+    assert "is frozen." in str(error.value)
+    with pytest.raises(AttributeError):
+        del frozen.port
+
+
+def test__freeze__hash_and_eq():
+    # Arrange
+    frozen_a = SnapshotConfig(labels=["a"]).freeze()
+    frozen_b = SnapshotConfig(labels=["a"]).freeze()
+    frozen_c = SnapshotConfig(labels=["b"]).freeze()
+
+    # Act & Assert
+    assert frozen_a == frozen_b
+    assert frozen_a != frozen_c
+    assert hash(frozen_a) == hash(frozen_b)
+    assert {frozen_a: "value"}[frozen_b] == "value"
+
+
+def test__freeze__independent_of_source():
+    # Arrange
+    config = SnapshotConfig(labels=["a"])
+    frozen = config.freeze()
+    frozen_hash = hash(frozen)
+
+    # Act
+    config.labels.append("b")
+    frozen.to_dict()["labels"].append("c")
+
+    # Assert
+    assert frozen.labels == ("a",)
+    assert hash(frozen) == frozen_hash == hash(SnapshotConfig(labels=["a"]).freeze())
+    assert frozen == SnapshotConfig(labels=["a"]).freeze()
+
+
+def test__freeze__values_frozen_recursively():
+    # Arrange
+    frozen = NestedSnapshotConfig().freeze()
+
+    # Act & Assert
+    assert isinstance(frozen.limits, FrozenDict)
+    assert frozen.limits == {"cpu": (1, 2)}
+    assert frozen.tags == frozenset({"a"})
+    assert frozen.database.hosts == ("db.local",)
+    with pytest.raises(AttributeError):
+        frozen.limits["cpu"].append(3)  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        frozen.limits["cpu"] = (3,)  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        frozen.database.hosts = ()
+    assert {frozen: "value"}.get(NestedSnapshotConfig().freeze()) == "value"
+    assert frozen.to_dict() == {
+        "limits": {"cpu": [1, 2]},
+        "tags": {"a"},
+        "database": {"hosts": ["db.local"]},
+    }
+    assert frozen.to_config() == NestedSnapshotConfig()
+
+
+def test__freeze__pickle():
+    # Arrange
+    frozen = SnapshotConfig(port=81, labels=["a"]).freeze()
+
+    # Act
+    restored = pickle.loads(pickle.dumps(frozen))
+
+    # Assert
+    assert restored == frozen
+    assert type(restored) is type(frozen)
+    nested = NestedSnapshotConfig().freeze()
+    assert pickle.loads(pickle.dumps(nested)) == nested
+
+
+def test__freeze__to_config():
+    # Arrange
+    config = SnapshotConfig(port=81)
+
+    # Act
+    restored = config.freeze().to_config()
+
+    # Assert
+    assert isinstance(restored, SnapshotConfig)
+    assert restored.model_dump() == config.model_dump()
+    assert restored.full_fields()["host"].source_type == ConfigSource.init
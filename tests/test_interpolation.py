@@ -0,0 +1,107 @@
+import json
+import os
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident import interpolation
+from confident.interpolation import compile_template
+
+
+class InterpolatedConfig(BaseConfig):
+    model_config = ConfidentConfigDict(interpolate=True)
+
+    db_host: str = "localhost"
+    db_port: int = 5432
+    url: str = ""
+    hosts: List[str] = []
+    labels: Dict[str, str] = {}
+
+
+def test__compile_template():
+    # Act & Assert
+    assert compile_template("a${X}b${ y }") == (("a", "X"), ("b", "y"), ("", None))
+    assert compile_template("$${X}-$$") == (("${X}-$", None),)
+    assert compile_template("a${X}") is compile_template("a${X}")
+
+
+@patch.dict(os.environ, {"DATABASE_HOST": "db.local", "db_port": "6543"})
+def test__interpolate(tmp_path):
+    # Arrange
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "db_host": "${DATABASE_HOST}",
+                "url": "postgres://${db_host}:${db_port}/app",
+                "hosts": ["${db_host}", "static"],
+                "labels": {"escaped": "$${db_host}"},
+            }
+        )
+    )
+
+    # Act
+    config = InterpolatedConfig(_files=[config_path])
+
+    # Assert
+    assert config.db_host == "db.local"
+    assert config.url == "postgres://db.local:6543/app"
+    assert config.hosts == ["db.local", "static"]
+    assert config.labels == {"escaped": "${db_host}"}
+
+    url_field = config.full_fields()["url"]
+    assert url_field.origin_value == "postgres://${db_host}:${db_port}/app"
+    assert url_field.interpolations["db_host"].source_type == ConfigSource.file
+    assert (
+        url_field.interpolations["db_host"].interpolations["DATABASE_HOST"].source_type
+        == ConfigSource.env_var
+    )
+    assert url_field.interpolations["db_port"].source_type == ConfigSource.env_var
+    assert url_field.interpolations["db_port"].source_location == "db_port"
+
+
+def test__interpolate__disabled_by_default():
+    # Arrange
+    class RawConfig(BaseConfig):
+        url: str = ""
+
+    # Act
+    with patch.dict(os.environ, {"url": "${HOME}"}):
+        config = RawConfig()
+
+    # Assert
+    assert config.url == "${HOME}"
+
+
+@patch.dict(os.environ, {"db_host": "${url}", "url": "${db_host}"})
+def test__interpolate__cycle():
+    # Act & Assert
+    with pytest.raises(ValueError) as error:
+        InterpolatedConfig()
+    assert "Circular interpolation: db_host -> url -> db_host." in str(error.value)
+
+
+@patch.dict(os.environ, {"url": "${MISSING}"})
+def test__interpolate__missing():
+    # Act & Assert
+    with pytest.raises(ValueError) as error:
+        InterpolatedConfig()
+    assert "No field or environment variable named 'MISSING'" in str(error.value)
+
+
+@patch.dict(os.environ, {"url": "plain"})
+def test__interpolate__no_templates(monkeypatch):
+    # Arrange
+    def fail(text):
+        raise AssertionError("Strings without templates should not be compiled.")
+
+    monkeypatch.setattr(interpolation, "compile_template", fail)
+
+    # Act
+    config = InterpolatedConfig()
+
+    # Assert
+    assert config.url == "plain"
+    assert config.full_fields()["url"].interpolations == {}
@@ -0,0 +1,132 @@
+import json
+import os
+from typing import Dict, List
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+
+
+class TenantConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    labels: List[str] = []
+    limits: Dict[str, int] = {}
+
+
+def test__build_layered(tmp_path):
+    # Arrange
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"host": "file.local", "limits": {"cpu": 2}}))
+
+    # Act
+    configs = list(
+        TenantConfig.build_layered(
+            {"files": [config_path]},
+            [{"port": "81"}, {"labels": ["b"]}, {}],
+        )
+    )
+
+    # Assert
+    assert [config.port for config in configs] == [81, 80, 80]
+    assert [config.labels for config in configs] == [[], ["b"], []]
+    assert all(config.host == "file.local" for config in configs)
+    assert configs[0] == TenantConfig.from_sources(files=[config_path], port=81)
+
+    port_field = configs[0].full_fields()["port"]
+    assert port_field.value == 81
+    assert port_field.origin_value == "81"
+    assert port_field.source_type == ConfigSource.init
+    assert configs[0].full_fields()["host"].source_location == config_path
+    assert configs[1].full_fields()["port"].source_type == ConfigSource.class_default
+
+
+def test__build_layered__shares_base():
+    # Act
+    config_a, config_b = TenantConfig.build_layered(None, [{"port": 81}, {"port": 82}])
+
+    # Assert
+    assert config_a.limits is config_b.limits
+    assert config_a.__full_fields__["host"] is config_b.__full_fields__["host"]
+    assert config_a.fingerprint() != config_b.fingerprint()
+    assert config_a.fingerprint() == TenantConfig(port=81).fingerprint()
+
+
+@patch.dict(os.environ, {"port": "90"})
+def test__build_layered__source_priority():
+    # Act
+    (config,) = TenantConfig.build_layered(
+        {
+            "source_priority": [
+                ConfigSource.env_var,
+                ConfigSource.init,
+                ConfigSource.class_default,
+            ]
+        },
+        [{"port": 81, "host": "tenant.local"}],
+    )
+
+    # Assert
+    assert config.port == 90
+    assert config.host == "tenant.local"
+    assert config.full_fields()["port"].source_type == ConfigSource.env_var
+
+
+def test__build_layered__invalid_override():
+    # Arrange
+    configs = TenantConfig.build_layered(None, [{"port": 81}, {"port": "invalid"}])
+
+    # Act & Assert
+    assert next(configs).port == 81
+    with pytest.raises(ValidationError):
+        next(configs)
+
+
+def test__build_layered__map_field_override():
+    # Arrange
+    class DeploymentConfig(TenantConfig):
+        deployment: str = "a"
+
+    config_map = {"a": {"host": "a.local", "port": 1}, "b": {"host": "b.local"}}
+
+    # Act
+    config_a, config_b = DeploymentConfig.build_layered(
+        {"config_map": config_map, "map_field": "deployment"},
+        [{"labels": ["a"]}, {"deployment": "b"}],
+    )
+
+    # Assert
+    assert (config_a.host, config_a.port) == ("a.local", 1)
+    assert (config_b.host, config_b.port) == ("b.local", 80)
+    assert config_b.full_fields()["port"].source_type == ConfigSource.class_default
+    assert config_b.full_fields()["deployment"].source_type == ConfigSource.init
+
+
+def test__build_layered__interpolated_dependency_override(tmp_path):
+    # Arrange
+    class InterpolatedConfig(TenantConfig):
+        model_config = ConfidentConfigDict(interpolate=True)
+
+        name: str = "app"
+        url: str = ""
+
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"url": "http://${name}.local:${port}"}))
+
+    # Act
+    configs = list(
+        InterpolatedConfig.build_layered(
+            {"files": [config_path]},
+            [{"labels": ["a"]}, {"name": "tenant"}, {"port": 81}],
+        )
+    )
+
+    # Assert
+    assert [config.url for config in configs] == [
+        "http://app.local:80",
+        "http://tenant.local:80",
+        "http://app.local:81",
+    ]
+    assert configs[1].full_fields()["url"].interpolations["name"].value == "tenant"
@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigField, ConfigSource
+from confident.loader_manager import LoaderManager
+from confident.loaders.map_source_loader import MapSourceLoader
+from confident.loaders.source_loader_base import SourceLoader
+from confident.specs import ConfigSpecs
+
+PRIORITY = [ConfigSource.init, ConfigSource.remote, ConfigSource.file]
+
+
+def make_loader(source, delay=0.0, parallel_safe=True, depends_on=()):
+    class FakeLoader(SourceLoader):
+        NAME = source
+        DEPENDS_ON = depends_on
+        PARALLEL_SAFE = parallel_safe
+
+        def load_fields(self, settings):
+            time.sleep(delay)
+            return [
+                ConfigField(
+                    name=source.value,
+                    value=threading.current_thread().name,
+                    source_name=source.value,
+                    source_type=source,
+                    source_location=source.value,
+                )
+            ]
+
+    return FakeLoader(specs=ConfigSpecs(source_priority=PRIORITY))
+
+
+def test__load_all__parallel():
+    # Arrange
+    loader_manager = LoaderManager(
+        settings_obj=None,
+        source_priority=PRIORITY,
+        loaders=[
+            make_loader(ConfigSource.file, delay=0.2),
+            make_loader(ConfigSource.remote, delay=0.2),
+            make_loader(ConfigSource.init, parallel_safe=False),
+        ],
+        parallel=True,
+    )
+
+    # Act
+    start = time.perf_counter()
+    loader_manager.load_all()
+    duration = time.perf_counter() - start
+
+    # Assert
+    assert duration < 0.35
+    assert list(loader_manager.all_loaded_fields) == PRIORITY
+    threads = {
+        source: fields[source.value].value
+        for source, fields in loader_manager.all_loaded_fields.items()
+    }
+    assert threads[ConfigSource.init] == threading.current_thread().name
+    assert threads[ConfigSource.file].startswith("confident-loader")
+    assert set(loader_manager.loader_timings) == set(PRIORITY)
+    assert loader_manager.loader_timings[ConfigSource.file] >= 0.2
+
+
+def test__load_all__dependencies():
+    # Arrange
+    loaded_order = []
+
+    class RecordingLoader(SourceLoader):
+        NAME = ConfigSource.init
+        DEPENDS_ON = (ConfigSource.file,)
+        PARALLEL_SAFE = True
+
+        def load_fields(self, settings):
+            loaded_order.extend(loader_manager.all_loaded_fields)
+            loaded_order.append(self.NAME)
+            return []
+
+    file_loader = make_loader(ConfigSource.file, delay=0.05)
+    loader_manager = LoaderManager(
+        settings_obj=None,
+        source_priority=[ConfigSource.init, ConfigSource.file],
+        loaders=[RecordingLoader(specs=file_loader.specs), file_loader],
+        parallel=True,
+    )
+
+    # Act
+    loader_manager.load_all()
+
+    # Assert
+    assert loaded_order == [ConfigSource.file, ConfigSource.init]
+    assert list(loader_manager.all_loaded_fields) == [
+        ConfigSource.init,
+        ConfigSource.file,
+    ]
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test__load_all__unsatisfied_dependencies(parallel):
+    # Arrange
+    loader_manager = LoaderManager(
+        settings_obj=None,
+        source_priority=PRIORITY,
+        loaders=[
+            make_loader(ConfigSource.init),
+            make_loader(ConfigSource.file, depends_on=(ConfigSource.remote,)),
+            make_loader(ConfigSource.remote, depends_on=(ConfigSource.file,)),
+        ],
+        parallel=parallel,
+    )
+
+    # Act & Assert
+    with pytest.raises(ValueError) as error:
+        loader_manager.load_all()
+    assert "Cannot load sources ['remote', 'file']." in str(error.value)
+
+
+def test__map_loader__is_ready():
+    # Arrange
+    specs = ConfigSpecs(
+        map_field="env",
+        source_priority=[ConfigSource.init, ConfigSource.env_var, ConfigSource.map],
+    )
+    loader = MapSourceLoader(specs=specs, all_loaded_fields={})
+    env_field = ConfigField(
+        name="env",
+        value="dev",
+        source_name="env",
+        source_type=ConfigSource.init,
+        source_location="env",
+    )
+
+    # Act & Assert
+    assert not loader.is_ready({})
+    assert not loader.is_ready({ConfigSource.init: {}})
+    assert loader.is_ready({ConfigSource.init: {"env": env_field}})
+    assert loader.is_ready({ConfigSource.init: {}, ConfigSource.env_var: {}})
+
+
+@patch.dict(os.environ, {"env": "prod"})
+def test__parallel_loading__same_as_sequential():
+    # Arrange
+    class MappedConfig(BaseConfig):
+        model_config = ConfidentConfigDict(
+            map_field="env",
+            config_map={"dev": {"port": 1}, "prod": {"port": 2}},
+        )
+
+        env: str
+        port: int = 0
+
+    # Act
+    sequential = MappedConfig()
+    parallel = MappedConfig(_parallel_loading=True)
+
+    # Assert
+    assert parallel == sequential
+    assert parallel.port == 2
+    assert parallel.full_fields() == sequential.full_fields()
+    assert list(parallel.all_loaded_fields()) == list(sequential.all_loaded_fields())
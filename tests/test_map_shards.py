@@ -0,0 +1,130 @@
+import gzip
+import json
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident import file_refs
+from confident.cli import collect_config_files
+from confident.map_shards import list_map_shards
+
+
+class ShardConfig(BaseConfig):
+    deployment: str = "dev"
+    host: str = "localhost"
+    port: int = 80
+
+
+@pytest.fixture
+def shards_dir(tmp_path):
+    shards_dir = tmp_path / "config_map"
+    shards_dir.mkdir()
+    (shards_dir / "dev.json").write_text(json.dumps({"port": 8000}))
+    (shards_dir / "prod.yaml").write_text("host: 0.0.0.0\nport: 8080\n")
+    (shards_dir / "stage.json.gz").write_bytes(
+        gzip.compress(json.dumps({"host": "stage.local"}).encode())
+    )
+    (shards_dir / ".hidden.json").write_text("not a config")
+    (shards_dir / "README.md").write_text("not a config")
+    return shards_dir
+
+
+@pytest.fixture
+def loaded_paths(monkeypatch):
+    loaded_paths = []
+    load_cached_file = file_refs.load_cached_file
+
+    def counting_load(path, *args, **kwargs):
+        loaded_paths.append(path)
+        return load_cached_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(file_refs, "load_cached_file", counting_load)
+    return loaded_paths
+
+
+def test__sharded_map__map_name(shards_dir, loaded_paths):
+    # Act
+    config = ShardConfig(_map_name="prod", _config_map=shards_dir)
+
+    # Assert
+    assert (config.host, config.port) == ("0.0.0.0", 8080)
+    assert config.full_fields()["port"].source_type == ConfigSource.map
+    assert config.full_fields()["port"].source_location == shards_dir / "prod.yaml"
+    assert [path.name for path in loaded_paths] == ["prod.yaml"]
+
+
+def test__sharded_map__map_field(shards_dir):
+    # Act
+    config = ShardConfig(
+        deployment="stage", _map_field="deployment", _config_map=shards_dir
+    )
+
+    # Assert
+    assert config.host == "stage.local"
+    assert config.full_fields()["host"].source_location == (
+        shards_dir / "stage.json.gz"
+    )
+
+
+def test__sharded_map__map_name_is_not_found(shards_dir):
+    # Act & Assert
+    with pytest.raises(KeyError):
+        ShardConfig(_map_name="hidden", _config_map=shards_dir)
+
+
+def test__sharded_map__listing_refreshed(shards_dir):
+    # Arrange
+    shards = list_map_shards(shards_dir)
+
+    # Act
+    same_shards = list_map_shards(shards_dir)
+    (shards_dir / "qa.yml").write_text("port: 9000\n")
+    config = ShardConfig(_map_name="qa", _config_map=shards_dir)
+
+    # Assert
+    assert same_shards is shards
+    assert sorted(shards) == ["dev", "prod", "stage"]
+    assert config.port == 9000
+
+
+def test__sharded_map__duplicate_shards(shards_dir):
+    # Arrange
+    (shards_dir / "prod.json").write_text(json.dumps({"port": 1}))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        ShardConfig(_map_name="prod", _config_map=shards_dir)
+
+
+def test__list_map_names(shards_dir, tmp_path, loaded_paths):
+    # Arrange
+    class ShardsConfig(ShardConfig):
+        model_config = ConfidentConfigDict(config_map=shards_dir)
+
+    map_path = tmp_path / "config_map.json"
+    map_path.write_text(json.dumps({"b": {}, "a": {}}))
+
+    # Act
+    shard_names = ShardsConfig.list_map_names()
+    file_names = ShardConfig.list_map_names(map_path)
+
+    # Assert
+    assert shard_names == ["dev", "prod", "stage"]
+    assert file_names == ["a", "b"]
+    assert loaded_paths == [map_path]
+    with pytest.raises(ValueError):
+        ShardConfig.list_map_names()
+
+
+def test__collect_config_files__sharded_map(shards_dir):
+    # Arrange
+    class ShardsConfig(ShardConfig):
+        model_config = ConfidentConfigDict(config_map=shards_dir)
+
+    # Act
+    paths = collect_config_files(ShardsConfig)
+
+    # Assert
+    assert paths == [
+        str(shards_dir / name) for name in ("dev.json", "prod.yaml", "stage.json.gz")
+    ]
@@ -0,0 +1,150 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource, override_config
+from confident.loaders.env_source_loader import cached_env_trie
+from confident.overrides import OVERRIDE_SOURCE_NAME, class_overrides
+
+pytest_plugins = ["pytester"]
+
+
+class ServiceConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+
+
+def test__override_config__object():
+    # Arrange
+    config = ServiceConfig()
+    dump = config.model_dump_json()
+
+    # Act
+    with override_config(config, port="81"):
+        overridden_port = config.port
+        overridden_field = config.full_fields()["port"]
+        overridden_dump = config.model_dump_json()
+
+    # Assert
+    assert overridden_port == 81
+    assert overridden_field.source_type == ConfigSource.init
+    assert overridden_field.source_location == OVERRIDE_SOURCE_NAME
+    assert json.loads(overridden_dump)["port"] == 81
+    assert config.port == 80
+    assert config.full_fields()["port"].source_type == ConfigSource.class_default
+    assert config.model_dump_json() == dump
+
+
+def test__override_config__frozen_object():
+    # Arrange
+    class FrozenServiceConfig(ServiceConfig):
+        model_config = ConfidentConfigDict(frozen=True)
+
+    config = FrozenServiceConfig()
+
+    # Act
+    with override_config(config, host="example.com"):
+        overridden_host = config.host
+
+    # Assert
+    assert overridden_host == "example.com"
+    assert config.host == "localhost"
+
+
+def test__override_config__class():
+    # Act
+    with override_config(ServiceConfig, port=81):
+        with override_config(ServiceConfig, host="example.com"):
+            config = ServiceConfig()
+    other_config = ServiceConfig()
+
+    # Assert
+    assert (config.host, config.port) == ("example.com", 81)
+    assert config.full_fields()["host"].source_location == OVERRIDE_SOURCE_NAME
+    assert (other_config.host, other_config.port) == ("localhost", 80)
+
+
+def test__override_config__class_overrides_not_shared():
+    # Act
+    with override_config(ServiceConfig, port=81):
+        class_overrides(ServiceConfig)["port"] = 82  # type: ignore[index]
+        config = ServiceConfig()
+
+    # Assert
+    assert config.port == 81
+    assert class_overrides(ServiceConfig) is None
+
+
+@pytest.mark.parametrize(
+    "values, error",
+    [({"port": "not a port"}, ValidationError), ({"other": 1}, ValueError)],
+)
+def test__override_config__invalid(values, error):
+    # Arrange
+    config = ServiceConfig()
+
+    # Act & Assert
+    with pytest.raises(error):
+        with override_config(config, **values):
+            pass
+    assert config.port == 80
+
+
+def test__creation_path__caller_module():
+    # Act
+    config = ServiceConfig()
+
+    # Assert
+    assert config.specs().creation_path == Path(__file__)
+
+
+def test__env_trie__cached_until_environment_changes(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("PORT", "81")
+    trie = cached_env_trie()
+
+    # Act
+    same_trie = cached_env_trie()
+    config = ServiceConfig()
+    monkeypatch.setenv("PORT", "82")
+    changed_config = ServiceConfig()
+
+    # Assert
+    assert same_trie is trie
+    assert cached_env_trie() is not trie
+    assert config.port == 81
+    assert changed_config.port == 82
+
+
+def test__pytest_plugin__slowest_creations(pytester):
+    # Arrange
+    pytester.makepyfile(
+        """
+        from confident import BaseConfig
+
+        class AppConfig(BaseConfig):
+            port: int = 80
+
+        def test_creations():
+            for _ in range(3):
+                AppConfig()
+        """
+    )
+
+    # Act
+    result = pytester.runpytest(
+        "-p", "confident.pytest_plugin", "--confident-durations", "2"
+    )
+
+    # Assert
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*slowest config creations (3 creations)*",
+            "*ms AppConfig*test_creations*",
+            "*ms AppConfig*test_creations*",
+        ]
+    )
+    assert len([line for line in result.outlines if "ms AppConfig" in line]) == 2
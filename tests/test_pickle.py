@@ -0,0 +1,67 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from unittest.mock import patch
+
+from confident import BaseConfig, ConfigSource
+from confident import confident as confident_module
+
+
+class PickledConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+    labels: List[str] = []
+
+
+def describe(config: PickledConfig) -> tuple:
+    return config.model_dump(), config.full_fields()["port"].source_type
+
+
+def test__pickle__round_trip():
+    # Arrange
+    with patch.dict(os.environ, {"port": "81"}):
+        config = PickledConfig(labels=["a"])
+
+    # Act
+    restored = pickle.loads(pickle.dumps(config))
+
+    # Assert
+    assert type(restored) is PickledConfig
+    assert restored == config
+    assert restored.model_dump() == {"host": "localhost", "port": 81, "labels": ["a"]}
+    assert restored.full_fields() == config.full_fields()
+    assert restored.specs() == config.specs()
+    assert restored.fingerprint() == config.fingerprint()
+    assert restored.all_loaded_fields()[ConfigSource.env_var] == {
+        "port": config.full_fields()["port"]
+    }
+
+
+def test__pickle__no_loading(monkeypatch):
+    # Arrange
+    payload = pickle.dumps(PickledConfig())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Unpickling should not load the sources.")
+
+    monkeypatch.setattr(confident_module, "get_caller_file_path", fail)
+    monkeypatch.setattr(confident_module.LoaderManager, "load_all", fail)
+
+    # Act
+    restored = pickle.loads(payload)
+
+    # Assert
+    assert restored.port == 80
+
+
+def test__pickle__process_pool():
+    # Arrange
+    config = PickledConfig(port=82)
+
+    # Act
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        result = executor.submit(describe, config).result()
+
+    # Assert
+    assert result == (config.model_dump(), ConfigSource.init)
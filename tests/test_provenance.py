@@ -0,0 +1,97 @@
+import os
+import pickle
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident.confident import LOADER_MANAGER_ATTR
+
+
+class ProvenanceConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+
+
+@patch.dict(os.environ, {"port": "81"})
+def test__provenance__full():
+    # Act
+    config = ProvenanceConfig(port=82)
+
+    # Assert
+    assert config.specs().provenance == "full"
+    assert config.full_fields()["port"].source_type == ConfigSource.init
+    assert set(config.all_loaded_fields()[ConfigSource.env_var]) == {"port"}
+
+
+@patch.dict(os.environ, {"port": "81"})
+def test__provenance__winners():
+    # Arrange
+    class WinnersConfig(ProvenanceConfig):
+        model_config = ConfidentConfigDict(provenance="winners")
+
+    # Act
+    config = WinnersConfig(port=82)
+
+    # Assert
+    assert config.port == 82
+    assert config.full_fields()["port"].source_type == ConfigSource.init
+    assert config.all_loaded_fields() == {
+        ConfigSource.init: {"port": config.full_fields()["port"]},
+        ConfigSource.class_default: {"host": config.full_fields()["host"]},
+    }
+
+
+def test__provenance__none():
+    # Act
+    config = ProvenanceConfig(port=82, _provenance="none")
+
+    # Assert
+    assert config.port == 82
+    assert config.full_fields() == {}
+    assert config.all_loaded_fields() == {}
+    assert config.fingerprint() == ProvenanceConfig(port=82).fingerprint()
+    assert [diff.name for diff in config.diff(ProvenanceConfig())] == ["port"]
+
+
+@pytest.mark.parametrize("provenance", ["full", "winners"])
+def test__provenance__build_state_released(provenance):
+    # Act
+    config = ProvenanceConfig(_provenance=provenance)
+
+    # Assert
+    loader_manager = object.__getattribute__(config, LOADER_MANAGER_ATTR)
+    assert loader_manager.loaders == []
+    assert loader_manager.settings_obj is None
+    assert loader_manager.env_settings_callable is None
+
+
+def test__provenance__none_without_loader_manager():
+    # Act
+    config = ProvenanceConfig(_provenance="none")
+    restored = pickle.loads(pickle.dumps(config))
+
+    # Assert
+    assert object.__getattribute__(config, LOADER_MANAGER_ATTR) is None
+    assert object.__getattribute__(restored, LOADER_MANAGER_ATTR) is None
+    assert restored.full_fields() == {}
+
+
+@pytest.mark.parametrize("provenance", ["full", "winners", "none"])
+def test__provenance__specs_shared(provenance):
+    # Act
+    configs = [ProvenanceConfig(port=port, _provenance=provenance) for port in (1, 2)]
+    other_config = ProvenanceConfig(_provenance=provenance, _interpolate=True)
+
+    # Assert
+    assert configs[0].__specs__ is configs[1].__specs__
+    assert other_config.__specs__ is not configs[0].__specs__
+    assert other_config.specs().interpolate
+    assert configs[0].specs() is not configs[0].__specs__
+
+
+def test__provenance__invalid():
+    # Act & Assert
+    with pytest.raises(ValidationError):
+        ProvenanceConfig(_provenance="partial")
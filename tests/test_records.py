@@ -0,0 +1,188 @@
+import json
+from typing import Dict
+
+import pytest
+from pydantic import ValidationError
+
+from confident import BaseConfig, ConfigSource
+from confident.records import RecordError, deep_merge
+
+
+class HostConfig(BaseConfig):
+    hostname: str
+    port: int = 80
+    region: str = "eu"
+    labels: Dict[str, str] = {}
+
+
+@pytest.fixture
+def records_file(tmp_path):
+    path = tmp_path / "hosts.jsonl"
+    lines = [
+        json.dumps({"hostname": "a", "port": 8080}),
+        "",
+        "not json",
+        json.dumps({"hostname": "b", "port": "not a port"}),
+        json.dumps(["not", "a", "dict"]),
+        json.dumps({"hostname": "c", "labels": {"team": "x"}}),
+    ]
+    path.write_text("\n".join(lines))
+    return path
+
+
+def test__iter_from_records__json_lines(records_file):
+    # Act
+    results = list(HostConfig.iter_from_records(records_file, chunk_size=2))
+
+    # Assert
+    assert [type(result) for result in results] == [
+        HostConfig,
+        RecordError,
+        RecordError,
+        RecordError,
+        HostConfig,
+    ]
+    assert results[0].hostname == "a" and results[0].port == 8080
+    assert results[4].labels == {"team": "x"}
+    assert [result.position for result in results[1:4]] == [1, 2, 3]
+    assert isinstance(results[1].error, ValueError)
+    assert isinstance(results[2].error, ValidationError)
+    assert results[2].record == {"hostname": "b", "port": "not a port"}
+    assert results[3].record == ["not", "a", "dict"]
+
+
+def test__iter_from_records__shared_sources(monkeypatch, tmp_path):
+    # Arrange
+    monkeypatch.setenv("REGION", "us")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"port": 9000, "labels": {"env": "prod"}}))
+
+    # Act
+    results = list(
+        HostConfig.iter_from_records(
+            [{"hostname": "a"}, {"hostname": "b", "port": 1}, {"hostname": "c"}],
+            _files=[config_path],
+        )
+    )
+
+    # Assert
+    assert [(result.hostname, result.port) for result in results] == [
+        ("a", 9000),
+        ("b", 1),
+        ("c", 9000),
+    ]
+    assert all(result.region == "us" for result in results)
+    full_fields = results[1].full_fields()
+    assert full_fields["hostname"].source_type == ConfigSource.init
+    assert full_fields["port"].source_type == ConfigSource.init
+    assert full_fields["region"].source_type == ConfigSource.env_var
+    assert results[0].full_fields()["port"].source_type == ConfigSource.file
+
+
+def test__iter_from_records__higher_priority_sources(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("PORT", "5000")
+
+    # Act
+    results = list(
+        HostConfig.iter_from_records(
+            [{"hostname": "a", "port": 1}],
+            _source_priority=[
+                ConfigSource.env_var,
+                ConfigSource.init,
+                ConfigSource.class_default,
+            ],
+        )
+    )
+
+    # Assert
+    assert results[0].port == 5000
+    assert results[0].full_fields()["port"].source_type == ConfigSource.env_var
+
+
+def test__iter_from_records__nested_values_merged(tmp_path):
+    # Arrange
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"labels": {"env": "prod"}}))
+
+    # Act
+    results = list(
+        HostConfig.iter_from_records(
+            [{"hostname": "a", "labels": {"team": "x"}}], _files=[config_path]
+        )
+    )
+
+    # Assert
+    assert results[0].labels == {"env": "prod", "team": "x"}
+    assert (
+        results[0].labels
+        == HostConfig(hostname="a", labels={"team": "x"}, _files=[config_path]).labels
+    )
+
+
+def test__iter_from_records__yaml_documents(tmp_path):
+    # Arrange
+    path = tmp_path / "hosts.yaml"
+    path.write_text("hostname: a\n---\nhostname: b\nport: 81\n---\n")
+
+    # Act
+    results = list(HostConfig.iter_from_records(path))
+
+    # Assert
+    assert [(result.hostname, result.port) for result in results] == [
+        ("a", 80),
+        ("b", 81),
+    ]
+
+
+def test__iter_from_records__lazy():
+    # Arrange
+    consumed = []
+
+    def records():
+        for index in range(10):
+            consumed.append(index)
+            yield {"hostname": str(index)}
+
+    # Act
+    results = HostConfig.iter_from_records(records(), chunk_size=3)
+    first = next(results)
+
+    # Assert
+    assert first.hostname == "0"
+    assert consumed == [0, 1, 2]
+
+
+def test__iter_from_records__processes():
+    # Act
+    results = list(
+        HostConfig.iter_from_records(
+            ({"hostname": str(index)} for index in range(50)),
+            chunk_size=4,
+            processes=2,
+        )
+    )
+
+    # Assert
+    assert [result.hostname for result in results] == [
+        str(index) for index in range(50)
+    ]
+    assert results[0].full_fields()["hostname"].source_type == ConfigSource.init
+
+
+@pytest.mark.parametrize("file_name", ["missing.jsonl", "hosts.csv"])
+def test__iter_from_records__invalid_file(tmp_path, file_name):
+    # Arrange
+    (tmp_path / "hosts.csv").write_text("hostname\na\n")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        HostConfig.iter_from_records(tmp_path / file_name)
+
+
+def test__deep_merge():
+    # Act
+    merged = deep_merge({"a": {"b": 1, "c": 2}, "d": 1}, {"a": {"b": 3}, "d": {"e": 1}})
+
+    # Assert
+    assert merged == {"a": {"b": 3, "c": 2}, "d": {"e": 1}}
@@ -0,0 +1,248 @@
+import datetime
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator
+
+import pytest
+
+from confident import BaseConfig, ConfigSource
+from confident.loaders import remote_source_loader
+
+REMOTE_CONTENT = {"host": "10.0.0.1", "port": 8080, "unrelated": True}
+REMOTE_ETAG = '"v1"'
+
+
+class RemoteConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+
+
+class ConfigServerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.client_address, self.headers.get("If-None-Match")))
+        time.sleep(server.delay)
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.send_header("ETag", server.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = server.body or json.dumps(server.content).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", server.content_type)
+        self.send_header("ETag", server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not server.trickle:
+            self.wfile.write(body)
+            return
+        for index in range(len(body)):
+            self.wfile.write(body[index : index + 1])
+            self.wfile.flush()
+            time.sleep(server.trickle)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ConfigServer(ThreadingHTTPServer):
+    block_on_close = False
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ConfigServerHandler)
+        self.requests = []
+        self.delay = 0.0
+        # Sends the body a byte at a time, with this delay between the bytes.
+        self.trickle = 0.0
+        self.body = b""
+        self.content_type = "application/json"
+        self.content = REMOTE_CONTENT
+        self.etag = REMOTE_ETAG
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/services/app"
+
+
+@pytest.fixture
+def config_server() -> Generator[ConfigServer, None, None]:
+    remote_source_loader._responses.clear()
+    server = ConfigServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test__load_remote(config_server):
+    # Act
+    config = RemoteConfig(_remote_url=config_server.url)
+
+    # Assert
+    assert config.model_dump() == {"host": "10.0.0.1", "port": 8080}
+    field = config.full_fields()["host"]
+    assert field.source_type == ConfigSource.remote
+    assert field.source_location == config_server.url
+    assert set(config.all_loaded_fields()[ConfigSource.remote]) == {"host", "port"}
+
+
+def test__load_remote__etag_revalidation_and_keep_alive(config_server):
+    # Act
+    RemoteConfig.from_sources(remote_url=config_server.url)
+    config = RemoteConfig.from_sources(remote_url=config_server.url)
+
+    # Assert
+    assert config.port == 8080
+    assert [etag for _, etag in config_server.requests] == [None, REMOTE_ETAG]
+    # Both requests were sent over the same connection.
+    assert len({address for address, _ in config_server.requests}) == 1
+
+
+def test__load_remote__changed_content(config_server):
+    # Arrange
+    RemoteConfig(_remote_url=config_server.url)
+    config_server.content = {"port": 9090}
+    config_server.etag = '"v2"'
+
+    # Act
+    config = RemoteConfig(_remote_url=config_server.url)
+
+    # Assert
+    assert config.model_dump() == {"host": "localhost", "port": 9090}
+
+
+def test__load_remote__disk_fallback(config_server, tmp_path):
+    # Arrange
+    url = config_server.url
+    RemoteConfig(_remote_url=url, _remote_cache_dir=tmp_path)
+    config_server.shutdown()
+    config_server.server_close()
+    remote_source_loader._responses.clear()
+
+    # Act
+    config = RemoteConfig(_remote_url=url, _remote_cache_dir=tmp_path)
+
+    # Assert
+    assert config.model_dump() == {"host": "10.0.0.1", "port": 8080}
+    assert config.full_fields()["host"].source_location == url
+
+
+def test__load_remote__deadline(config_server):
+    # Arrange
+    RemoteConfig(_remote_url=config_server.url)
+    config_server.delay = 0.5
+
+    # Act - A slow server is answered from the cache within the deadline.
+    start = time.monotonic()
+    config = RemoteConfig(_remote_url=config_server.url, _remote_timeout=0.2)
+
+    # Assert
+    assert time.monotonic() - start < 0.5
+    assert config.port == 8080
+
+    # Act & Assert - Without a cached content, the deadline fails the load.
+    remote_source_loader._responses.clear()
+    with pytest.raises(ValueError) as error:
+        RemoteConfig(_remote_url=config_server.url, _remote_timeout=0.2)
+    assert "Could not load" in str(error.value)
+
+
+def test__load_remote__deadline_of_slow_body(config_server):
+    # Arrange
+    RemoteConfig(_remote_url=config_server.url)
+    config_server.etag = '"v2"'
+    config_server.trickle = 0.05
+
+    # Act - Every byte arrives well within the timeout, but the whole body does not.
+    start = time.monotonic()
+    config = RemoteConfig(_remote_url=config_server.url, _remote_timeout=0.3)
+
+    # Assert
+    assert time.monotonic() - start < 0.6
+    assert config.port == 8080
+
+
+def test__load_remote__invalid_response_served_from_cache(config_server):
+    # Arrange
+    RemoteConfig(_remote_url=config_server.url)
+    config_server.etag = '"v2"'
+    config_server.body = b'{"port": 90'
+
+    # Act
+    config = RemoteConfig(_remote_url=config_server.url)
+
+    # Assert
+    assert config.port == 8080
+
+    # Act & Assert - Without a cached content, the invalid response fails the load.
+    remote_source_loader._responses.clear()
+    with pytest.raises(ValueError) as error:
+        RemoteConfig(_remote_url=config_server.url)
+    assert "Could not load" in str(error.value)
+
+
+def test__load_remote__disk_cache_revalidated_in_background(config_server, tmp_path):
+    # Arrange
+    RemoteConfig(_remote_url=config_server.url, _remote_cache_dir=tmp_path)
+    remote_source_loader._responses.clear()
+    config_server.delay = 0.3
+
+    # Act - The slow request is answered from the disk cache, and revalidated in the background.
+    config = RemoteConfig(
+        _remote_url=config_server.url, _remote_cache_dir=tmp_path, _remote_timeout=0.1
+    )
+    deadline = time.monotonic() + 5
+    while len(config_server.requests) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Assert
+    assert config.port == 8080
+    assert [etag for _, etag in config_server.requests] == [
+        None,
+        REMOTE_ETAG,
+        REMOTE_ETAG,
+    ]
+
+
+def test__load_remote__yaml_body_cached_on_disk(config_server, tmp_path):
+    # Arrange
+    class ReleaseConfig(RemoteConfig):
+        release: datetime.date | None = None
+
+    url = config_server.url
+    config_server.content_type = "application/yaml"
+    config_server.body = b"release: 2024-01-01\nport: 9090\n"
+    ReleaseConfig(_remote_url=url, _remote_cache_dir=tmp_path)
+    config_server.shutdown()
+    config_server.server_close()
+    remote_source_loader._responses.clear()
+
+    # Act
+    config = ReleaseConfig(_remote_url=url, _remote_cache_dir=tmp_path)
+
+    # Assert
+    assert config.release == datetime.date(2024, 1, 1)
+    assert config.port == 9090
+
+
+def test__load_remote__cache_dir_not_writable(config_server, tmp_path, caplog):
+    # Arrange
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+
+    # Act
+    with caplog.at_level(logging.WARNING, logger=remote_source_loader.__name__):
+        config = RemoteConfig(
+            _remote_url=config_server.url, _remote_cache_dir=cache_dir
+        )
+
+    # Assert
+    assert config.port == 8080
+    assert "Could not cache the response" in caplog.text
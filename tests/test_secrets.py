@@ -0,0 +1,126 @@
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident.loaders import secrets_source_loader
+
+
+class SecretsConfig(BaseConfig):
+    db_password: str
+    api_port: int = 80
+
+
+@pytest.fixture
+def secrets_dir(tmp_path) -> Path:
+    (tmp_path / "db_password").write_text("s3cr3t\n")
+    (tmp_path / "api_port").write_text("8080")
+    (tmp_path / "unrelated").write_text("nothing")
+    return tmp_path
+
+
+@pytest.fixture
+def k8s_secrets_dir(tmp_path) -> Path:
+    """
+    Builds the layout Kubernetes uses for mounted secrets.
+    """
+    version_dir = tmp_path / "..2024_01_01_00_00_00.000000000"
+    version_dir.mkdir()
+    (version_dir / "db_password").write_text("k8s_secret")
+    os.symlink(version_dir.name, tmp_path / "..data")
+    os.symlink(os.path.join("..data", "db_password"), tmp_path / "db_password")
+    return tmp_path
+
+
+def test__load_secrets_dir(secrets_dir):
+    # Act
+    config = SecretsConfig(_secrets_dir=secrets_dir)
+
+    # Assert
+    assert config.model_dump() == {"db_password": "s3cr3t", "api_port": 8080}
+    field = config.full_fields()["db_password"]
+    assert field.source_type == ConfigSource.secrets
+    assert field.source_location == secrets_dir / "db_password"
+    assert isinstance(field.origin_value, SecretStr)
+
+
+def test__load_secrets_dir__model_config(secrets_dir):
+    # Arrange
+    class MyConfig(BaseConfig):
+        model_config = ConfidentConfigDict(secrets_dir=str(secrets_dir))
+        db_password: str
+
+    # Act
+    config = MyConfig()
+
+    # Assert
+    assert config.db_password == "s3cr3t"
+    assert config.specs().secrets_dir == [secrets_dir]
+
+
+def test__load_secrets_dir__values_redacted(secrets_dir):
+    # Act
+    config = SecretsConfig(_secrets_dir=secrets_dir)
+
+    # Assert
+    assert "s3cr3t" not in repr(config.full_fields())
+    assert "s3cr3t" not in repr(config.all_loaded_fields())
+
+
+def test__load_secrets_dir__k8s_layout(k8s_secrets_dir):
+    # Act
+    config = SecretsConfig.from_sources(secrets_dir=k8s_secrets_dir)
+
+    # Assert
+    assert config.db_password == "k8s_secret"
+    assert set(config.all_loaded_fields()[ConfigSource.secrets]) == {"db_password"}
+
+
+def test__load_secrets_dir__priority(secrets_dir, tmp_path_factory):
+    # Arrange
+    override_dir = tmp_path_factory.mktemp("override")
+    (override_dir / "db_password").write_text("override")
+
+    # Act
+    config = SecretsConfig(_secrets_dir=[secrets_dir, override_dir], api_port=9000)
+
+    # Assert
+    assert config.model_dump() == {"db_password": "override", "api_port": 9000}
+
+
+def test__load_secrets_dir__missing_dir(tmp_path):
+    # Arrange
+    missing_dir = tmp_path / "missing"
+
+    # Act & Assert
+    config = SecretsConfig(_secrets_dir=missing_dir, db_password="init")
+    assert config.all_loaded_fields()[ConfigSource.secrets] == {}
+    with pytest.raises(ValueError) as error:
+        SecretsConfig(
+            _secrets_dir=missing_dir, _ignore_missing_files=False, db_password="init"
+        )
+    assert "is not exists." in str(error.value)
+
+
+def test__load_secrets_dir__cached_content(secrets_dir, monkeypatch):
+    # Arrange
+    SecretsConfig(_secrets_dir=secrets_dir)
+    monkeypatch.setattr(Path, "read_text", None)
+
+    # Act - Unchanged secrets are not read again.
+    config = SecretsConfig(_secrets_dir=secrets_dir)
+
+    # Assert
+    assert config.db_password == "s3cr3t"
+    monkeypatch.undo()
+
+    # Act - A replaced secret file is read again.
+    (secrets_dir / "db_password").unlink()
+    (secrets_dir / "db_password").write_text("rotated_secret")
+    config = SecretsConfig(_secrets_dir=secrets_dir)
+
+    # Assert
+    assert config.db_password == "rotated_secret"
+    assert str(secrets_dir / "db_password") in secrets_source_loader._secrets_cache
@@ -0,0 +1,134 @@
+import io
+import json
+from typing import Dict, List
+
+from confident import BaseConfig, ConfidentConfigDict
+
+
+class SerializedConfig(BaseConfig):
+    model_config = ConfidentConfigDict(validate_assignment=True)
+
+    host: str = "localhost"
+    port: int = 80
+    labels: Dict[str, List[int]] = {}
+
+
+class SecretConfig(BaseConfig):
+    db_password: str
+    api_port: int = 80
+
+
+def test__model_dump_json__memoized():
+    # Arrange
+    config = SerializedConfig(labels={"a": [1]})
+
+    # Act
+    dump = config.model_dump_json()
+
+    # Assert
+    assert json.loads(dump) == {"host": "localhost", "port": 80, "labels": {"a": [1]}}
+    assert config.model_dump_json() is dump
+    assert config.model_dump_json(indent=2) is not dump
+
+
+def test__model_dump_json__memoized_per_arguments():
+    # Arrange
+    config = SerializedConfig(labels={"a": [1, 2]})
+
+    # Act
+    include_set = config.model_dump_json(include={"host", "port"})
+    include_dict = config.model_dump_json(include={"labels": {"a": {0}}})
+    exclude_set = config.model_dump_json(exclude={"labels"})
+
+    # Assert
+    assert json.loads(include_set) == {"host": "localhost", "port": 80}
+    assert json.loads(include_dict) == {"labels": {"a": [1]}}
+    assert json.loads(exclude_set) == {"host": "localhost", "port": 80}
+    assert config.model_dump_json(include={"port", "host"}) is include_set
+    assert config.model_dump_json(include={"labels": {"a": {0}}}) is include_dict
+
+
+def test__model_dump_json__context_not_memoized():
+    # Arrange
+    config = SerializedConfig()
+
+    # Act
+    dump = config.model_dump_json(context={"request": 1})
+
+    # Assert
+    assert config.model_dump_json(context={"request": 1}) is not dump
+    assert config.model_dump_json(context={"request": 1}) == dump
+
+
+def test__model_dump_json__invalidated_on_assignment():
+    # Arrange
+    config = SerializedConfig()
+    dump = config.model_dump_json()
+    provenance = config.provenance_json()
+
+    # Act
+    config.port = 81
+
+    # Assert
+    assert json.loads(config.model_dump_json())["port"] == 81
+    assert config.model_dump_json() != dump
+    assert config.provenance_json() is not provenance
+
+
+def test__model_dump_json__copies_not_shared():
+    # Arrange
+    config = SerializedConfig()
+    config.model_dump_json()
+
+    # Act
+    copy = config.model_copy(update={"port": 81})
+
+    # Assert
+    assert json.loads(copy.model_dump_json())["port"] == 81
+    assert json.loads(config.model_dump_json())["port"] == 80
+
+
+def test__provenance_json():
+    # Arrange
+    config = SerializedConfig(port=81)
+
+    # Act
+    provenance = config.provenance_json()
+
+    # Assert
+    loaded = json.loads(provenance)
+    assert loaded["port"]["value"] == 81
+    assert loaded["port"]["source_type"] == "init"
+    assert loaded["host"]["source_type"] == "class_default"
+    assert config.provenance_json() is provenance
+    assert json.loads(config.provenance_json(indent=2)) == loaded
+
+
+def test__write_provenance():
+    # Arrange
+    config = SerializedConfig(port=81)
+    file = io.StringIO()
+
+    # Act
+    config.write_provenance(file)
+
+    # Assert
+    assert json.loads(file.getvalue()) == json.loads(config.provenance_json())
+    assert len(file.getvalue().splitlines()) == len(type(config).model_fields) + 2
+
+
+def test__provenance_json__secrets_hidden(tmp_path):
+    # Arrange
+    (tmp_path / "db_password").write_text("s3cr3t")
+    config = SecretConfig(_secrets_dir=tmp_path)
+    file = io.StringIO()
+
+    # Act
+    provenance = config.provenance_json()
+    config.write_provenance(file)
+
+    # Assert
+    assert "s3cr3t" not in provenance
+    assert "s3cr3t" not in file.getvalue()
+    assert json.loads(provenance)["db_password"]["value"] == "**********"
+    assert config.full_fields()["db_password"].model_dump()["value"] == "s3cr3t"
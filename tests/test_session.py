@@ -0,0 +1,121 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSession, ConfigSource
+from confident import file_refs
+
+
+class DbConfig(BaseConfig):
+    db_host: str = "localhost"
+    db_port: int = 5432
+
+
+class ApiConfig(BaseConfig):
+    api_port: int = 80
+    region: str = "eu"
+
+
+class WorkerConfig(BaseConfig):
+    workers: int = 1
+    region: str = "eu"
+
+
+@pytest.fixture
+def shared_files(tmp_path):
+    (tmp_path / "common.json").write_text(json.dumps({"region": "us"}))
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"$ref": "common.json", "db_port": 5433, "workers": 4})
+    )
+    return config_path
+
+
+def test__session__environment_snapshot(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DB_HOST", "db.local")
+
+    # Act
+    with ConfigSession() as session:
+        monkeypatch.setenv("DB_HOST", "changed.local")
+        loaded = session.load(DbConfig)
+        created = DbConfig()
+    after_session = DbConfig()
+
+    # Assert
+    assert loaded.db_host == "db.local"
+    assert created.db_host == "db.local"
+    assert after_session.db_host == "changed.local"
+
+
+def test__session__files_checked_once(shared_files, monkeypatch):
+    # Arrange
+    checked_paths = []
+    file_identity = file_refs._file_identity
+
+    def counting_identity(path):
+        checked_paths.append(path)
+        return file_identity(path)
+
+    monkeypatch.setattr(file_refs, "_file_identity", counting_identity)
+
+    # Act
+    with ConfigSession() as session:
+        db_config = session.load(DbConfig, _files=[shared_files])
+        api_config = session.load(ApiConfig, _files=[shared_files])
+        worker_config = session.load(WorkerConfig, _files=[shared_files])
+
+    # Assert
+    assert db_config.db_port == 5433
+    assert api_config.region == worker_config.region == "us"
+    assert worker_config.workers == 4
+    assert len(checked_paths) == len(set(checked_paths)) == 2
+    assert session.resolved_files == {}
+
+
+def test__session__load_all(shared_files):
+    # Arrange
+    class FilesConfig(WorkerConfig):
+        model_config = ConfidentConfigDict(files=[str(shared_files)])
+
+    # Act
+    with ConfigSession(max_workers=2) as session:
+        configs = session.load_all([DbConfig, FilesConfig, ApiConfig])
+
+    # Assert
+    assert [type(config) for config in configs] == [DbConfig, FilesConfig, ApiConfig]
+    assert configs[1].workers == 4
+    assert configs[1].full_fields()["region"].source_type == ConfigSource.file
+
+
+def test__session__creation_path():
+    # Act
+    with ConfigSession() as session:
+        config = session.load(DbConfig, db_port=1)
+        (other_config,) = session.load_all([ApiConfig])
+
+    # Assert
+    assert config.specs().creation_path == Path(__file__)
+    assert config.full_fields()["db_port"].source_location == Path(__file__)
+    assert other_config.specs().creation_path == Path(__file__)
+
+
+def test__session__not_active():
+    # Arrange
+    session = ConfigSession()
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        session.load(DbConfig)
+    with session:
+        pass
+    with pytest.raises(ValueError):
+        session.load(DbConfig)
+
+
+def test__session__load_all_duplicate_classes():
+    # Act & Assert
+    with ConfigSession() as session:
+        with pytest.raises(ValueError):
+            session.load_all([DbConfig, DbConfig])
@@ -0,0 +1,161 @@
+import sqlite3
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from confident import BaseConfig, ConfidentConfigDict, ConfigSource
+from confident.loaders import sqlite_source_loader
+
+TENANT_ROWS = [
+    ("tenant_a", "host", "a.example.com"),
+    ("tenant_a", "port", "8001"),
+    ("tenant_a", "unrelated", "nothing"),
+    ("tenant_b", "host", "b.example.com"),
+    ("tenant_c", "port", "8003"),
+]
+
+
+class TenantConfig(BaseConfig):
+    host: str = "localhost"
+    port: int = 80
+
+
+@pytest.fixture
+def sqlite_path(tmp_path) -> Generator[Path, None, None]:
+    """
+    Creates a WAL mode database, with a writer connection that stays open like a syncing agent.
+    """
+    path = tmp_path / "tenants.db"
+    writer = sqlite3.connect(path)
+    writer.execute("PRAGMA journal_mode = WAL")
+    writer.execute("CREATE TABLE config (scope TEXT, key TEXT, value TEXT)")
+    writer.executemany("INSERT INTO config VALUES (?, ?, ?)", TENANT_ROWS)
+    writer.commit()
+    yield path
+    writer.close()
+
+
+def test__load_sqlite(sqlite_path):
+    # Act
+    config = TenantConfig(_sqlite_path=sqlite_path, _sqlite_scope="tenant_a")
+
+    # Assert
+    assert config.model_dump() == {"host": "a.example.com", "port": 8001}
+    field = config.full_fields()["port"]
+    assert field.source_type == ConfigSource.sqlite
+    assert field.source_name == "tenant_a"
+    assert field.source_location == f"{sqlite_path}:config:2"
+    assert field.origin_value == "8001"
+
+
+def test__load_sqlite__model_config(sqlite_path):
+    # Arrange
+    class MyConfig(BaseConfig):
+        model_config = ConfidentConfigDict(
+            sqlite_path=str(sqlite_path), sqlite_scope="tenant_b"
+        )
+        host: str
+
+    # Act
+    config = MyConfig()
+
+    # Assert
+    assert config.host == "b.example.com"
+
+
+def test__load_sqlite__read_only(sqlite_path):
+    # Arrange
+    connection = sqlite_source_loader._get_connection(path=sqlite_path, read_only=True)
+
+    # Act & Assert
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("DELETE FROM config")
+
+
+def test__load_sqlite__connection_reused(sqlite_path):
+    # Act
+    TenantConfig.from_sources(sqlite_path=sqlite_path, sqlite_scope="tenant_a")
+    connection = sqlite_source_loader._get_connection(path=sqlite_path, read_only=True)
+    TenantConfig.from_sources(sqlite_path=sqlite_path, sqlite_scope="tenant_b")
+
+    # Assert
+    assert (
+        sqlite_source_loader._get_connection(path=sqlite_path, read_only=True)
+        is connection
+    )
+
+
+def test__load_sqlite__invalid_table(sqlite_path):
+    # Act & Assert
+    with pytest.raises(ValueError) as error:
+        TenantConfig(_sqlite_path=sqlite_path, _sqlite_table="config; DROP TABLE x")
+    assert "is not a valid table name." in str(error.value)
+
+
+def test__from_sqlite_scopes(sqlite_path, monkeypatch):
+    # Arrange
+    queries = []
+    fetch_sqlite_scopes = sqlite_source_loader.fetch_sqlite_scopes
+
+    def counting_fetch(**kwargs):
+        queries.append(kwargs["scopes"])
+        return fetch_sqlite_scopes(**kwargs)
+
+    monkeypatch.setattr(sqlite_source_loader, "fetch_sqlite_scopes", counting_fetch)
+
+    # Act
+    configs = list(
+        TenantConfig.from_sqlite_scopes(
+            ["tenant_a", "tenant_b", "tenant_c"], sqlite_path=sqlite_path, batch_size=2
+        )
+    )
+
+    # Assert
+    assert [config.model_dump() for config in configs] == [
+        {"host": "a.example.com", "port": 8001},
+        {"host": "b.example.com", "port": 80},
+        {"host": "localhost", "port": 8003},
+    ]
+    assert queries == [["tenant_a", "tenant_b"], ["tenant_c"]]
+
+
+def test__from_sqlite_scopes__prefetch_not_left_in_place(sqlite_path):
+    # Arrange
+    first = TenantConfig.from_sqlite_scopes(
+        ["tenant_a", "tenant_b"], sqlite_path=sqlite_path, batch_size=1
+    )
+    second = TenantConfig.from_sqlite_scopes(
+        ["tenant_c", "tenant_a"], sqlite_path=sqlite_path, batch_size=1
+    )
+
+    # Act
+    configs = [next(first), next(second), next(first), next(second)]
+
+    # Assert
+    assert getattr(sqlite_source_loader._thread_local, "prefetched", None) is None
+    assert [config.port for config in configs] == [8001, 8003, 80, 8001]
+
+
+def test__fetch_sqlite_scopes__variables_limit(sqlite_path):
+    # Arrange
+    connection = sqlite_source_loader._get_connection(path=sqlite_path, read_only=True)
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 4)
+    scopes = ["tenant_a", "tenant_b", "tenant_c", "tenant_d", "tenant_e"]
+
+    # Act
+    rows = sqlite_source_loader.fetch_sqlite_scopes(
+        path=sqlite_path,
+        table="config",
+        scopes=scopes,
+        field_names=["host", "port", "missing", "other", "more"],
+    )
+
+    # Assert
+    assert {scope: set(scope_rows) for scope, scope_rows in rows.items()} == {
+        "tenant_a": {"host", "port"},
+        "tenant_b": {"host"},
+        "tenant_c": {"port"},
+        "tenant_d": set(),
+        "tenant_e": set(),
+    }
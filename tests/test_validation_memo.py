@@ -0,0 +1,148 @@
+import json
+from typing import List, Tuple
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from confident import BaseConfig, ConfidentConfigDict
+from confident.validation_memo import ValidationMemo, is_immutable, validation_memo
+
+
+class Policy(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    ports: Tuple[int, ...]
+
+
+class MemoConfig(BaseConfig):
+    model_config = ConfidentConfigDict(validation_memo=True)
+
+    policy: Policy
+    hosts: Tuple[str, ...] = ()
+    tags: List[str] = []
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_memo():
+    validation_memo.clear()
+    yield
+    validation_memo.clear()
+
+
+@pytest.fixture
+def policy_file(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps({"policy": {"name": "default", "ports": [80, 443]}, "tags": ["a"]})
+    )
+    return path
+
+
+def test__validation_memo__reused_from_files(policy_file):
+    # Act
+    config_a = MemoConfig(_files=[policy_file])
+    config_b = MemoConfig(_files=[policy_file])
+
+    # Assert
+    assert config_a.policy == Policy(name="default", ports=(80, 443))
+    assert config_b.policy is config_a.policy
+    stats = validation_memo.stats()
+    assert stats.hits == 1
+    assert stats.size == 1
+    assert config_b.full_fields()["policy"].value == {
+        "name": "default",
+        "ports": [80, 443],
+    }
+
+
+def test__validation_memo__mutable_values_skipped(policy_file):
+    # Act
+    config_a = MemoConfig(_files=[policy_file])
+    config_b = MemoConfig(_files=[policy_file])
+
+    # Assert
+    assert config_a.tags == config_b.tags == ["a"]
+    assert config_b.tags is not config_a.tags
+    assert validation_memo.stats().skipped == 2
+
+
+def test__validation_memo__keyed_by_origin_string(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("HOSTS", '["a", "b"]')
+
+    # Act
+    config_a = MemoConfig(policy={"name": "a", "ports": []})
+    monkeypatch.setenv("HOSTS", '["a", "c"]')
+    config_b = MemoConfig(policy={"name": "a", "ports": []})
+    config_c = MemoConfig(policy={"name": "a", "ports": []})
+
+    # Assert
+    assert config_a.hosts == ("a", "b")
+    assert config_b.hosts == ("a", "c")
+    assert config_c.hosts == ("a", "c")
+    assert validation_memo.stats().hits == 1
+
+
+def test__validation_memo__init_values_not_memoized():
+    # Arrange
+    policy = {"name": "a", "ports": [1]}
+
+    # Act
+    config_a = MemoConfig(policy=policy)
+    policy["ports"].append(2)
+    config_b = MemoConfig(policy=policy)
+
+    # Assert
+    assert config_a.policy.ports == (1,)
+    assert config_b.policy.ports == (1, 2)
+    assert validation_memo.stats().size == 0
+
+
+def test__validation_memo__disabled_by_default(policy_file):
+    # Arrange
+    class PlainConfig(BaseConfig):
+        policy: Policy
+
+    # Act
+    config_a = PlainConfig(_files=[policy_file])
+    config_b = PlainConfig(_files=[policy_file])
+
+    # Assert
+    assert config_b.policy is not config_a.policy
+    assert validation_memo.stats() == (0, 0, 0, 0, validation_memo.max_size)
+
+
+def test__validation_memo__bounded():
+    # Arrange
+    memo = ValidationMemo(max_size=2)
+
+    # Act
+    for index in range(3):
+        memo.put((MemoConfig, "hosts", index), (str(index),))
+    found_oldest, _ = memo.get((MemoConfig, "hosts", 0))
+    found_newest, value = memo.get((MemoConfig, "hosts", 2))
+
+    # Assert
+    assert not found_oldest
+    assert found_newest and value == ("2",)
+    assert memo.stats().hits == 1
+    assert memo.stats().misses == 1
+    assert memo.stats().size == 2
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, True),
+        (("a", (1, 2.5)), True),
+        (frozenset({"a"}), True),
+        (Policy(name="a", ports=(1,)), True),
+        ([1], False),
+        (("a", [1]), False),
+        ({"a": 1}, False),
+    ],
+)
+def test__is_immutable(value, expected):
+    # Act & Assert
+    assert is_immutable(value) is expected